@@ -0,0 +1,102 @@
+"""Benchmark of the first click latency.
+
+The first open of the cell puts mines to the field and counts
+neighbour mines of every cell. The benchmark measures the whole first
+click and the counting implementations separately.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_first_click
+"""
+import time
+from typing import Callable
+
+import minesweeper_core.logic.counting as counting
+from minesweeper_core.constants.configurations import ADVANCED
+from minesweeper_core.data.field_configuration import Configuration
+from minesweeper_core.logic.adjacency import get_adjacency
+from minesweeper_core.logic.game_logic import GameLogic
+
+CONFIGURATIONS: dict[str, Configuration] = {
+    'ADVANCED': ADVANCED,
+    'CUSTOM 1000x1000': Configuration(number_of_rows=1000,
+                                      number_of_columns=1000,
+                                      number_of_mines=170_000),
+}
+
+
+def measure(action: Callable[[], object], repeats: int) -> float:
+    """Return the best time of the action in milliseconds.
+
+    Args:
+        action (Callable[[], object]): measured action.
+        repeats (int): number of measurements.
+
+    Returns:
+        float: the best time in milliseconds.
+    """
+    best: float = float('inf')
+    for _ in range(repeats):
+        start: float = time.perf_counter()
+        action()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def first_click(config: Configuration) -> None:
+    """Create game and open the cell in the center of the field.
+
+    Args:
+        config (Configuration): game configuration.
+    """
+    game: GameLogic = GameLogic(config, rng=1)
+    game.open_cell(config.number_of_rows // 2, config.number_of_columns // 2)
+
+
+def count_per_cell(mines: bytes, rows: int, columns: int) -> bytes:
+    """Count mines by summing neighbours of every cell one by one.
+
+    Args:
+        mines (bytes): row-major field of the mines.
+        rows (int): number of rows.
+        columns (int): number of columns.
+
+    Returns:
+        bytes: row-major number of mines around every cell.
+    """
+    adjacency = get_adjacency(rows, columns)
+    return bytes(sum(mines[neighbour]
+                     for neighbour in adjacency.neighbours_of(index))
+                 for index in range(rows * columns))
+
+
+def main() -> None:
+    """Run benchmark and print results."""
+    print(f'NumPy available: {counting.NUMPY_AVAILABLE}')
+    for name, config in CONFIGURATIONS.items():
+        rows: int = config.number_of_rows
+        columns: int = config.number_of_columns
+        repeats: int = 3 if rows * columns > 10_000 else 50
+        game: GameLogic = GameLogic(config, rng=1)
+        game.open_cell(rows // 2, columns // 2)
+        mines: bytes = bytes(game._board.mines)
+
+        get_adjacency.cache_clear()
+        cold: float = measure(lambda: first_click(config), 1)
+        warm: float = measure(lambda: first_click(config), repeats)
+        print(f'{name}: first click cold {cold:.2f} ms, '
+              f'warm {warm:.2f} ms')
+        implementations: dict[str, Callable[[bytes, int, int], bytes]] = {
+            'per cell': count_per_cell,
+            'python': counting.count_neighbour_mines_python,
+        }
+        if counting.NUMPY_AVAILABLE:
+            implementations['numpy'] = counting.count_neighbour_mines_numpy
+        for label, count in implementations.items():
+            elapsed: float = measure(lambda: count(mines, rows, columns),
+                                     1 if label == 'per cell' else repeats)
+            print(f'{name}: counting ({label}) {elapsed:.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
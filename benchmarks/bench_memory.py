@@ -0,0 +1,105 @@
+"""Memory report of the field representations per board size.
+
+Compares memory used by the field of cells kept as:
+
+- dict of dataclass cells with per-instance __dict__ (the original
+  representation of the field),
+- dict of slotted Cell objects,
+- Board byte columns with FieldView, that the game uses, before the
+  first change of the cells (columns are not allocated yet) and after
+  it.
+
+Memory is traced by tracemalloc. Run from the root of the repository:
+
+    python -m benchmarks.bench_memory
+"""
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable
+
+from minesweeper_core.constants.configurations import (ADVANCED, BEGINNER,
+                                                       INTERMEDIATE)
+from minesweeper_core.data.board import Board, FieldView
+from minesweeper_core.data.cell import Cell
+
+BOARD_SIZES: dict[str, tuple[int, int]] = {
+    'BEGINNER': (BEGINNER.number_of_rows, BEGINNER.number_of_columns),
+    'INTERMEDIATE': (INTERMEDIATE.number_of_rows,
+                     INTERMEDIATE.number_of_columns),
+    'ADVANCED': (ADVANCED.number_of_rows, ADVANCED.number_of_columns),
+    'CUSTOM 100x100': (100, 100),
+    'CUSTOM 500x500': (500, 500),
+}
+
+
+@dataclass(repr=True)
+class DictCell:
+    """Cell with per-instance __dict__, the original Cell layout."""
+
+    row: int
+    column: int
+    neighbour_mines: int = 0
+    is_open: bool = False
+    has_mine: bool = False
+    has_flag: bool = False
+
+
+def traced_size(build: Callable[[], object]) -> int:
+    """Return number of bytes allocated by the built object.
+
+    Args:
+        build (Callable[[], object]): function that builds the object.
+
+    Returns:
+        int: size of the allocated memory in bytes.
+    """
+    tracemalloc.start()
+    built: object = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del built
+    return size
+
+
+def allocated_view(rows: int, columns: int) -> FieldView:
+    """Build view of the board with allocated columns.
+
+    Args:
+        rows (int): number of rows.
+        columns (int): number of columns.
+
+    Returns:
+        FieldView: view of the board.
+    """
+    board: Board = Board(rows, columns)
+    board.allocate()
+    return FieldView(board)
+
+
+def main() -> None:
+    """Run report and print results."""
+    for name, (rows, columns) in BOARD_SIZES.items():
+        cells: int = rows * columns
+        representations: dict[str, Callable[[], object]] = {
+            'dict of Cell with __dict__': lambda: {
+                (row, column): DictCell(row, column)
+                for row in range(rows) for column in range(columns)},
+            'dict of slotted Cell': lambda: {
+                (row, column): Cell(row, column)
+                for row in range(rows) for column in range(columns)},
+            'Board and FieldView, not changed': lambda: FieldView(
+                Board(rows, columns)),
+            'Board and FieldView, allocated': lambda: allocated_view(
+                rows, columns),
+        }
+        baseline: int = 0
+        for label, build in representations.items():
+            size: int = traced_size(build)
+            baseline = baseline or size
+            print(f'{name}: {label} {size} bytes, '
+                  f'{size / cells:.1f} bytes per cell, '
+                  f'reduction {baseline / size:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""Benchmark of the game reset latency and allocations.
+
+Compares construction of the new GameLogic instance, that controller
+did on every reset, with the in-place reset of the existing instance
+on the built-in configurations. Allocations are traced by tracemalloc
+and are the blocks and bytes still allocated after the action.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_reset
+"""
+import time
+import tracemalloc
+from typing import Callable
+
+from minesweeper_core.constants.configurations import (ADVANCED, BEGINNER,
+                                                       INTERMEDIATE)
+from minesweeper_core.data.field_configuration import Configuration
+from minesweeper_core.logic.game_logic import GameLogic
+
+CONFIGURATIONS: dict[str, Configuration] = {
+    'BEGINNER': BEGINNER,
+    'INTERMEDIATE': INTERMEDIATE,
+    'ADVANCED': ADVANCED,
+}
+
+REPEATS: int = 1000
+
+
+def measure(action: Callable[[], object], repeats: int) -> float:
+    """Return the best time of the action in microseconds.
+
+    Args:
+        action (Callable[[], object]): measured action.
+        repeats (int): number of measurements.
+
+    Returns:
+        float: the best time in microseconds.
+    """
+    best: float = float('inf')
+    for _ in range(repeats):
+        start: float = time.perf_counter()
+        action()
+        best = min(best, time.perf_counter() - start)
+    return best * 1_000_000
+
+
+def trace_allocations(action: Callable[[], object]) -> tuple[int, int]:
+    """Return number of blocks and bytes allocated by the action.
+
+    Result of the action is kept alive until the snapshot is taken, so
+    the allocations of the created objects are counted.
+
+    Args:
+        action (Callable[[], object]): traced action.
+
+    Returns:
+        tuple[int, int]: number of blocks and their size in bytes.
+    """
+    tracemalloc.start()
+    before: tracemalloc.Snapshot = tracemalloc.take_snapshot()
+    result: object = action()
+    after: tracemalloc.Snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del result
+    statistics = after.compare_to(before, 'lineno')
+    blocks: int = sum(max(0, stat.count_diff) for stat in statistics)
+    size: int = sum(max(0, stat.size_diff) for stat in statistics)
+    return blocks, size
+
+
+def played_game(config: Configuration) -> GameLogic:
+    """Return game with the opened cell in the center of the field.
+
+    Args:
+        config (Configuration): game configuration.
+
+    Returns:
+        GameLogic: started game.
+    """
+    game: GameLogic = GameLogic(config, rng=1)
+    game.open_cell(config.number_of_rows // 2, config.number_of_columns // 2)
+    return game
+
+
+def main() -> None:
+    """Run benchmark and print results."""
+    for name, config in CONFIGURATIONS.items():
+        game: GameLogic = played_game(config)
+
+        def construct() -> GameLogic:
+            return GameLogic(config)
+
+        def reset() -> GameLogic:
+            game.reset()
+            return game
+
+        for label, action in (('new instance', construct),
+                              ('reset', reset)):
+            elapsed: float = measure(action, REPEATS)
+            blocks, size = trace_allocations(action)
+            print(f'{name}: {label} {elapsed:.1f} us, '
+                  f'{blocks} blocks, {size} bytes allocated')
+
+
+if __name__ == '__main__':
+    main()
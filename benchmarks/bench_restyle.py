@@ -0,0 +1,103 @@
+"""Micro-benchmark of the field buttons restyle cost.
+
+Builds a field of QFieldButtonCell buttons of the ADVANCED size and
+switches every button through all the visual states with:
+
+- per-call style string assembly and setStyleSheet on every button,
+- precomputed style strings and setStyleSheet on every button,
+- one field style sheet and the dynamic state property.
+
+Requires PyQt6. Run from the root of the repository:
+
+    python -m benchmarks.bench_restyle
+"""
+import os
+import time
+from typing import Callable
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt6.QtWidgets import QApplication, QGridLayout, QWidget  # noqa: E402
+
+from minesweeper_core.constants.configurations import ADVANCED  # noqa: E402
+from minesweeper_core.data.cell import Cell  # noqa: E402
+from minesweeper_ui.widgets.field.field_button import (  # noqa: E402
+    BUTTON_STATE_OPEN, FIELD_STYLE_SHEET, STATE_STYLES, QFieldButtonCell,
+    build_style_by_mines)
+
+RESTYLE_ROUNDS: int = 9
+
+
+def build_field() -> tuple[QWidget, list[QFieldButtonCell]]:
+    """Build and show the widget with buttons of the ADVANCED field.
+
+    Returns:
+        tuple[QWidget, list[QFieldButtonCell]]: field widget and buttons.
+    """
+    widget: QWidget = QWidget()
+    layout: QGridLayout = QGridLayout(widget)
+    layout.setSpacing(0)
+    buttons: list[QFieldButtonCell] = []
+    for row in range(ADVANCED.number_of_rows):
+        for column in range(ADVANCED.number_of_columns):
+            button: QFieldButtonCell = QFieldButtonCell(
+                Cell(row, column), print, print)
+            layout.addWidget(button, row, column)
+            buttons.append(button)
+    widget.resize(800, 800)
+    widget.show()
+    return widget, buttons
+
+
+def measure(app: QApplication,
+            buttons: list[QFieldButtonCell],
+            restyle: Callable[[QFieldButtonCell, int], None]) -> float:
+    """Return time of restyling all the buttons in milliseconds.
+
+    Args:
+        app (QApplication): application to process pending events.
+        buttons (list[QFieldButtonCell]): restyled buttons.
+        restyle (Callable[[QFieldButtonCell, int], None]): function
+            that applies style of the passed number of mines.
+
+    Returns:
+        float: average time of one restyle of the whole field.
+    """
+    start: float = time.perf_counter()
+    for number_of_mines in range(RESTYLE_ROUNDS):
+        for button in buttons:
+            restyle(button, number_of_mines)
+        app.processEvents()
+    return (time.perf_counter() - start) * 1000 / RESTYLE_ROUNDS
+
+
+def main() -> None:
+    """Run benchmark and print results."""
+    app: QApplication = QApplication([])
+    widget, buttons = build_field()
+    app.processEvents()
+
+    def assemble_style(button: QFieldButtonCell, mines: int) -> None:
+        button.setStyleSheet(build_style_by_mines(mines))
+
+    def table_style(button: QFieldButtonCell, mines: int) -> None:
+        button.setStyleSheet(STATE_STYLES[f'{BUTTON_STATE_OPEN}-{mines}'])
+
+    def property_style(button: QFieldButtonCell, mines: int) -> None:
+        button._apply_state_style(f'{BUTTON_STATE_OPEN}-{mines}')
+
+    print(f'buttons: {len(buttons)}')
+    widget.setStyleSheet('')
+    print(f'assembled style sheets: '
+          f'{measure(app, buttons, assemble_style):.2f} ms per field')
+    print(f'precomputed style sheets: '
+          f'{measure(app, buttons, table_style):.2f} ms per field')
+    for button in buttons:
+        button.setStyleSheet('')
+    widget.setStyleSheet(FIELD_STYLE_SHEET)
+    print(f'field style sheet and state property: '
+          f'{measure(app, buttons, property_style):.2f} ms per field')
+
+
+if __name__ == '__main__':
+    main()
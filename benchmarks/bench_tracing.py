@@ -0,0 +1,130 @@
+"""Benchmark of the tracing overhead of the game actions.
+
+Engines resolve the trace when the game starts, it is None when DEBUG
+is disabled. The benchmark compares it with the calls of the debug
+method of the logger that has DEBUG disabled (as the engines did on
+every call before) and with the enabled tracing to the logger without
+output, on the first click that floods the whole field and on the
+playthrough of the game.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_tracing
+"""
+import logging
+import time
+from collections.abc import Callable
+
+from minesweeper_core.constants.configurations import ADVANCED
+from minesweeper_core.data.field_configuration import Configuration
+from minesweeper_core.logic.base_logic import BaseGameLogic
+from minesweeper_core.logic.engines import (ENGINE_ARRAY, ENGINE_BITBOARD,
+                                            ENGINE_REFERENCE, get_engine)
+from minesweeper_core.logic.tracing import Trace
+
+FLOOD_CONFIGURATION: Configuration = Configuration(
+    number_of_rows=300, number_of_columns=300, number_of_mines=1)
+ENGINES: tuple[str, ...] = (ENGINE_REFERENCE, ENGINE_ARRAY, ENGINE_BITBOARD)
+REPEATS: int = 10
+CALLS: int = 1_000_000
+
+
+def create_logger(name: str, level: int) -> logging.Logger:
+    """Create logger without output.
+
+    Args:
+        name (str): name of the logger.
+        level (int): level of the logger.
+
+    Returns:
+        logging.Logger: logger.
+    """
+    logger: logging.Logger = logging.getLogger(f'benchmarks.tracing.{name}')
+    logger.setLevel(level)
+    logger.propagate = False
+    logger.addHandler(logging.NullHandler())
+    return logger
+
+
+TRACES: dict[str, Trace | None] = {
+    'resolved to None': None,
+    'disabled log.debug': create_logger('disabled', logging.INFO).debug,
+    'enabled': create_logger('enabled', logging.DEBUG).debug,
+}
+
+
+def measure(setup: Callable[[], BaseGameLogic],
+            action: Callable[[BaseGameLogic], object]) -> float:
+    """Return the best time of the action in milliseconds.
+
+    Args:
+        setup (Callable[[], BaseGameLogic]): not measured creation of game.
+        action (Callable[[BaseGameLogic], object]): measured action.
+
+    Returns:
+        float: the best time in milliseconds.
+    """
+    best: float = float('inf')
+    for _ in range(REPEATS):
+        game: BaseGameLogic = setup()
+        start: float = time.perf_counter()
+        action(game)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def measure_calls(trace: Trace | None) -> float:
+    """Return time of the guarded trace call in nanoseconds per call.
+
+    Args:
+        trace (Trace | None): measured trace.
+
+    Returns:
+        float: time per call in nanoseconds.
+    """
+    start: float = time.perf_counter()
+    for index in range(CALLS):
+        if trace is not None:
+            trace('alone cell, open neighbours: %s', index)
+    return (time.perf_counter() - start) / CALLS * 1_000_000_000
+
+
+def play_through(game: BaseGameLogic) -> None:
+    """Open all the cells without mines one by one.
+
+    Args:
+        game (BaseGameLogic): game after the first click.
+    """
+    field = game.field
+    for coordinate, cell in list(field.items()):
+        if not cell.has_mine and not field[coordinate].is_open:
+            game.open_cell(*coordinate)
+
+
+def main() -> None:
+    """Run benchmark and print results."""
+    for label, trace in TRACES.items():
+        print(f'trace {label:<18}: {measure_calls(trace):6.1f} ns per call')
+    for engine_name in ENGINES:
+        engine: type[BaseGameLogic] = get_engine(engine_name)
+        for label, trace in TRACES.items():
+            def new_game(config: Configuration) -> BaseGameLogic:
+                game: BaseGameLogic = engine(config, rng=1)
+                game._trace = trace
+                return game
+
+            def started_game() -> BaseGameLogic:
+                game: BaseGameLogic = new_game(ADVANCED)
+                game.open_cell(0, 0)
+                return game
+
+            flood: float = measure(lambda: new_game(FLOOD_CONFIGURATION),
+                                   lambda game: game.open_cell(150, 150))
+            playthrough: float = measure(started_game, play_through)
+            print(f'{engine_name:<10} trace {label:<18}: '
+                  f'flood 300x300 {flood:8.2f} ms, '
+                  f'ADVANCED playthrough {playthrough:8.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,443 @@
+"""Benchmark suite of the core game operations.
+
+Measures creation of the game, the first click (mine placement and
+counting), the big flood-fill open, flagging and the whole playthrough
+of the game on the built-in and custom field sizes. Results are printed
+as the table, could be written to the JSON file and are compared with
+the baseline file, the operations that became slower than the baseline
+by more than the threshold are reported as regressions and make the
+suite exit with the non-zero status.
+
+Every action is timed by batches long enough to be far above the
+noise of the timer, and the median time of the batches is compared
+with the baseline.
+
+Timings depend on the machine, so baseline.json is valid only for the
+machine that recorded it. Record it again by --save-baseline on every
+machine (and after changes of the suite) before comparing with it.
+
+Run from the root of the repository:
+
+    python -m benchmarks.suite --save-baseline
+    python -m benchmarks.suite --engine array --engine bitboard \\
+        --size 2000x2000 --output results.json --threshold 0.1
+"""
+import argparse
+import gc
+import json
+import logging
+import pathlib
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from minesweeper_core.constants.configurations import (ADVANCED, BEGINNER,
+                                                       INTERMEDIATE)
+from minesweeper_core.data.field_configuration import Configuration
+from minesweeper_core.logic.base_logic import BaseGameLogic
+from minesweeper_core.logic.engines import (DEFAULT_ENGINE,
+                                            available_engines, get_engine)
+
+BASELINE_PATH: pathlib.Path = pathlib.Path(__file__).with_name(
+    'baseline.json')
+RESULTS_VERSION: int = 2
+
+BUILT_IN_CONFIGURATIONS: dict[str, Configuration] = {
+    'BEGINNER': BEGINNER,
+    'INTERMEDIATE': INTERMEDIATE,
+    'ADVANCED': ADVANCED,
+}
+DEFAULT_CUSTOM_SIZES: tuple[str, ...] = ('100x100', '500x500')
+MAX_SIDE: int = 2000
+
+# Part of the cells with mines on the custom fields (as on ADVANCED)
+# and on the fields of the flood-fill benchmark.
+MINE_DENSITY: float = ADVANCED.number_of_mines / (
+    ADVANCED.number_of_rows * ADVANCED.number_of_columns)
+FLOOD_MINE_DENSITY: float = 0.001
+
+# Bigger games are not played through, it would take minutes.
+MAX_PLAYTHROUGH_CELLS: int = 40_000
+
+# Actions are timed by batches that take at least MIN_BATCH_TIME, so
+# the time of the batch is far above the resolution and the jitter of
+# the timer even for the actions of microseconds. Batches are repeated
+# until the time budget is spent, but at least MIN_BATCHES times.
+MIN_BATCH_TIME: float = 0.1
+MIN_BATCHES: int = 9
+MAX_BATCHES: int = 50
+MAX_BATCH_SIZE: int = 100_000
+TIME_BUDGET: float = 1.5
+# Objects prepared for the batch keep at most this number of cells.
+MAX_BATCH_CELLS: int = 4_000_000
+SEED: int = 1
+
+# Name, setup and action of the benchmarked operation and True if the
+# action leaves the prepared object as it was.
+Operation = tuple[str, Callable[[], Any], Callable[[Any], object], bool]
+
+DEFAULT_THRESHOLD: float = 0.2
+
+
+@dataclass(frozen=True)
+class Result:
+    """Timings of the operation.
+
+    Times are per action, the best and the median of the batches of
+    batch_size actions, repeats is the number of all the timed actions.
+    """
+
+    engine: str
+    configuration: str
+    operation: str
+    best_ms: float
+    median_ms: float
+    repeats: int
+    batch_size: int
+
+    @property
+    def key(self) -> str:
+        """Return key of the result used to find it in the baseline.
+
+        Returns:
+            str: key as engine/configuration/operation.
+        """
+        return f'{self.engine}/{self.configuration}/{self.operation}'
+
+
+def parse_size(size: str) -> Configuration:
+    """Create configuration of the custom field from its size.
+
+    Args:
+        size (str): size as ROWSxCOLUMNS, for example 100x100.
+
+    Raises:
+        argparse.ArgumentTypeError: if the size is incorrect.
+
+    Returns:
+        Configuration: configuration with MINE_DENSITY of mines.
+    """
+    try:
+        rows, columns = (int(side) for side in size.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'incorrect size: {size}')
+    if not (1 <= rows <= MAX_SIDE and 1 <= columns <= MAX_SIDE):
+        raise argparse.ArgumentTypeError(
+            f'sides should be from 1 to {MAX_SIDE}: {size}')
+    cells: int = rows * columns
+    return Configuration(number_of_rows=rows, number_of_columns=columns,
+                         number_of_mines=max(1, int(cells * MINE_DENSITY)))
+
+
+def time_batch(setup: Callable[[], Any], action: Callable[[Any], object],
+               size: int, reusable: bool) -> float:
+    """Return time of the batch of the actions in seconds.
+
+    Args:
+        setup (Callable[[], Any]): not measured preparation, its result
+            is passed to the action.
+        action (Callable[[Any], object]): measured action.
+        size (int): number of the actions in the batch.
+        reusable (bool): True if the action leaves the prepared object
+            as it was, then one object is prepared for the whole batch.
+
+    Returns:
+        float: time of the batch.
+    """
+    prepared: list[Any] = ([setup()] * size if reusable
+                           else [setup() for _ in range(size)])
+    # collections of the garbage are not timed, as timeit does
+    is_gc_enabled: bool = gc.isenabled()
+    gc.disable()
+    try:
+        start: float = time.perf_counter()
+        for argument in prepared:
+            action(argument)
+        return time.perf_counter() - start
+    finally:
+        if is_gc_enabled:
+            gc.enable()
+
+
+def measure(setup: Callable[[], Any], action: Callable[[Any], object],
+            reusable: bool, cells: int) -> tuple[float, float, int, int]:
+    """Measure the action by the batches until the time budget is spent.
+
+    Size of the batch is doubled until the batch takes MIN_BATCH_TIME,
+    batches of the actions that are not reusable are limited by
+    MAX_BATCH_CELLS of the prepared objects.
+
+    Args:
+        setup (Callable[[], Any]): not measured preparation, its result
+            is passed to the action.
+        action (Callable[[Any], object]): measured action.
+        reusable (bool): True if the action leaves the prepared object
+            as it was.
+        cells (int): number of cells of the prepared object.
+
+    Returns:
+        tuple[float, float, int, int]: the best and the median time of
+            the action in milliseconds, the number of the actions and
+            the size of the batch.
+    """
+    max_size: int = MAX_BATCH_SIZE if reusable else max(
+        1, min(MAX_BATCH_SIZE, MAX_BATCH_CELLS // cells))
+    size: int = 1
+    elapsed: float = time_batch(setup, action, size, reusable)
+    while elapsed < MIN_BATCH_TIME and size < max_size:
+        size = min(max_size, size * 2)
+        elapsed = time_batch(setup, action, size, reusable)
+    # the batches of the calibration warm the caches up and are dropped
+    timings: list[float] = []
+    spent: float = 0
+    while len(timings) < MIN_BATCHES or (spent < TIME_BUDGET
+                                         and len(timings) < MAX_BATCHES):
+        elapsed = time_batch(setup, action, size, reusable)
+        timings.append(elapsed / size * 1000)
+        spent += elapsed
+    return (min(timings), statistics.median(timings), len(timings) * size,
+            size)
+
+
+def center_of(config: Configuration) -> tuple[int, int]:
+    """Return coordinate of the cell in the center of the field.
+
+    Args:
+        config (Configuration): configuration of the field.
+
+    Returns:
+        tuple[int, int]: coordinate as tuple[row, column].
+    """
+    return config.number_of_rows // 2, config.number_of_columns // 2
+
+
+def play_through(engine: type[BaseGameLogic], config: Configuration) -> None:
+    """Play the game until the win by opening all the cells without mines.
+
+    Args:
+        engine (type[BaseGameLogic]): engine of the game.
+        config (Configuration): configuration of the game.
+    """
+    game: BaseGameLogic = engine(config, rng=SEED)
+    game.open_cell(*center_of(config))
+    safe: list[tuple[int, int]] = [
+        coordinate for coordinate, cell in game.field.items()
+        if not cell.is_open and not cell.has_mine]
+    field = game.field
+    for coordinate in safe:
+        if not field[coordinate].is_open:
+            game.open_cell(*coordinate)
+    assert game.is_player_win
+
+
+def operations(engine: type[BaseGameLogic],
+               config: Configuration) -> Iterator[Operation]:
+    """Return benchmarked operations of the engine on the field.
+
+    Args:
+        engine (type[BaseGameLogic]): engine of the game.
+        config (Configuration): configuration of the field.
+
+    Yields:
+        Operation: name, setup and action of the operation and True if
+            the action could be repeated on the same prepared object.
+    """
+    cells: int = config.number_of_rows * config.number_of_columns
+    center: tuple[int, int] = center_of(config)
+
+    def new_game() -> BaseGameLogic:
+        return engine(config, rng=SEED)
+
+    def started_game() -> tuple[BaseGameLogic, tuple[int, int]]:
+        game: BaseGameLogic = new_game()
+        game.open_cell(*center)
+        closed: tuple[int, int] = next(
+            (coordinate for coordinate, cell in game.field.items()
+             if not cell.is_open), center)
+        return game, closed
+
+    def flag_twice(prepared: tuple[BaseGameLogic, tuple[int, int]]) -> None:
+        game, coordinate = prepared
+        game.flag_cell(*coordinate)
+        game.flag_cell(*coordinate)
+
+    flood_config: Configuration = Configuration(
+        number_of_rows=config.number_of_rows,
+        number_of_columns=config.number_of_columns,
+        number_of_mines=max(1, int(cells * FLOOD_MINE_DENSITY)))
+
+    yield 'init', lambda: None, lambda _: new_game(), True
+    yield ('first_click', new_game, lambda game: game.open_cell(*center),
+           False)
+    # the cell is flagged and unflagged, so the game is left as it was
+    yield 'flag_cell', started_game, flag_twice, True
+    # the first click on the sparse field opens most of it by one region
+    yield ('flood_fill', lambda: engine(flood_config, rng=SEED),
+           lambda game: game.open_cell(*center), False)
+    if cells <= MAX_PLAYTHROUGH_CELLS:
+        yield ('playthrough', lambda: None,
+               lambda _: play_through(engine, config), True)
+
+
+def run(engine_names: list[str],
+        configurations: dict[str, Configuration]) -> list[Result]:
+    """Run the benchmarks and print their results.
+
+    Args:
+        engine_names (list[str]): names of the engines.
+        configurations (dict[str, Configuration]): fields by their names.
+
+    Returns:
+        list[Result]: results of the benchmarks.
+    """
+    results: list[Result] = []
+    for engine_name in engine_names:
+        engine: type[BaseGameLogic] = get_engine(engine_name)
+        for name, config in configurations.items():
+            cells: int = config.number_of_rows * config.number_of_columns
+            for operation, setup, action, reusable in operations(engine,
+                                                                 config):
+                best, median, repeats, batch_size = measure(
+                    setup, action, reusable, cells)
+                result = Result(engine_name, name, operation,
+                                round(best, 6), round(median, 6), repeats,
+                                batch_size)
+                results.append(result)
+                print(f'{result.key:<45} best {best:10.4f} ms, '
+                      f'median {median:10.4f} ms, {repeats} runs by '
+                      f'{batch_size}')
+    return results
+
+
+def load_results(path: pathlib.Path) -> tuple[str, dict[str, Result]]:
+    """Load results from the JSON file.
+
+    Args:
+        path (pathlib.Path): path to the file.
+
+    Raises:
+        ValueError: if the results are saved by other version of the
+            suite, they are measured differently.
+
+    Returns:
+        tuple[str, dict[str, Result]]: machine that made the results
+            and the results by their keys.
+    """
+    data: dict = json.loads(path.read_text(encoding='utf-8'))
+    if data.get('version') != RESULTS_VERSION:
+        raise ValueError(f'{path} has version {data.get("version")} of '
+                         f'the results, expected {RESULTS_VERSION}')
+    results = (Result(**result) for result in data['results'])
+    return data['machine'], {result.key: result for result in results}
+
+
+def save_results(path: pathlib.Path, results: list[Result]) -> None:
+    """Save results with the information about the machine to JSON file.
+
+    Args:
+        path (pathlib.Path): path to the file.
+        results (list[Result]): results of the benchmarks.
+    """
+    data: dict = {
+        'version': RESULTS_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': platform.python_version(),
+        'machine': platform.platform(),
+        'results': [asdict(result) for result in results],
+    }
+    path.write_text(json.dumps(data, indent=2) + '\n', encoding='utf-8')
+
+
+def find_regressions(results: list[Result], baseline: dict[str, Result],
+                     threshold: float) -> list[tuple[Result, float]]:
+    """Find operations that became slower than the baseline.
+
+    The median times of the batches are compared, the best time jumps
+    by the short periods when the machine is faster than usually.
+
+    Args:
+        results (list[Result]): results of the benchmarks.
+        baseline (dict[str, Result]): baseline results by their keys.
+        threshold (float): allowed slowdown, 0.2 allows 20% slower.
+
+    Returns:
+        list[tuple[Result, float]]: slower results and their ratios to
+            the baseline time.
+    """
+    regressions: list[tuple[Result, float]] = []
+    for result in results:
+        expected: Result | None = baseline.get(result.key)
+        if expected is None or expected.median_ms <= 0:
+            continue
+        ratio: float = result.median_ms / expected.median_ms
+        if ratio > 1 + threshold:
+            regressions.append((result, ratio))
+    return regressions
+
+
+def main() -> None:
+    """Parse arguments, run the suite and compare it with the baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--engine', action='append', dest='engines',
+                        choices=available_engines(),
+                        help=f'benchmarked engine, {DEFAULT_ENGINE} by '
+                             f'default')
+    parser.add_argument('--size', action='append', dest='sizes',
+                        type=parse_size,
+                        help='custom field size as ROWSxCOLUMNS, '
+                             f'{", ".join(DEFAULT_CUSTOM_SIZES)} by default')
+    parser.add_argument('--output', type=pathlib.Path,
+                        help='write results to the JSON file')
+    parser.add_argument('--baseline', type=pathlib.Path,
+                        default=BASELINE_PATH,
+                        help='results of the same machine to compare with')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='write results to the baseline file, it should '
+                             'be done on every machine that compares')
+    parser.add_argument('--threshold', type=float,
+                        default=DEFAULT_THRESHOLD,
+                        help='allowed slowdown, 0.2 allows 20%% slower')
+    arguments = parser.parse_args()
+    # warnings of the played games are not interesting here
+    logging.disable(logging.WARNING)
+
+    configurations: dict[str, Configuration] = dict(BUILT_IN_CONFIGURATIONS)
+    sizes: list[Configuration] = arguments.sizes or [
+        parse_size(size) for size in DEFAULT_CUSTOM_SIZES]
+    for config in sizes:
+        name: str = f'{config.number_of_rows}x{config.number_of_columns}'
+        configurations[name] = config
+    results: list[Result] = run(arguments.engines or [DEFAULT_ENGINE],
+                                configurations)
+
+    if arguments.output:
+        save_results(arguments.output, results)
+    if arguments.save_baseline:
+        save_results(arguments.baseline, results)
+        print(f'baseline saved to {arguments.baseline}')
+        return
+    if not arguments.baseline.exists():
+        print(f'baseline {arguments.baseline} not found')
+        return
+    try:
+        machine, baseline = load_results(arguments.baseline)
+    except ValueError as error:
+        print(f'{error}, save the baseline again by --save-baseline')
+        return
+    if machine != platform.platform():
+        print(f'baseline is saved on {machine}, timings of other machines '
+              f'are not comparable')
+    regressions = find_regressions(results, baseline, arguments.threshold)
+    for result, ratio in regressions:
+        print(f'REGRESSION {result.key}: {ratio:.2f}x of the baseline')
+    if regressions:
+        sys.exit(1)
+    print(f'no regressions over {arguments.threshold:.0%} of the baseline')
+
+
+if __name__ == '__main__':
+    main()
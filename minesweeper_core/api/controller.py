@@ -1,12 +1,19 @@
 """Module contains Game Controller class."""
 import logging
+import os
 from typing import Callable
 
 from minesweeper_core.api.dtos import GameInformation
 from minesweeper_core.api.markers import ControllerActions
 from minesweeper_core.constants.configurations import BEGINNER
+from minesweeper_core.data.change_set import ChangeSet
 from minesweeper_core.data.field_configuration import Configuration
-from minesweeper_core.logic.game_logic import GameLogic
+from minesweeper_core.data.game_status import GameStatus
+from minesweeper_core.logic.base_logic import BaseGameLogic
+from minesweeper_core.logic.engines import get_engine, get_engine_name
+from minesweeper_core.logic.history import (DEFAULT_MAX_CELLS,
+                                            DEFAULT_MAX_ENTRIES, GameHistory,
+                                            HistoryEntry)
 
 log: logging.Logger = logging.getLogger(__name__)
 
@@ -18,35 +25,79 @@ class MinesweeperController:
 
     def __init__(
             self,
-            on_game_status_update_callback: StatusUpdateCallback = None):
+            on_game_status_update_callback: StatusUpdateCallback = None,
+            engine: str | None = None,
+            max_history_entries: int = DEFAULT_MAX_ENTRIES,
+            max_history_cells: int = DEFAULT_MAX_CELLS):
         """Initialize controller with default values.
 
         Args:
             on_game_status_update_callback (StatusUpdateCallback, optional):
                 CallBack function that will be called on the updates of
                 game state.               Defaults to None.
+            engine (str | None, optional): name of the game engine from
+                the engines registry. Defaults to the engine from the
+                MINESWEEPER_ENGINE environment variable or to the
+                default one.
+            max_history_entries (int, optional): number of the actions
+                that could be undone. Defaults to DEFAULT_MAX_ENTRIES.
+            max_history_cells (int, optional): number of the changed
+                cells kept over all the actions that could be undone.
+                Defaults to DEFAULT_MAX_CELLS.
+
+        Raises:
+            UnknownEngineException: raised if the engine is unknown.
         """
         log.debug('Init controller')
-        self._game_instance: GameLogic | None = None
+        self._engine_name: str = get_engine_name(engine)
+        self._engine: type[BaseGameLogic] = get_engine(self._engine_name)
+        self._game_instance: BaseGameLogic | None = None
         self._last_config: Configuration = BEGINNER
+        self._history: GameHistory = GameHistory(max_history_entries,
+                                                 max_history_cells)
         self._on_game_status_update_callback = on_game_status_update_callback
         log.debug('Init controller, game_instance: %s, config: %s',
                   self._game_instance,
                   self._last_config)
 
+    @property
+    def engine_name(self) -> str:
+        """Return name of the game engine used by the controller.
+
+        Returns:
+            str: name of the engine.
+        """
+        return self._engine_name
+
+    def _create_game(self, config: Configuration) -> BaseGameLogic:
+        """Create game of the chosen engine.
+
+        Args:
+            config (Configuration): game configuration.
+
+        Returns:
+            BaseGameLogic: new game.
+        """
+        return self._engine(config)
+
     def start_new_game(self, config: Configuration) -> None:
         """Start new game session.
 
         Creates a new instance of the GameLogic with new Configuration
-        of the Game.
+        of the Game. If the configuration is not changed, the current
+        instance is reset in place.
 
         Args:
             config (Configuration): Game Configuration with information
                 about number of rows, columns, mines.
         """
         log.debug('start_new_game, with config: %s', config)
+        if self._game_instance is not None and config == self._last_config:
+            self._game_instance.reset()
+        else:
+            self._game_instance = self._create_game(config)
         self._last_config = config
-        self._game_instance = GameLogic(self._last_config)
+        self._history.clear()
         if self._on_game_status_update_callback:
             self._on_game_status_update_callback(
                 self.get_game_info(ControllerActions.NEW_GAME))
@@ -55,15 +106,83 @@ class MinesweeperController:
         """Reset game state.
 
         Cleanups game state and returns game state to the initial
-        values.
+        values. The current GameLogic instance is reused.
         """
         log.debug('reset_game, with config: %s', self._last_config)
-        self._game_instance = GameLogic(self._last_config)
+        if self._game_instance is not None:
+            self._game_instance.reset()
+        else:
+            self._game_instance = self._create_game(self._last_config)
+        self._history.clear()
         if self._on_game_status_update_callback:
             self._on_game_status_update_callback(
                 self.get_game_info(ControllerActions.RESET_GAME))
 
-    def open_cell(self, row: int, column: int) -> None:
+    def dumps(self) -> bytes | None:
+        """Return the current game in the binary format of the saved game.
+
+        Returns:
+            bytes | None: saved game, or None if no game is started.
+        """
+        log.debug('dumps')
+        if self._game_instance is None:
+            return None
+        return self._game_instance.dumps()
+
+    def loads(self, data: bytes | bytearray | memoryview) -> None:
+        """Replace the current game by the saved one.
+
+        Args:
+            data (bytes | bytearray | memoryview): saved game.
+
+        Raises:
+            IncorrectSaveException: raised if the data is not the saved
+                game.
+        """
+        log.debug('loads')
+        self._set_loaded_game(self._engine.loads(data))
+
+    def save(self, path: str | os.PathLike) -> None:
+        """Write the current game to the file.
+
+        Nothing is written if no game is started.
+
+        Args:
+            path (str | os.PathLike): path of the file.
+        """
+        log.debug('save, path: %s', path)
+        if self._game_instance is not None:
+            self._game_instance.save(path)
+
+    def load(self, path: str | os.PathLike) -> None:
+        """Replace the current game by the one from the memory-mapped file.
+
+        Args:
+            path (str | os.PathLike): path of the file.
+
+        Raises:
+            IncorrectSaveException: raised if the file is not the saved
+                game.
+        """
+        log.debug('load, path: %s', path)
+        self._set_loaded_game(self._engine.load(path))
+
+    def _set_loaded_game(self, game: BaseGameLogic) -> None:
+        """Make the loaded game current and notify about it.
+
+        Args:
+            game (BaseGameLogic): loaded game.
+        """
+        self._game_instance = game
+        self._history.clear()
+        self._last_config = Configuration(
+            number_of_rows=game.rows, number_of_columns=game.columns,
+            number_of_mines=game.number_of_mines)
+        if self._on_game_status_update_callback:
+            self._on_game_status_update_callback(
+                self.get_game_info(ControllerActions.GAME_LOADED))
+
+    def open_cell(self, row: int, column: int) -> ChangeSet:
         """Open game field cell.
 
         Opens field cell and send notification about result of this
@@ -72,15 +191,22 @@ class MinesweeperController:
         Args:
             row (int): number of the cell row.
             column (int): number of the cell column.
+
+        Returns:
+            ChangeSet: cells changed by the open action.
         """
         log.debug('open_cell, with row: %d, col: %d', row, column)
-        if self._game_instance:
-            self._game_instance.open_cell(row, column)
+        changed_cells: ChangeSet = ChangeSet()
+        game: BaseGameLogic | None = self._game_instance
+        if game:
+            changed_cells = self._run_action(game, game.open_cell, row, column)
         if self._on_game_status_update_callback:
             self._on_game_status_update_callback(
-                self.get_game_info(ControllerActions.CELL_OPENED))
+                self.get_game_info(ControllerActions.CELL_OPENED,
+                                   changed_cells))
+        return changed_cells
 
-    def flag_cell(self, row: int, column: int) -> None:
+    def flag_cell(self, row: int, column: int) -> ChangeSet:
         """Put a flag to the cell.
 
         Puts flag to the field cell if the cell is not open and
@@ -89,16 +215,100 @@ class MinesweeperController:
         Args:
             row (int): number of the cell row.
             column (int): number of the cell column.
+
+        Returns:
+            ChangeSet: cells changed by the flag action.
         """
         log.debug('flag_cell, with row: %d, col: %d', row, column)
-        if self._game_instance:
-            self._game_instance.flag_cell(row, column)
+        changed_cells: ChangeSet = ChangeSet()
+        game: BaseGameLogic | None = self._game_instance
+        if game:
+            changed_cells = self._run_action(game, game.flag_cell, row, column)
         if self._on_game_status_update_callback:
             self._on_game_status_update_callback(
-                self.get_game_info(ControllerActions.CELL_FLAGGED))
+                self.get_game_info(ControllerActions.CELL_FLAGGED,
+                                   changed_cells))
+        return changed_cells
+
+    @property
+    def can_undo(self) -> bool:
+        """Return True if there is an action to undo.
+
+        Returns:
+            bool: undo availability.
+        """
+        return self._history.can_undo
+
+    @property
+    def can_redo(self) -> bool:
+        """Return True if there is an undone action to redo.
+
+        Returns:
+            bool: redo availability.
+        """
+        return self._history.can_redo
+
+    def undo(self) -> ChangeSet:
+        """Return the cells changed by the last action to their states.
+
+        The first open of the game puts mines, so it is not undone.
+
+        Returns:
+            ChangeSet: cells changed by the undo.
+        """
+        log.debug('undo')
+        changed_cells: ChangeSet = ChangeSet()
+        entry: HistoryEntry | None = self._history.undo()
+        if self._game_instance and entry is not None:
+            changed_cells = self._game_instance.restore_cells(
+                entry.indexes, entry.old_states, entry.old_status)
+        if self._on_game_status_update_callback:
+            self._on_game_status_update_callback(
+                self.get_game_info(ControllerActions.UNDO, changed_cells))
+        return changed_cells
+
+    def redo(self) -> ChangeSet:
+        """Repeat the last undone action.
+
+        Returns:
+            ChangeSet: cells changed by the redo.
+        """
+        log.debug('redo')
+        changed_cells: ChangeSet = ChangeSet()
+        entry: HistoryEntry | None = self._history.redo()
+        if self._game_instance and entry is not None:
+            changed_cells = self._game_instance.restore_cells(
+                entry.indexes, entry.new_states, entry.new_status)
+        if self._on_game_status_update_callback:
+            self._on_game_status_update_callback(
+                self.get_game_info(ControllerActions.REDO, changed_cells))
+        return changed_cells
+
+    def _run_action(self, game: BaseGameLogic,
+                    action: Callable[[int, int], ChangeSet],
+                    row: int, column: int) -> ChangeSet:
+        """Run the action of the game and add it to the history.
+
+        Args:
+            game (BaseGameLogic): the current game.
+            action (Callable[[int, int], ChangeSet]): open or flag
+                action of the game.
+            row (int): number of the cell row.
+            column (int): number of the cell column.
+
+        Returns:
+            ChangeSet: cells changed by the action.
+        """
+        is_game_started: bool = game.is_game_started
+        old_status: GameStatus = game.status
+        changed_cells: ChangeSet = action(row, column)
+        if is_game_started:
+            self._history.record(changed_cells, old_status, game.status)
+        return changed_cells
 
     def get_game_info(self,
-                      marker: ControllerActions | None = None
+                      marker: ControllerActions | None = None,
+                      changed_cells: ChangeSet | None = None
                       ) -> GameInformation | None:
         """Return game information.
 
@@ -111,6 +321,9 @@ class MinesweeperController:
                 For example all the callbacks put information in which
                 method was created game info (new game, reset, etc).
                 Defaults to None.
+            changed_cells (ChangeSet | None, optional): cells changed
+                by the action. None means that any cell could be
+                changed. Defaults to None.
 
         Returns:
             GameInformation | None: Object with game state information.
@@ -125,7 +338,8 @@ class MinesweeperController:
                 game_field=self._game_instance.field,
                 is_finished=self._game_instance.is_game_finished,
                 is_player_win=self._game_instance.is_player_win,
-                controller_action=marker
+                controller_action=marker,
+                changed_cells=changed_cells
             )
             log.debug('get_game_info, info: %s', info)
             return info
@@ -1,8 +1,10 @@
 """Module contains GameInformation class."""
+from collections.abc import Mapping
 from dataclasses import dataclass
 
 from minesweeper_core.api.markers import ControllerActions
-from minesweeper_core.data.cell import Cell
+from minesweeper_core.data.cell import FieldCell
+from minesweeper_core.data.change_set import ChangeSet
 
 
 @dataclass(repr=True, frozen=True)
@@ -13,7 +15,9 @@ class GameInformation:
     number_of_columns: int
     number_of_mines: int
     number_of_flags_left: int
-    game_field: dict[tuple[int, int], Cell]
+    game_field: Mapping[tuple[int, int], FieldCell]
     is_finished: bool
     is_player_win: bool
     controller_action: ControllerActions
+    # Cells changed by the action, None if any cell could be changed.
+    changed_cells: ChangeSet | None = None
@@ -13,3 +13,6 @@ class ControllerActions(enum.Enum):
     RESET_GAME = 1
     CELL_FLAGGED = 2
     CELL_OPENED = 3
+    GAME_LOADED = 4
+    UNDO = 5
+    REDO = 6
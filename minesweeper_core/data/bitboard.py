@@ -0,0 +1,374 @@
+"""Module contains Bitboard class and view of the bitboard cell.
+
+Bitboard keeps state of the field as Python integers used as bit masks,
+where the bit number (row * columns + column) belongs to the cell.
+"""
+from collections.abc import Iterable, Sequence
+
+from minesweeper_core.data.board import (FLAG_BIT, MINE_BIT,
+                                         NEIGHBOUR_MINES_MASK, OPEN_BIT,
+                                         CellView, bit_table)
+
+# Number of the bit planes that keep numbers of mines around the cells.
+NEIGHBOUR_MINES_PLANES: int = 4
+
+# Change sets with fewer cells are packed by reading the separate bits,
+# the bigger ones are packed from the whole field.
+MAX_BITWISE_PACKED_CELLS: int = 64
+
+# Translation tables between bytes 0/1 and ASCII digits '0'/'1'.
+_BYTES_TO_DIGITS: bytes = bytes.maketrans(b'\x00\x01', b'01')
+_DIGITS_TO_BYTES: bytes = bytes.maketrans(b'01', b'\x00\x01')
+
+
+def bits_from_bytes(column: bytes | bytearray) -> int:
+    """Convert one byte per cell column to the bit mask.
+
+    Args:
+        column (bytes | bytearray): column with 0 or 1 per cell.
+
+    Returns:
+        int: mask with the bit set for every cell with 1.
+    """
+    if not column:
+        return 0
+    return int(column.translate(_BYTES_TO_DIGITS)[::-1], 2)
+
+
+def bytes_from_bits(mask: int, size: int) -> bytes:
+    """Convert bit mask to the column with one byte per cell.
+
+    Args:
+        mask (int): bit mask, bits above the size should be clear.
+        size (int): number of cells.
+
+    Returns:
+        bytes: column with 0 or 1 per cell.
+    """
+    if not size:
+        return b''
+    digits: bytes = format(mask, f'0{size}b').encode('ascii')
+    return digits[::-1].translate(_DIGITS_TO_BYTES)
+
+
+def set_bit(mask: int, index: int, value: bool) -> int:
+    """Return the mask with the bit set to the value.
+
+    Args:
+        mask (int): bit mask.
+        index (int): bit number.
+        value (bool): new value of the bit.
+
+    Returns:
+        int: changed mask.
+    """
+    if value:
+        return mask | (1 << index)
+    return mask & ~(1 << index)
+
+
+class Bitboard:
+    """Storage of the field cells state as bit masks.
+
+    Mines, open and flag states take one bit per cell. Numbers of mines
+    around the cells are kept in NEIGHBOUR_MINES_PLANES masks, where
+    the plane number n keeps the bit n of the number.
+    """
+
+    __slots__ = ('rows', 'columns', 'size', 'full_mask',
+                 'mines', 'opened', 'flags', 'neighbour_mines_planes')
+
+    def __init__(self, rows: int, columns: int) -> None:
+        """Initialize board with default (closed and empty) cells.
+
+        Args:
+            rows (int): number of rows.
+            columns (int): number of columns.
+        """
+        self.rows: int = rows
+        self.columns: int = columns
+        self.size: int = rows * columns
+        self.full_mask: int = (1 << self.size) - 1
+        self.mines: int = 0
+        self.opened: int = 0
+        self.flags: int = 0
+        self.neighbour_mines_planes: list[int] = [0] * NEIGHBOUR_MINES_PLANES
+
+    def clear(self) -> None:
+        """Return all the cells to the default (closed and empty) state."""
+        self.mines = 0
+        self.opened = 0
+        self.flags = 0
+        self.neighbour_mines_planes = [0] * NEIGHBOUR_MINES_PLANES
+
+    def copy(self) -> 'Bitboard':
+        """Return independent copy of the board.
+
+        Masks are immutable integers, so the copy shares them until any
+        of the boards is changed.
+
+        Returns:
+            Bitboard: copy of the board.
+        """
+        board: Bitboard = Bitboard.__new__(Bitboard)
+        board.rows = self.rows
+        board.columns = self.columns
+        board.size = self.size
+        board.full_mask = self.full_mask
+        board.mines = self.mines
+        board.opened = self.opened
+        board.flags = self.flags
+        board.neighbour_mines_planes = list(self.neighbour_mines_planes)
+        return board
+
+    def cell(self, index: int) -> 'BitboardCell':
+        """Return view of the cell.
+
+        Args:
+            index (int): index of the cell.
+
+        Returns:
+            BitboardCell: view that reads and writes state of the cell.
+        """
+        return BitboardCell(self, index)
+
+    def index(self, row: int, column: int) -> int:
+        """Return flat index of the cell.
+
+        Args:
+            row (int): row number.
+            column (int): column number.
+
+        Returns:
+            int: index of the cell, that is the bit number in the masks.
+        """
+        return row * self.columns + column
+
+    def coordinate(self, index: int) -> tuple[int, int]:
+        """Return coordinate of the cell by its flat index.
+
+        Args:
+            index (int): index of the cell.
+
+        Returns:
+            tuple[int, int]: coordinate as tuple[row, column].
+        """
+        return divmod(index, self.columns)
+
+    def is_valid(self, row: int, column: int) -> bool:
+        """Check that coordinates belong to the board.
+
+        Args:
+            row (int): row number.
+            column (int): column number.
+
+        Returns:
+            bool: result of the check.
+        """
+        return 0 <= row < self.rows and 0 <= column < self.columns
+
+    def neighbour_mines_of(self, index: int) -> int:
+        """Return number of mines around the cell.
+
+        Args:
+            index (int): index of the cell.
+
+        Returns:
+            int: number of mines.
+        """
+        count: int = 0
+        for plane_number, plane in enumerate(self.neighbour_mines_planes):
+            count |= ((plane >> index) & 1) << plane_number
+        return count
+
+    def set_neighbour_mines_of(self, index: int, value: int) -> None:
+        """Set number of mines around the cell.
+
+        Args:
+            index (int): index of the cell.
+            value (int): number of mines.
+        """
+        planes: list[int] = self.neighbour_mines_planes
+        for plane_number in range(NEIGHBOUR_MINES_PLANES):
+            planes[plane_number] = set_bit(
+                planes[plane_number], index, bool(value >> plane_number & 1))
+
+    def packed_state(self, index: int) -> int:
+        """Return state of the cell packed into one byte.
+
+        Args:
+            index (int): index of the cell.
+
+        Returns:
+            int: packed state.
+        """
+        return (self.neighbour_mines_of(index)
+                | (OPEN_BIT if (self.opened >> index) & 1 else 0)
+                | (MINE_BIT if (self.mines >> index) & 1 else 0)
+                | (FLAG_BIT if (self.flags >> index) & 1 else 0))
+
+    def packed_states(self, indexes: Iterable[int]) -> bytes:
+        """Return state of the cells packed into one byte per cell.
+
+        Args:
+            indexes (Iterable[int]): indexes of the cells.
+
+        Returns:
+            bytes: packed states in the order of the indexes.
+        """
+        indexes = list(indexes)
+        if len(indexes) <= MAX_BITWISE_PACKED_CELLS:
+            return bytes(self.packed_state(index) for index in indexes)
+        packed: bytes = self.pack()
+        return bytes(packed[index] for index in indexes)
+
+    def set_packed_states(self, indexes: Sequence[int],
+                          states: bytes) -> None:
+        """Set state of the cells from the packed states.
+
+        Every change of the mask copies it, so the bigger change sets
+        are written to the packed states of the whole field that are
+        unpacked then.
+
+        Args:
+            indexes (Sequence[int]): indexes of the cells.
+            states (bytes): packed states in the order of the indexes.
+        """
+        if len(indexes) > MAX_BITWISE_PACKED_CELLS:
+            packed: bytearray = bytearray(self.pack())
+            for index, state in zip(indexes, states):
+                packed[index] = state
+            self.unpack(bytes(packed))
+            return
+        for index, state in zip(indexes, states):
+            self.opened = set_bit(self.opened, index,
+                                  bool(state & OPEN_BIT))
+            self.mines = set_bit(self.mines, index,
+                                 bool(state & MINE_BIT))
+            self.flags = set_bit(self.flags, index,
+                                 bool(state & FLAG_BIT))
+            self.set_neighbour_mines_of(index, state & NEIGHBOUR_MINES_MASK)
+
+    def pack(self, start: int = 0, stop: int | None = None) -> bytes:
+        """Return state of the cells packed into one byte per cell.
+
+        Args:
+            start (int, optional): index of the first cell. Defaults
+                to 0.
+            stop (int | None, optional): index after the last cell.
+                Defaults to the size of the board.
+
+        Returns:
+            bytes: row-major packed states of the cells in the range.
+        """
+        if stop is None:
+            stop = self.size
+        width: int = max(0, stop - start)
+        range_mask: int = (1 << width) - 1
+
+        def as_int(mask: int) -> int:
+            column: bytes = bytes_from_bits((mask >> start) & range_mask,
+                                            width)
+            return int.from_bytes(column, 'little')
+
+        packed: int = (as_int(self.opened) * OPEN_BIT
+                       | as_int(self.mines) * MINE_BIT
+                       | as_int(self.flags) * FLAG_BIT)
+        for plane_number, plane in enumerate(self.neighbour_mines_planes):
+            packed |= as_int(plane) << plane_number
+        return packed.to_bytes(width, 'little')
+
+    def unpack(self, states: bytes) -> None:
+        """Set state of all the cells from the packed states.
+
+        Args:
+            states (bytes): row-major packed states of all the cells.
+        """
+        def as_mask(bit: int) -> int:
+            return bits_from_bytes(states.translate(bit_table(bit)))
+
+        self.opened = as_mask(OPEN_BIT)
+        self.mines = as_mask(MINE_BIT)
+        self.flags = as_mask(FLAG_BIT)
+        self.neighbour_mines_planes = [
+            as_mask(1 << plane_number)
+            for plane_number in range(NEIGHBOUR_MINES_PLANES)]
+
+
+class BitboardCell(CellView[Bitboard]):
+    """Cell view that reads and writes state of the bitboard cell."""
+
+    __slots__ = ()
+
+    @property
+    def neighbour_mines(self) -> int:
+        """Return number of mines around the cell.
+
+        Returns:
+            int: number of mines.
+        """
+        return self._board.neighbour_mines_of(self._index)
+
+    @neighbour_mines.setter
+    def neighbour_mines(self, value: int) -> None:
+        """Set number of mines around the cell.
+
+        Args:
+            value (int): number of mines.
+        """
+        self._board.set_neighbour_mines_of(self._index,
+                                           value & NEIGHBOUR_MINES_MASK)
+
+    @property
+    def is_open(self) -> bool:
+        """Return open status of the cell.
+
+        Returns:
+            bool: open status.
+        """
+        return bool((self._board.opened >> self._index) & 1)
+
+    @is_open.setter
+    def is_open(self, value: bool) -> None:
+        """Set open status of the cell.
+
+        Args:
+            value (bool): open status.
+        """
+        self._board.opened = set_bit(self._board.opened, self._index, value)
+
+    @property
+    def has_mine(self) -> bool:
+        """Return mine status of the cell.
+
+        Returns:
+            bool: mine status.
+        """
+        return bool((self._board.mines >> self._index) & 1)
+
+    @has_mine.setter
+    def has_mine(self, value: bool) -> None:
+        """Set mine status of the cell.
+
+        Args:
+            value (bool): mine status.
+        """
+        self._board.mines = set_bit(self._board.mines, self._index, value)
+
+    @property
+    def has_flag(self) -> bool:
+        """Return flag status of the cell.
+
+        Returns:
+            bool: flag status.
+        """
+        return bool((self._board.flags >> self._index) & 1)
+
+    @has_flag.setter
+    def has_flag(self, value: bool) -> None:
+        """Set flag status of the cell.
+
+        Args:
+            value (bool): flag status.
+        """
+        self._board.flags = set_bit(self._board.flags, self._index, value)
@@ -0,0 +1,673 @@
+"""Module contains Board class and views over the board cells."""
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import Generic, Protocol, TypeVar, cast
+
+from minesweeper_core.data.cell import Cell, FieldCell
+
+# Layout of the cell state packed into one byte.
+NEIGHBOUR_MINES_MASK: int = 0x0F
+OPEN_BIT: int = 0x10
+MINE_BIT: int = 0x20
+FLAG_BIT: int = 0x40
+
+# Cells are packed and set through the packed states of the whole board
+# if they take more than 1 / BULK_CELLS_RATIO of it.
+BULK_CELLS_RATIO: int = 4
+
+
+def bit_table(bit: int) -> bytes:
+    """Return translation table that extracts the bit of packed states.
+
+    Args:
+        bit (int): bit of the packed state.
+
+    Returns:
+        bytes: table that turns the state to 1 if it has the bit set and
+            to 0 otherwise.
+    """
+    return bytes(1 if state & bit else 0 for state in range(256))
+
+
+_NEIGHBOUR_MINES_TABLE: bytes = bytes(
+    state & NEIGHBOUR_MINES_MASK for state in range(256))
+_OPEN_TABLE: bytes = bit_table(OPEN_BIT)
+_MINE_TABLE: bytes = bit_table(MINE_BIT)
+_FLAG_TABLE: bytes = bit_table(FLAG_BIT)
+
+
+class BoardStorage(Protocol):
+    """Storage of the field cells state addressed by the flat index.
+
+    Board and Bitboard keep the cells in different columns, this is the
+    part of their interface that doesn't depend on the columns, so the
+    field views and the rules shared by the engines work with both.
+    """
+
+    rows: int
+    columns: int
+    size: int
+
+    def clear(self) -> None:
+        """Return all the cells to the default (closed and empty) state."""
+
+    def cell(self, index: int) -> FieldCell:
+        """Return view of the cell.
+
+        Args:
+            index (int): index of the cell.
+
+        Returns:
+            FieldCell: view that reads and writes state of the cell.
+        """
+
+    def index(self, row: int, column: int) -> int:
+        """Return flat index of the cell.
+
+        Args:
+            row (int): row number.
+            column (int): column number.
+
+        Returns:
+            int: index of the cell.
+        """
+
+    def coordinate(self, index: int) -> tuple[int, int]:
+        """Return coordinate of the cell by its flat index.
+
+        Args:
+            index (int): index of the cell.
+
+        Returns:
+            tuple[int, int]: coordinate as tuple[row, column].
+        """
+
+    def is_valid(self, row: int, column: int) -> bool:
+        """Check that coordinates belong to the board.
+
+        Args:
+            row (int): row number.
+            column (int): column number.
+
+        Returns:
+            bool: result of the check.
+        """
+
+    def packed_state(self, index: int) -> int:
+        """Return state of the cell packed into one byte.
+
+        Args:
+            index (int): index of the cell.
+
+        Returns:
+            int: packed state.
+        """
+
+    def packed_states(self, indexes: Iterable[int]) -> bytes:
+        """Return state of the cells packed into one byte per cell.
+
+        Args:
+            indexes (Iterable[int]): indexes of the cells.
+
+        Returns:
+            bytes: packed states in the order of the indexes.
+        """
+
+    def set_packed_states(self, indexes: Sequence[int],
+                          states: bytes) -> None:
+        """Set state of the cells from the packed states.
+
+        Args:
+            indexes (Sequence[int]): indexes of the cells.
+            states (bytes): packed states in the order of the indexes.
+        """
+
+    def pack(self, start: int = 0, stop: int | None = None) -> bytes:
+        """Return state of the cells packed into one byte per cell.
+
+        Args:
+            start (int, optional): index of the first cell. Defaults
+                to 0.
+            stop (int | None, optional): index after the last cell.
+                Defaults to the size of the board.
+
+        Returns:
+            bytes: row-major packed states of the cells in the range.
+        """
+
+    def unpack(self, states: bytes) -> None:
+        """Set state of all the cells from the packed states.
+
+        Args:
+            states (bytes): row-major packed states of all the cells.
+        """
+
+
+BoardT = TypeVar('BoardT', bound=BoardStorage)
+
+
+class Board:
+    """Flat row-major storage of the field cells state.
+
+    Every cell is addressed by the index (row * columns + column) and
+    its state is kept in the separate byte columns instead of the
+    separate objects per cell.
+
+    Columns are allocated on the first access to any of them, that is
+    on the first change of the cells. Until then all the cells have the
+    default state, which is read without allocating the columns, so
+    creation of the board doesn't depend on its size.
+    """
+
+    __slots__ = ('rows', 'columns', 'size',
+                 '_mines', '_opened', '_flags', '_neighbour_mines')
+
+    def __init__(self, rows: int, columns: int) -> None:
+        """Initialize board with default (closed and empty) cells.
+
+        Args:
+            rows (int): number of rows.
+            columns (int): number of columns.
+        """
+        self.rows: int = rows
+        self.columns: int = columns
+        self.size: int = rows * columns
+        self._mines: bytearray | None = None
+        self._opened: bytearray | None = None
+        self._flags: bytearray | None = None
+        self._neighbour_mines: bytearray | None = None
+
+    @property
+    def is_allocated(self) -> bool:
+        """Return True if the columns of the board are allocated.
+
+        Returns:
+            bool: allocation status.
+        """
+        return self._mines is not None
+
+    def allocate(self) -> None:
+        """Allocate columns with the default state of the cells.
+
+        All the columns are allocated at once, so none of them is None
+        after the call.
+        """
+        if self._mines is None:
+            self._mines = bytearray(self.size)
+            self._opened = bytearray(self.size)
+            self._flags = bytearray(self.size)
+            self._neighbour_mines = bytearray(self.size)
+
+    @property
+    def mines(self) -> bytearray:
+        """Return column of the mines, 1 for the cell with mine.
+
+        Returns:
+            bytearray: column of the mines.
+        """
+        if self._mines is None:
+            self.allocate()
+        return cast(bytearray, self._mines)
+
+    @property
+    def opened(self) -> bytearray:
+        """Return column of the open states, 1 for the opened cell.
+
+        Returns:
+            bytearray: column of the open states.
+        """
+        if self._opened is None:
+            self.allocate()
+        return cast(bytearray, self._opened)
+
+    @property
+    def flags(self) -> bytearray:
+        """Return column of the flags, 1 for the cell with flag.
+
+        Returns:
+            bytearray: column of the flags.
+        """
+        if self._flags is None:
+            self.allocate()
+        return cast(bytearray, self._flags)
+
+    @property
+    def neighbour_mines(self) -> bytearray:
+        """Return column of the numbers of mines around the cells.
+
+        Returns:
+            bytearray: column of the numbers of mines.
+        """
+        if self._neighbour_mines is None:
+            self.allocate()
+        return cast(bytearray, self._neighbour_mines)
+
+    def clear(self) -> None:
+        """Return all the cells to the default (closed and empty) state.
+
+        Columns are cleared in place, so the board keeps its buffers.
+        Not allocated columns already keep the default state.
+        """
+        if self._mines is None:
+            return
+        zeros: bytes = bytes(self.size)
+        self.mines[:] = zeros
+        self.opened[:] = zeros
+        self.flags[:] = zeros
+        self.neighbour_mines[:] = zeros
+
+    def cell(self, index: int) -> 'BoardCell':
+        """Return view of the cell.
+
+        Args:
+            index (int): index of the cell.
+
+        Returns:
+            BoardCell: view that reads and writes state of the cell.
+        """
+        return BoardCell(self, index)
+
+    def index(self, row: int, column: int) -> int:
+        """Return flat index of the cell.
+
+        Args:
+            row (int): row number.
+            column (int): column number.
+
+        Returns:
+            int: index of the cell in the board columns.
+        """
+        return row * self.columns + column
+
+    def coordinate(self, index: int) -> tuple[int, int]:
+        """Return coordinate of the cell by its flat index.
+
+        Args:
+            index (int): index of the cell in the board columns.
+
+        Returns:
+            tuple[int, int]: coordinate as tuple[row, column].
+        """
+        return divmod(index, self.columns)
+
+    def packed_state(self, index: int) -> int:
+        """Return state of the cell packed into one byte.
+
+        Args:
+            index (int): index of the cell.
+
+        Returns:
+            int: packed state.
+        """
+        if self._mines is None:
+            return 0
+        return (self.neighbour_mines[index]
+                | (OPEN_BIT if self.opened[index] else 0)
+                | (MINE_BIT if self.mines[index] else 0)
+                | (FLAG_BIT if self.flags[index] else 0))
+
+    def packed_states(self, indexes: Iterable[int]) -> bytes:
+        """Return state of the cells packed into one byte per cell.
+
+        Args:
+            indexes (Iterable[int]): indexes of the cells.
+
+        Returns:
+            bytes: packed states in the order of the indexes.
+        """
+        indexes = list(indexes)
+        if self._mines is None:
+            return bytes(len(indexes))
+        if len(indexes) * BULK_CELLS_RATIO > self.size:
+            packed: bytes = self.pack()
+            return bytes(map(packed.__getitem__, indexes))
+        counts: bytearray = self.neighbour_mines
+        opened: bytearray = self.opened
+        mines: bytearray = self.mines
+        flags: bytearray = self.flags
+        return bytes(counts[index]
+                     | (OPEN_BIT if opened[index] else 0)
+                     | (MINE_BIT if mines[index] else 0)
+                     | (FLAG_BIT if flags[index] else 0)
+                     for index in indexes)
+
+    def set_packed_states(self, indexes: Sequence[int],
+                          states: bytes) -> None:
+        """Set state of the cells from the packed states.
+
+        Many cells are written to the packed states of the whole board,
+        that are unpacked then.
+
+        Args:
+            indexes (Sequence[int]): indexes of the cells.
+            states (bytes): packed states in the order of the indexes.
+        """
+        if len(indexes) * BULK_CELLS_RATIO > self.size:
+            packed: bytearray = bytearray(self.pack())
+            for index, state in zip(indexes, states):
+                packed[index] = state
+            self.unpack(bytes(packed))
+            return
+        counts: bytearray = self.neighbour_mines
+        opened: bytearray = self.opened
+        mines: bytearray = self.mines
+        flags: bytearray = self.flags
+        for index, state in zip(indexes, states):
+            counts[index] = state & NEIGHBOUR_MINES_MASK
+            opened[index] = 1 if state & OPEN_BIT else 0
+            mines[index] = 1 if state & MINE_BIT else 0
+            flags[index] = 1 if state & FLAG_BIT else 0
+
+    def pack(self, start: int = 0, stop: int | None = None) -> bytes:
+        """Return state of the cells packed into one byte per cell.
+
+        Every column keeps 0 or 1 per cell and the numbers of mines
+        never exceed NEIGHBOUR_MINES_MASK, so the columns are combined
+        as whole integers instead of cell by cell.
+
+        Args:
+            start (int, optional): index of the first cell. Defaults
+                to 0.
+            stop (int | None, optional): index after the last cell.
+                Defaults to the size of the board.
+
+        Returns:
+            bytes: row-major packed states of the cells in the range.
+        """
+        if stop is None:
+            stop = self.size
+        if self._mines is None:
+            return bytes(max(0, stop - start))
+
+        def as_int(column: bytearray) -> int:
+            return int.from_bytes(column[start:stop], 'little')
+
+        packed: int = (as_int(self.neighbour_mines)
+                       | as_int(self.opened) * OPEN_BIT
+                       | as_int(self.mines) * MINE_BIT
+                       | as_int(self.flags) * FLAG_BIT)
+        return packed.to_bytes(max(0, stop - start), 'little')
+
+    def unpack(self, states: bytes) -> None:
+        """Set state of all the cells from the packed states.
+
+        It is the reverse of pack, every column is extracted from the
+        packed states by one translation.
+
+        Args:
+            states (bytes): row-major packed states of all the cells.
+        """
+        if states.count(0) == len(states):
+            self.clear()
+            return
+        self.neighbour_mines[:] = states.translate(_NEIGHBOUR_MINES_TABLE)
+        self.opened[:] = states.translate(_OPEN_TABLE)
+        self.mines[:] = states.translate(_MINE_TABLE)
+        self.flags[:] = states.translate(_FLAG_TABLE)
+
+    def is_valid(self, row: int, column: int) -> bool:
+        """Check that coordinates belong to the board.
+
+        Args:
+            row (int): row number.
+            column (int): column number.
+
+        Returns:
+            bool: result of the check.
+        """
+        return 0 <= row < self.rows and 0 <= column < self.columns
+
+
+class CellView(Generic[BoardT]):
+    """Cell view that reads and writes state of the cell of the board.
+
+    Instances are created on demand and are not stored by the board,
+    so any number of views can exist for the same cell. The view has
+    the FieldCell interface and reads and writes the packed state of
+    the cell, subclasses could access the columns of their board
+    directly.
+    """
+
+    __slots__ = ('_board', '_index')
+
+    def __init__(self, board: BoardT, index: int) -> None:
+        """Initialize view of the board cell.
+
+        Args:
+            board (BoardT): board that keeps the cell state.
+            index (int): index of the cell in the board.
+        """
+        self._board: BoardT = board
+        self._index: int = index
+
+    def __eq__(self, other: object) -> bool:
+        """Compare state of the cell with other cell or cell view.
+
+        Args:
+            other (object): compared object.
+
+        Returns:
+            bool: True if both cells have the same state.
+        """
+        if not isinstance(other, (Cell, CellView)):
+            return NotImplemented
+        return ((self.row, self.column, self.neighbour_mines,
+                 self.is_open, self.has_mine, self.has_flag)
+                == (other.row, other.column, other.neighbour_mines,
+                    other.is_open, other.has_mine, other.has_flag))
+
+    def _set_state(self, mask: int, bits: int) -> None:
+        """Replace the bits of the packed state of the cell.
+
+        Args:
+            mask (int): bits of the packed state that are replaced.
+            bits (int): new value of the replaced bits.
+        """
+        state: int = self._board.packed_state(self._index)
+        self._board.set_packed_states(
+            [self._index], bytes([state & ~mask | bits & mask]))
+
+    def __repr__(self) -> str:
+        """Return representation of the cell in the form of Cell.
+
+        Returns:
+            str: representation of the cell.
+        """
+        return (f'{type(self).__name__}(row={self.row}, '
+                f'column={self.column}, '
+                f'neighbour_mines={self.neighbour_mines}, '
+                f'is_open={self.is_open}, has_mine={self.has_mine}, '
+                f'has_flag={self.has_flag})')
+
+    @property
+    def row(self) -> int:
+        """Return row number of the cell.
+
+        Returns:
+            int: row number.
+        """
+        return self._index // self._board.columns
+
+    @property
+    def column(self) -> int:
+        """Return column number of the cell.
+
+        Returns:
+            int: column number.
+        """
+        return self._index % self._board.columns
+
+    @property
+    def neighbour_mines(self) -> int:
+        """Return number of mines around the cell.
+
+        Returns:
+            int: number of mines.
+        """
+        return self._board.packed_state(self._index) & NEIGHBOUR_MINES_MASK
+
+    @neighbour_mines.setter
+    def neighbour_mines(self, value: int) -> None:
+        """Set number of mines around the cell.
+
+        Args:
+            value (int): number of mines.
+        """
+        self._set_state(NEIGHBOUR_MINES_MASK, value)
+
+    @property
+    def is_open(self) -> bool:
+        """Return open status of the cell.
+
+        Returns:
+            bool: open status.
+        """
+        return bool(self._board.packed_state(self._index) & OPEN_BIT)
+
+    @is_open.setter
+    def is_open(self, value: bool) -> None:
+        """Set open status of the cell.
+
+        Args:
+            value (bool): open status.
+        """
+        self._set_state(OPEN_BIT, OPEN_BIT if value else 0)
+
+    @property
+    def has_mine(self) -> bool:
+        """Return mine status of the cell.
+
+        Returns:
+            bool: mine status.
+        """
+        return bool(self._board.packed_state(self._index) & MINE_BIT)
+
+    @has_mine.setter
+    def has_mine(self, value: bool) -> None:
+        """Set mine status of the cell.
+
+        Args:
+            value (bool): mine status.
+        """
+        self._set_state(MINE_BIT, MINE_BIT if value else 0)
+
+    @property
+    def has_flag(self) -> bool:
+        """Return flag status of the cell.
+
+        Returns:
+            bool: flag status.
+        """
+        return bool(self._board.packed_state(self._index) & FLAG_BIT)
+
+    @has_flag.setter
+    def has_flag(self, value: bool) -> None:
+        """Set flag status of the cell.
+
+        Args:
+            value (bool): flag status.
+        """
+        self._set_state(FLAG_BIT, FLAG_BIT if value else 0)
+
+
+class BoardCell(CellView['Board']):
+    """Cell view that reads and writes state of the board cell.
+
+    The state is read through the packed state of the cell, so reading
+    of the default cells doesn't allocate columns of the board.
+    """
+
+    __slots__ = ()
+
+
+class FieldView(Mapping[tuple[int, int], FieldCell]):
+    """Read-only mapping of coordinates to the cells of the board.
+
+    Cells are produced on access as views created by the board, so the
+    mapping doesn't keep an object per cell. Any board storage (Board
+    or Bitboard) could be viewed.
+    """
+
+    def __init__(self, board: BoardStorage) -> None:
+        """Initialize view of the board.
+
+        Args:
+            board (BoardStorage): board that keeps the cells state.
+        """
+        self._board: BoardStorage = board
+
+    def __getitem__(self, coordinate: tuple[int, int]) -> FieldCell:
+        """Return cell by coordinate.
+
+        Args:
+            coordinate (tuple[int, int]): coordinate as tuple[row, column].
+
+        Raises:
+            KeyError: raised if coordinate is outside of the board.
+
+        Returns:
+            FieldCell: view of the cell.
+        """
+        row, column = coordinate
+        if not self._board.is_valid(row, column):
+            raise KeyError(coordinate)
+        return self._board.cell(self._board.index(row, column))
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        """Iterate over coordinates of the board in row-major order.
+
+        Returns:
+            Iterator[tuple[int, int]]: coordinates iterator.
+        """
+        for row in range(self._board.rows):
+            for column in range(self._board.columns):
+                yield row, column
+
+    def __len__(self) -> int:
+        """Return number of cells in the board.
+
+        Returns:
+            int: number of cells.
+        """
+        return self._board.size
+
+    def __contains__(self, coordinate: object) -> bool:
+        """Check that coordinate belongs to the board.
+
+        Args:
+            coordinate (object): coordinate as tuple[row, column].
+
+        Returns:
+            bool: result of the check.
+        """
+        if not isinstance(coordinate, tuple) or len(coordinate) != 2:
+            return False
+        row, column = coordinate
+        return self._board.is_valid(row, column)
+
+    def packed_states(self, start: int = 0,
+                      stop: int | None = None) -> bytes:
+        """Return state of the cells packed into one byte per cell.
+
+        Cells are addressed by the index (row * columns + column) and
+        bits of the state are described by the NEIGHBOUR_MINES_MASK,
+        OPEN_BIT, MINE_BIT and FLAG_BIT constants.
+
+        Args:
+            start (int, optional): index of the first cell. Defaults
+                to 0.
+            stop (int | None, optional): index after the last cell.
+                Defaults to the number of cells.
+
+        Returns:
+            bytes: row-major packed states of the cells in the range.
+        """
+        return self._board.pack(start, stop)
+
+    def __repr__(self) -> str:
+        """Return string representation of the view.
+
+        Returns:
+            str: representation.
+        """
+        return (f'FieldView(rows={self._board.rows}, '
+                f'columns={self._board.columns})')
@@ -1,8 +1,40 @@
-"""Module contains Cell class."""
+"""Module contains Cell class and FieldCell protocol."""
 from dataclasses import dataclass
+from typing import Protocol, runtime_checkable
 
 
-@dataclass(repr=True)
+@runtime_checkable
+class FieldCell(Protocol):
+    """Interface of the field cell.
+
+    Cell objects and the views of the board cells created by the boards
+    both implement it, so the field could be read and changed without
+    knowing how the cells are stored.
+    """
+
+    neighbour_mines: int
+    is_open: bool
+    has_mine: bool
+    has_flag: bool
+
+    @property
+    def row(self) -> int:
+        """Return row number of the cell.
+
+        Returns:
+            int: row number.
+        """
+
+    @property
+    def column(self) -> int:
+        """Return column number of the cell.
+
+        Returns:
+            int: column number.
+        """
+
+
+@dataclass(repr=True, slots=True)
 class Cell:
     """Cell data transfer object."""
 
@@ -0,0 +1,136 @@
+"""Module contains ChangeSet class."""
+from collections.abc import Iterable, Iterator, Mapping
+
+from minesweeper_core.data.board import (FLAG_BIT, MINE_BIT,
+                                         NEIGHBOUR_MINES_MASK, OPEN_BIT)
+from minesweeper_core.data.cell import Cell
+
+
+class ChangeSet(Mapping[tuple[int, int], Cell]):
+    """Cells whose open or flag state was changed by an action.
+
+    The change set keeps indexes of the changed cells and their states
+    after and before the action packed into one byte per cell. Cells
+    are created on access as snapshots of the states after the action,
+    so the change set doesn't follow later changes of the field.
+    """
+
+    def __init__(self, columns: int = 1,
+                 indexes: Iterable[int] = (),
+                 states: bytes = b'',
+                 old_states: bytes = b'') -> None:
+        """Initialize change set.
+
+        Args:
+            columns (int, optional): number of columns of the field.
+                Defaults to 1.
+            indexes (Iterable[int], optional): indexes of the changed
+                cells. Defaults to empty.
+            states (bytes, optional): packed states of the changed
+                cells in the order of indexes. Defaults to empty.
+            old_states (bytes, optional): packed states of the changed
+                cells before the action in the order of indexes.
+                Defaults to empty.
+        """
+        self._columns: int = columns
+        self._indexes: tuple[int, ...] = tuple(indexes)
+        self._states: bytes = states
+        self._old_states: bytes = old_states
+        self._positions: dict[tuple[int, int], int] | None = None
+
+    @property
+    def indexes(self) -> tuple[int, ...]:
+        """Return indexes (row * columns + column) of the changed cells.
+
+        Returns:
+            tuple[int, ...]: indexes of the cells.
+        """
+        return self._indexes
+
+    @property
+    def states(self) -> bytes:
+        """Return packed states of the changed cells.
+
+        Returns:
+            bytes: one byte per cell in the order of indexes.
+        """
+        return self._states
+
+    @property
+    def old_states(self) -> bytes:
+        """Return packed states of the changed cells before the action.
+
+        Returns:
+            bytes: one byte per cell in the order of indexes.
+        """
+        return self._old_states
+
+    def _cell(self, position: int) -> Cell:
+        """Create snapshot of the changed cell.
+
+        Args:
+            position (int): position of the cell in the change set.
+
+        Returns:
+            Cell: snapshot of the cell.
+        """
+        row, column = divmod(self._indexes[position], self._columns)
+        state: int = self._states[position]
+        return Cell(row=row, column=column,
+                    neighbour_mines=state & NEIGHBOUR_MINES_MASK,
+                    is_open=bool(state & OPEN_BIT),
+                    has_mine=bool(state & MINE_BIT),
+                    has_flag=bool(state & FLAG_BIT))
+
+    def __getitem__(self, coordinate: tuple[int, int]) -> Cell:
+        """Return snapshot of the changed cell by coordinate.
+
+        Args:
+            coordinate (tuple[int, int]): coordinate as tuple[row, column].
+
+        Raises:
+            KeyError: raised if the cell was not changed.
+
+        Returns:
+            Cell: snapshot of the cell.
+        """
+        if self._positions is None:
+            self._positions = {
+                divmod(index, self._columns): position
+                for position, index in enumerate(self._indexes)}
+        return self._cell(self._positions[coordinate])
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        """Iterate over coordinates of the changed cells.
+
+        Returns:
+            Iterator[tuple[int, int]]: coordinates iterator.
+        """
+        columns: int = self._columns
+        for index in self._indexes:
+            yield divmod(index, columns)
+
+    def __len__(self) -> int:
+        """Return number of the changed cells.
+
+        Returns:
+            int: number of cells.
+        """
+        return len(self._indexes)
+
+    def cells(self) -> Iterator[Cell]:
+        """Iterate over snapshots of the changed cells.
+
+        Returns:
+            Iterator[Cell]: cells iterator.
+        """
+        for position in range(len(self._indexes)):
+            yield self._cell(position)
+
+    def __repr__(self) -> str:
+        """Return string representation of the change set.
+
+        Returns:
+            str: representation.
+        """
+        return f'ChangeSet(changed={len(self._indexes)})'
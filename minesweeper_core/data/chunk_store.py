@@ -0,0 +1,194 @@
+"""Module contains ChunkStore class.
+
+Store keeps the least recently used chunks of the endless field in
+memory. Chunks are boards of the same size, mines and numbers of mines
+around their cells are generated from the seed and could be generated
+again at any time, so only the state changed by the player (opened
+cells and flags) is kept when the chunk leaves the memory.
+"""
+import logging
+import pathlib
+import shutil
+import tempfile
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable
+
+from minesweeper_core.data.board import Board
+
+log: logging.Logger = logging.getLogger(__name__)
+
+ChunkCoordinate = tuple[int, int]
+
+# Number of chunks kept in memory by default.
+DEFAULT_CAPACITY: int = 256
+
+
+class ChunkStore:
+    """Least recently used cache of the field chunks.
+
+    Chunks over the capacity are evicted by trim, that is called after
+    the action, so the chunks used by the action stay in memory while
+    it runs. Evicted chunks without opened cells and flags are dropped,
+    the other ones are spilled to the files of the directory and are
+    loaded back on the next access.
+    """
+
+    def __init__(self, create: Callable[[ChunkCoordinate], Board],
+                 capacity: int = DEFAULT_CAPACITY,
+                 directory: str | pathlib.Path | None = None) -> None:
+        """Initialize empty store.
+
+        Args:
+            create (Callable[[ChunkCoordinate], Board]): function that
+                creates the chunk with mines and numbers of mines.
+            capacity (int, optional): number of chunks kept in memory.
+                Defaults to DEFAULT_CAPACITY.
+            directory (str | pathlib.Path | None, optional): directory
+                for the spilled chunks. Defaults to the temporary
+                directory created on the first spill and removed with
+                the store.
+        """
+        self._create: Callable[[ChunkCoordinate], Board] = create
+        self._capacity: int = max(1, capacity)
+        self._directory: pathlib.Path | None = (
+            pathlib.Path(directory) if directory is not None else None)
+        self._cleanup: weakref.finalize | None = None
+        self._chunks: OrderedDict[ChunkCoordinate, Board] = OrderedDict()
+        self._spilled: set[ChunkCoordinate] = set()
+
+    @property
+    def capacity(self) -> int:
+        """Return number of chunks kept in memory.
+
+        Returns:
+            int: capacity.
+        """
+        return self._capacity
+
+    @property
+    def number_of_spilled_chunks(self) -> int:
+        """Return number of chunks kept in the files.
+
+        Returns:
+            int: number of spilled chunks.
+        """
+        return len(self._spilled)
+
+    def __len__(self) -> int:
+        """Return number of chunks in memory.
+
+        Returns:
+            int: number of chunks.
+        """
+        return len(self._chunks)
+
+    def __contains__(self, coordinate: object) -> bool:
+        """Check that the chunk is in memory or is spilled.
+
+        Args:
+            coordinate (object): coordinate of the chunk.
+
+        Returns:
+            bool: result of the check.
+        """
+        return coordinate in self._chunks or coordinate in self._spilled
+
+    def get(self, coordinate: ChunkCoordinate) -> Board:
+        """Return the chunk, creating or loading it if needed.
+
+        Args:
+            coordinate (ChunkCoordinate): coordinate of the chunk as
+                tuple[chunk_row, chunk_column].
+
+        Returns:
+            Board: chunk.
+        """
+        chunk: Board | None = self._chunks.get(coordinate)
+        if chunk is not None:
+            self._chunks.move_to_end(coordinate)
+            return chunk
+        chunk = self._create(coordinate)
+        if coordinate in self._spilled:
+            self._load(coordinate, chunk)
+        self._chunks[coordinate] = chunk
+        return chunk
+
+    def trim(self) -> None:
+        """Evict the least recently used chunks over the capacity."""
+        while len(self._chunks) > self._capacity:
+            coordinate, chunk = self._chunks.popitem(last=False)
+            if (chunk.opened.find(1) != -1
+                    or chunk.flags.find(1) != -1):
+                self._spill(coordinate, chunk)
+
+    def refresh(self) -> None:
+        """Create mines of the chunks in memory again.
+
+        State changed by the player is kept.
+        """
+        for coordinate, chunk in self._chunks.items():
+            fresh: Board = self._create(coordinate)
+            fresh.opened[:] = chunk.opened
+            fresh.flags[:] = chunk.flags
+            self._chunks[coordinate] = fresh
+
+    def clear(self) -> None:
+        """Remove all the chunks from memory and files."""
+        self._chunks.clear()
+        for coordinate in self._spilled:
+            self._path(coordinate).unlink(missing_ok=True)
+        self._spilled.clear()
+
+    def close(self) -> None:
+        """Remove all the chunks and the own temporary directory."""
+        self.clear()
+        if self._cleanup is not None:
+            self._cleanup()
+            self._cleanup = None
+            self._directory = None
+
+    def _path(self, coordinate: ChunkCoordinate) -> pathlib.Path:
+        """Return path of the file of the spilled chunk.
+
+        Args:
+            coordinate (ChunkCoordinate): coordinate of the chunk.
+
+        Returns:
+            pathlib.Path: path of the file.
+        """
+        if self._directory is None:
+            self._directory = pathlib.Path(
+                tempfile.mkdtemp(prefix='minesweeper-chunks-'))
+            self._cleanup = weakref.finalize(
+                self, shutil.rmtree, self._directory, ignore_errors=True)
+        chunk_row, chunk_column = coordinate
+        return self._directory / f'{chunk_row}_{chunk_column}.chunk'
+
+    def _spill(self, coordinate: ChunkCoordinate, chunk: Board) -> None:
+        """Write opened cells and flags of the chunk to the file.
+
+        Args:
+            coordinate (ChunkCoordinate): coordinate of the chunk.
+            chunk (Board): evicted chunk.
+        """
+        log.debug('_spill, chunk: %s', coordinate)
+        path: pathlib.Path = self._path(coordinate)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(bytes(chunk.opened) + bytes(chunk.flags))
+        self._spilled.add(coordinate)
+
+    def _load(self, coordinate: ChunkCoordinate, chunk: Board) -> None:
+        """Read opened cells and flags of the chunk from the file.
+
+        Args:
+            coordinate (ChunkCoordinate): coordinate of the chunk.
+            chunk (Board): created chunk.
+        """
+        log.debug('_load, chunk: %s', coordinate)
+        path: pathlib.Path = self._path(coordinate)
+        state: bytes = path.read_bytes()
+        chunk.opened[:] = state[:chunk.size]
+        chunk.flags[:] = state[chunk.size:]
+        path.unlink()
+        self._spilled.discard(coordinate)
@@ -1,7 +1,8 @@
 """Module contains Field class."""
+from collections.abc import Mapping
 from dataclasses import dataclass
 
-from minesweeper_core.data.cell import Cell
+from minesweeper_core.data.cell import FieldCell
 from minesweeper_core.data.field_configuration import Configuration
 
 
@@ -10,4 +11,4 @@ class Field:
     """Field data transfer object."""
 
     field_config: Configuration
-    field_cells: dict[tuple[int, int], Cell]
+    field_cells: Mapping[tuple[int, int], FieldCell]
@@ -9,3 +9,15 @@ class Configuration:
     number_of_rows: int = 9
     number_of_columns: int = 9
     number_of_mines: int = 10
+
+
+@dataclass(frozen=True, repr=True)
+class EndlessConfiguration:
+    """Configuration of the endless game data transfer object.
+
+    The field has no bounds, it is split into square chunks that get
+    mines with the same density.
+    """
+
+    mine_density: float = 0.15
+    chunk_size: int = 32
@@ -0,0 +1,13 @@
+"""Module contains GameStatus class."""
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, repr=True)
+class GameStatus:
+    """Counters and result of the started game data transfer object."""
+
+    flags_left: int
+    placed_flags: int
+    opened_cells: int
+    is_game_finished: bool = False
+    is_player_win: bool = False
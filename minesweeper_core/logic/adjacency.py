@@ -0,0 +1,126 @@
+"""Module contains Adjacency class and cached adjacency tables."""
+import functools
+import itertools
+import logging
+from array import array
+from dataclasses import dataclass
+
+log: logging.Logger = logging.getLogger(__name__)
+
+# Number of the field shapes which adjacency tables are kept in memory.
+ADJACENCY_CACHE_SIZE: int = 8
+
+
+@dataclass(repr=False, frozen=True)
+class Adjacency:
+    """Adjacency table of the field cells in the compressed row format.
+
+    Neighbours of the cell with the index i are stored in the
+    neighbours[offsets[i]:offsets[i + 1]] slice, where index of the cell
+    is (row * columns + column).
+    """
+
+    rows: int
+    columns: int
+    offsets: array
+    neighbours: array
+
+    def neighbours_of(self, index: int) -> array:
+        """Return indexes of the cells around the passed cell.
+
+        Args:
+            index (int): index of the cell.
+
+        Returns:
+            array: indexes of the neighbour cells.
+        """
+        return self.neighbours[self.offsets[index]:self.offsets[index + 1]]
+
+    def __repr__(self) -> str:
+        """Return string representation of the table.
+
+        Returns:
+            str: representation.
+        """
+        return (f'Adjacency(rows={self.rows}, columns={self.columns}, '
+                f'neighbours={len(self.neighbours)})')
+
+
+def _neighbour_deltas(row_deltas: list[int],
+                      column_deltas: tuple[int, ...]) -> list[int]:
+    """Return index deltas from a cell to its neighbours.
+
+    Args:
+        row_deltas (list[int]): index deltas of the neighbour rows.
+        column_deltas (tuple[int, ...]): deltas of the neighbour columns.
+
+    Returns:
+        list[int]: index deltas without the cell itself.
+    """
+    return [row_delta + column_delta
+            for row_delta in row_deltas
+            for column_delta in column_deltas
+            if row_delta or column_delta]
+
+
+def build_adjacency(rows: int, columns: int) -> Adjacency:
+    """Build adjacency table for the field with passed measures.
+
+    All the cells inside one row, excluding the first and the last
+    column, have the same index deltas to their neighbours, so the row
+    is built at once by zipping ranges of the neighbour indexes.
+
+    Args:
+        rows (int): number of rows.
+        columns (int): number of columns.
+
+    Returns:
+        Adjacency: built adjacency table.
+    """
+    log.debug('build_adjacency, rows: %d, columns: %d', rows, columns)
+    neighbours: array = array('I')
+    counts: array = array('I')
+    for row in range(rows):
+        row_deltas: list[int] = [
+            row_delta * columns for row_delta in (-1, 0, 1)
+            if 0 <= row + row_delta < rows]
+        row_start: int = row * columns
+        if columns == 1:
+            deltas: list[int] = _neighbour_deltas(row_deltas, (0,))
+            neighbours.extend(row_start + delta for delta in deltas)
+            counts.append(len(deltas))
+            continue
+        deltas = _neighbour_deltas(row_deltas, (0, 1))
+        neighbours.extend(row_start + delta for delta in deltas)
+        counts.append(len(deltas))
+        deltas = _neighbour_deltas(row_deltas, (-1, 0, 1))
+        inner_start: int = row_start + 1
+        inner_end: int = row_start + columns - 1
+        neighbours.extend(itertools.chain.from_iterable(zip(
+            *(range(inner_start + delta, inner_end + delta)
+              for delta in deltas))))
+        counts.extend(itertools.repeat(len(deltas), columns - 2))
+        deltas = _neighbour_deltas(row_deltas, (-1, 0))
+        neighbours.extend(inner_end + delta for delta in deltas)
+        counts.append(len(deltas))
+    offsets: array = array('I', [0])
+    offsets.extend(itertools.accumulate(counts))
+    return Adjacency(rows, columns, offsets, neighbours)
+
+
+@functools.lru_cache(maxsize=ADJACENCY_CACHE_SIZE)
+def get_adjacency(rows: int, columns: int) -> Adjacency:
+    """Return shared adjacency table for the field with passed measures.
+
+    Tables are cached per field shape, so all the games with the same
+    configuration use the same table. The least recently used tables
+    are evicted when the cache is full.
+
+    Args:
+        rows (int): number of rows.
+        columns (int): number of columns.
+
+    Returns:
+        Adjacency: adjacency table.
+    """
+    return build_adjacency(rows, columns)
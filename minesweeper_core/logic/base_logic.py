@@ -0,0 +1,625 @@
+"""Module contains BaseGameLogic class.
+
+The rules of the game that don't depend on how the cells are stored
+are shared by the engines here: the game state and counters, the first
+open, the saved game and the change sets. Every engine keeps the cells
+in its own board storage and implements the actions over it.
+"""
+import logging
+import mmap
+import os
+import random
+from collections.abc import Mapping, Sequence
+from typing import Generic
+
+from minesweeper_core.data.board import (FLAG_BIT, BoardT, FieldView,
+                                         bit_table)
+from minesweeper_core.data.cell import FieldCell
+from minesweeper_core.data.change_set import ChangeSet
+from minesweeper_core.data.field import Field
+from minesweeper_core.data.field_configuration import Configuration
+from minesweeper_core.data.game_status import GameStatus
+from minesweeper_core.logic.adjacency import Adjacency, get_adjacency
+from minesweeper_core.logic.exceptions import (IncorrectCoordinatesException,
+                                               IncorrectSaveException)
+from minesweeper_core.logic.serialization import (HEADER, SavedGame,
+                                                  dump_game, load_game)
+from minesweeper_core.logic.tracing import Trace, get_trace
+
+log: logging.Logger = logging.getLogger(__name__)
+
+FieldDict = dict[tuple[int, int], FieldCell]
+
+# Translation table that turns packed states with flag to 1.
+_FLAG_TABLE: bytes = bit_table(FLAG_BIT)
+
+
+class BaseGameLogic(Generic[BoardT]):
+    """Class encapsulates logic of the game shared by the engines.
+
+    Engines set _logger to the logger of their module, messages and
+    traces of the game are written to it.
+    """
+
+    _logger: logging.Logger = log
+
+    def __init__(self, game_config: Configuration,
+                 rng: random.Random | int | None = None) -> None:
+        """Initialize the game with the passed configuration.
+
+        Args:
+            game_config (Configuration): configuration contains
+                parameters of the game session as size of field and
+                number of mines.
+            rng (random.Random | int | None, optional): random generator
+                or seed used to put mines to the field. Passing the same
+                seed generates the same field. Defaults to None.
+        """
+        self._logger.debug('Initializing game')
+        if isinstance(rng, random.Random):
+            self._random: random.Random = rng
+        else:
+            self._random = random.Random(rng)
+        self._board: BoardT = self._create_board(
+            game_config.number_of_rows, game_config.number_of_columns)
+        self._game_field: Field = Field(game_config, FieldView(self._board))
+        self._changed_indexes: list[int] = []
+        self._old_states: bytearray = bytearray()
+        self._init_game_state()
+        self._logger.debug(
+            'field: %s, first_time: %s, finished: %s, win: %s',
+            self._game_field, self._is_first_time_open,
+            self.is_game_finished, self.is_player_win)
+
+    def _create_board(self, rows: int, columns: int) -> BoardT:
+        """Create storage of the field cells state.
+
+        Args:
+            rows (int): number of rows.
+            columns (int): number of columns.
+
+        Raises:
+            NotImplementedError: raised if the engine doesn't create
+                its board.
+
+        Returns:
+            BoardT: board with closed and empty cells.
+        """
+        raise NotImplementedError
+
+    def _init_game_state(self) -> None:
+        """Set state flags and counters of the not started game.
+
+        Trace of the game actions is resolved here from the logger of
+        the engine, so the actions check the attribute instead of the
+        level of the logger.
+        """
+        self._trace: Trace | None = get_trace(self._logger)
+        self._is_first_time_open = True
+        self._is_game_finished = False
+        self._is_player_win = False
+        self._flags_number = self.number_of_mines
+        self._placed_flags_number = 0
+        self._opened_cells_number = 0
+        self._clear_changes()
+
+    def reset(self) -> None:
+        """Start the new game with the same configuration.
+
+        State of the cells is cleared in the existing board, so the
+        field and its views stay valid. Mines are put on the next first
+        open by the same random generator.
+        """
+        self._logger.debug('reset')
+        self._board.clear()
+        self._init_game_state()
+
+    def dumps(self) -> bytes:
+        """Return the game state in the binary format of the saved game.
+
+        Returns:
+            bytes: saved game.
+        """
+        self._logger.debug('dumps')
+        status: GameStatus = self.status
+        return dump_game(SavedGame(
+            config=self._game_field.field_config,
+            states=self._pack_board(),
+            flags_left=status.flags_left,
+            opened_cells=status.opened_cells,
+            is_first_time_open=not self.is_game_started,
+            is_game_finished=status.is_game_finished,
+            is_player_win=status.is_player_win))
+
+    @classmethod
+    def loads(cls, data: bytes | bytearray | memoryview,
+              rng: random.Random | int | None = None) -> 'BaseGameLogic':
+        """Create the game from the binary format of the saved game.
+
+        Args:
+            data (bytes | bytearray | memoryview): saved game.
+            rng (random.Random | int | None, optional): random generator
+                or seed used by the game. Defaults to None.
+
+        Raises:
+            IncorrectSaveException: raised if the data is not the saved
+                game.
+
+        Returns:
+            BaseGameLogic: restored game.
+        """
+        saved: SavedGame = load_game(data)
+        game: BaseGameLogic = cls(saved.config, rng)
+        game._restore(saved)
+        return game
+
+    def save(self, path: str | os.PathLike) -> None:
+        """Write the game state to the file.
+
+        Args:
+            path (str | os.PathLike): path of the file.
+        """
+        self._logger.debug('save, path: %s', path)
+        with open(path, 'wb') as file:
+            file.write(self.dumps())
+
+    @classmethod
+    def load(cls, path: str | os.PathLike,
+             rng: random.Random | int | None = None) -> 'BaseGameLogic':
+        """Create the game from the file of the saved game.
+
+        The file is memory-mapped, so the states of the cells are taken
+        from the mapping without reading the file to the buffer first.
+
+        Args:
+            path (str | os.PathLike): path of the file.
+            rng (random.Random | int | None, optional): random generator
+                or seed used by the game. Defaults to None.
+
+        Raises:
+            IncorrectSaveException: raised if the file is not the saved
+                game.
+
+        Returns:
+            BaseGameLogic: restored game.
+        """
+        cls._logger.debug('load, path: %s', path)
+        with open(path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size < HEADER.size:
+                raise IncorrectSaveException('Saved game is too short')
+            with mmap.mmap(file.fileno(), 0,
+                           access=mmap.ACCESS_READ) as mapped:
+                # the view is released before the mapping is closed
+                with memoryview(mapped) as view:
+                    return cls.loads(view, rng)
+
+    def _restore(self, saved: SavedGame) -> None:
+        """Set the state of the game from the saved game.
+
+        Args:
+            saved (SavedGame): state of the game.
+        """
+        self._init_game_state()
+        self._unpack_board(saved.states)
+        self._is_first_time_open = saved.is_first_time_open
+        self._is_game_finished = saved.is_game_finished
+        self._is_player_win = saved.is_player_win
+        self._flags_number = saved.flags_left
+        self._placed_flags_number = saved.states.translate(
+            _FLAG_TABLE).count(1)
+        self._opened_cells_number = saved.opened_cells
+
+    def _pack_board(self) -> bytes:
+        """Return packed states of all the cells of the board.
+
+        Returns:
+            bytes: row-major packed states.
+        """
+        return self._board.pack()
+
+    def _write_states(self, indexes: Sequence[int], states: bytes) -> None:
+        """Set state of the cells of the board.
+
+        Args:
+            indexes (Sequence[int]): indexes of the cells.
+            states (bytes): packed states in the order of the indexes.
+        """
+        self._board.set_packed_states(indexes, states)
+
+    def _unpack_board(self, states: bytes) -> None:
+        """Set state of all the cells of the board.
+
+        Args:
+            states (bytes): row-major packed states.
+        """
+        self._board.unpack(states)
+
+    @property
+    def rows(self) -> int:
+        """Return number of rows.
+
+        Returns:
+            int: number of rows.
+        """
+        return self._game_field.field_config.number_of_rows
+
+    @property
+    def columns(self) -> int:
+        """Return number of columns.
+
+        Returns:
+            int: number of columns.
+        """
+        return self._game_field.field_config.number_of_columns
+
+    @property
+    def field(self) -> Mapping[tuple[int, int], FieldCell]:
+        """Return field.
+
+        Cells of the field are views of the board state that are
+        created on access.
+
+        Returns:
+            Mapping[tuple[int, int], FieldCell]: current field.
+        """
+        return self._game_field.field_cells
+
+    @property
+    def number_of_mines(self) -> int:
+        """Return number of mines.
+
+        Returns:
+            int: number of mines.
+        """
+        return self._game_field.field_config.number_of_mines
+
+    @property
+    def number_of_flags(self) -> int:
+        """Return number of available flags.
+
+        Returns:
+            int: number of flags.
+        """
+        return self._flags_number
+
+    @property
+    def number_of_placed_flags(self) -> int:
+        """Return number of cells that have a flag.
+
+        Returns:
+            int: number of flagged cells.
+        """
+        return self._placed_flags_number
+
+    @property
+    def number_of_opened_cells(self) -> int:
+        """Return number of safe cells opened by the player.
+
+        Cells revealed when the game is finished are not counted.
+
+        Returns:
+            int: number of opened cells.
+        """
+        return self._opened_cells_number
+
+    @property
+    def number_of_cells_left(self) -> int:
+        """Return number of safe cells that still should be opened.
+
+        Returns:
+            int: number of safe closed cells.
+        """
+        cells: int = self.rows * self.columns
+        return cells - self.number_of_mines - self.number_of_opened_cells
+
+    @property
+    def is_game_finished(self) -> bool:
+        """Return game state status.
+
+        If game is finished - True will be returned.
+        False will be return if game still alive.
+
+        Returns:
+            bool: finished game status.
+        """
+        return self._is_game_finished
+
+    @property
+    def is_player_win(self) -> bool:
+        """Return status of the player in the game.
+
+        If player has not opened cell with bomb/mine, then player status
+        will be True (is_player_win will return True).
+        If player exploded - value will be False.
+
+        Returns:
+            bool: player win status.
+        """
+        return self._is_player_win
+
+    @property
+    def is_game_started(self) -> bool:
+        """Return True if mines are put by the first open.
+
+        Returns:
+            bool: started game status.
+        """
+        return not self._is_first_time_open
+
+    @property
+    def status(self) -> GameStatus:
+        """Return counters and result of the game.
+
+        Returns:
+            GameStatus: status of the game.
+        """
+        return GameStatus(flags_left=self.number_of_flags,
+                          placed_flags=self.number_of_placed_flags,
+                          opened_cells=self.number_of_opened_cells,
+                          is_game_finished=self.is_game_finished,
+                          is_player_win=self.is_player_win)
+
+    def restore_cells(self, indexes: Sequence[int], states: bytes,
+                      status: GameStatus) -> ChangeSet:
+        """Set state of the cells and status of the started game.
+
+        It is used to return the game to the state before or after the
+        action, mines and numbers of mines around the cells are expected
+        to be the same as the game has.
+
+        Args:
+            indexes (Sequence[int]): indexes of the cells.
+            states (bytes): packed states in the order of the indexes.
+            status (GameStatus): status of the game.
+
+        Returns:
+            ChangeSet: the restored cells.
+        """
+        if self._trace is not None:
+            self._trace('restore_cells, cells: %d, status: %s',
+                        len(indexes), status)
+        self._clear_changes()
+        self._record_changes(indexes)
+        self._write_states(indexes, states)
+        self._flags_number = status.flags_left
+        self._placed_flags_number = status.placed_flags
+        self._opened_cells_number = status.opened_cells
+        self._is_game_finished = status.is_game_finished
+        self._is_player_win = status.is_player_win
+        return self._build_change_set()
+
+    def open_cell(self, row: int, column: int) -> ChangeSet:
+        """Open cell by coordinates.
+
+        Cell with coordinates (row, column) will be opened and status of
+        the game will be reprocessed.
+        After opening the cell, game will check if game is not finished
+        and neighbour cells will be opened also if conditions are valid
+        for it.
+        For first open time - mines will be set to random cells
+        excluding current cell coordinates.
+
+        Args:
+            row (int): cell row number.
+            column (int): cell column number.
+
+        Returns:
+            ChangeSet: cells whose open or flag state was changed.
+        """
+        trace: Trace | None = self._trace
+        if trace is not None:
+            trace('Open Cell, (%d, %d)', row, column)
+        self._validate_coordinates(row, column)
+        self._clear_changes()
+        current_coordinate: tuple[int, int] = (row, column)
+        if self._is_first_time_open:
+            if trace is not None:
+                trace('Open Cell, _is_first_time_open = True')
+            self._put_mines(current_coordinate)
+            self._count_neighbour_mines_for_all_field()
+            self._is_first_time_open = False
+        self._open_cell(current_coordinate)
+        self._process_current_game_state()
+        return self._build_change_set()
+
+    def flag_cell(self, row: int, column: int) -> ChangeSet:
+        """Put or remove flag from the cell.
+
+        Args:
+            row (int): cell row number.
+            column (int): cell column number.
+
+        Raises:
+            NotImplementedError: raised if the engine doesn't flag the
+                cells.
+
+        Returns:
+            ChangeSet: the cell if its flag state was changed.
+        """
+        raise NotImplementedError
+
+    def _open_cell(self, coordinate: tuple[int, int]) -> None:
+        """Open cell.
+
+        Args:
+            coordinate (tuple[int, int]): coordinate of opening cell
+                as tuple[row, column]
+
+        Raises:
+            NotImplementedError: raised if the engine doesn't open the
+                cells.
+        """
+        raise NotImplementedError
+
+    def _put_mines(self, current_coordinate: tuple[int, int]) -> None:
+        """Put mines to the field.
+
+        Args:
+            current_coordinate (tuple[int, int]): coordinate of opening
+                cell as tuple[row, column].
+
+        Raises:
+            NotImplementedError: raised if the engine doesn't put the
+                mines.
+        """
+        raise NotImplementedError
+
+    def _count_neighbour_mines_for_all_field(self) -> None:
+        """Count mines for cells in the field.
+
+        Raises:
+            NotImplementedError: raised if the engine doesn't count the
+                mines.
+        """
+        raise NotImplementedError
+
+    def _finish_game(self, is_player_exploded: bool = False) -> None:
+        """Open all the cells and set result of the game.
+
+        Args:
+            is_player_exploded (bool, optional): shows of the player
+                status. Defaults to False.
+
+        Raises:
+            NotImplementedError: raised if the engine doesn't finish the
+                game.
+        """
+        raise NotImplementedError
+
+    def _sample_mine_indexes(self, skip_index: int) -> tuple[int, list[int]]:
+        """Sample indexes of the cells for the mines.
+
+        Args:
+            skip_index (int): index of the cell that can't have a mine.
+
+        Returns:
+            tuple[int, list[int]]: 1 and indexes of the mines, or 0 and
+                indexes of the safe cells if mines take more than a half
+                of the field.
+        """
+        number_of_mines: int = self._game_field.field_config.number_of_mines
+        number_of_eligible: int = self.rows * self.columns - 1
+        if number_of_mines * 2 <= number_of_eligible:
+            value: int = 1
+            number_to_sample: int = number_of_mines
+        else:
+            value = 0
+            number_to_sample = number_of_eligible - number_of_mines
+        if self._trace is not None:
+            self._trace('_sample_mine_indexes, sample: %d, value: %d',
+                        number_to_sample, value)
+        # indexes after the skipped cell are shifted by one
+        return value, [index + (index >= skip_index) for index
+                       in self._random.sample(range(number_of_eligible),
+                                              number_to_sample)]
+
+    def _get_neighbour_cells(self, row: int, column: int) -> FieldDict:
+        """Find and return all the neighbour cell to the passed coordinates.
+
+        Args:
+            row (int): row number.
+            column (int): column number.
+
+        Returns:
+            FieldDict: dictionary that represents field.
+        """
+        trace: Trace | None = self._trace
+        if trace is not None:
+            trace('_get_neighbour_cells. (%d, %d)', row, column)
+        board: BoardT = self._board
+        result_dictionary: FieldDict = {}
+        adjacency: Adjacency = self._get_adjacency()
+        for index in adjacency.neighbours_of(board.index(row, column)):
+            result_dictionary[board.coordinate(index)] = board.cell(index)
+        if trace is not None:
+            trace('_get_neighbour_cells. for (%d, %d), number of neighbours: '
+                  '%d', row, column, len(result_dictionary))
+        return result_dictionary
+
+    def _clear_changes(self) -> None:
+        """Forget the cells changed by the previous action."""
+        self._changed_indexes = []
+        self._old_states = bytearray()
+
+    def _record_change(self, index: int) -> None:
+        """Add the cell that the action is going to change.
+
+        It is called before the cell is changed, so its current state is
+        kept as the state before the action.
+
+        Args:
+            index (int): index of the cell.
+        """
+        self._changed_indexes.append(index)
+        self._old_states.append(self._board.packed_state(index))
+
+    def _record_changes(self, indexes: Sequence[int]) -> None:
+        """Add the cells that the action is going to change.
+
+        It is called before the cells are changed, so their current
+        states are kept as the states before the action.
+
+        Args:
+            indexes (Sequence[int]): indexes of the cells.
+        """
+        self._changed_indexes.extend(indexes)
+        self._old_states += self._board.packed_states(indexes)
+
+    def _build_change_set(self) -> ChangeSet:
+        """Build change set of the cells changed by the last action.
+
+        Returns:
+            ChangeSet: indexes and packed states of the changed cells
+                before and after the action.
+        """
+        indexes: list[int] = self._changed_indexes
+        if self._trace is not None:
+            self._trace('_build_change_set, changed: %d', len(indexes))
+        return ChangeSet(self.columns, indexes,
+                         self._board.packed_states(indexes),
+                         bytes(self._old_states))
+
+    def _get_adjacency(self) -> Adjacency:
+        """Return adjacency table of the field.
+
+        Returns:
+            Adjacency: table shared by the fields of the same size.
+        """
+        return get_adjacency(self.rows, self.columns)
+
+    def _validate_coordinates(self, row: int, column: int) -> None:
+        """Validate passed coordinates.
+
+        Args:
+            row (int): row number.
+            column (int): column number.
+
+        Raises:
+            IncorrectCoordinatesException: raised if the coordinates has
+                incorrect values.
+        """
+        is_valid_row: bool = 0 <= row < self.rows
+        is_valid_col: bool = 0 <= column < self.columns
+        if self._trace is not None:
+            self._trace('Validation of (%d, %d) - is_valid_row: %s, '
+                        'is_valid_col: %s', row, column,
+                        is_valid_row, is_valid_col)
+        if not is_valid_row or not is_valid_col:
+            raise IncorrectCoordinatesException('Coordinates are not valid')
+
+    def _process_current_game_state(self) -> None:
+        """Check if the game has finished state.
+
+        The game is finished when all the safe cells are opened. The
+        number of opened cells is maintained by the open operations, so
+        the check doesn't depend on the field size.
+        """
+        trace: Trace | None = self._trace
+        cells_left: int = self.number_of_cells_left
+        if trace is not None:
+            trace('_process_current_game_state, opened: %d, left: %d',
+                  self._opened_cells_number, cells_left)
+        if not self._is_game_finished and cells_left == 0:
+            if trace is not None:
+                trace('Game is Finished without flags')
+            self._finish_game(is_player_exploded=False)
@@ -0,0 +1,335 @@
+"""Module contains BitboardGameLogic class.
+
+The engine keeps mines, open and flag states as Python integer bit
+masks and computes numbers of mines and opened regions by shifting and
+masking the whole field at once.
+"""
+import copy
+import functools
+import itertools
+import logging
+import random
+
+from minesweeper_core.data.bitboard import (NEIGHBOUR_MINES_PLANES, Bitboard,
+                                            bits_from_bytes, bytes_from_bits)
+from minesweeper_core.data.board import FieldView
+from minesweeper_core.data.cell import FieldCell
+from minesweeper_core.data.change_set import ChangeSet
+from minesweeper_core.data.field import Field
+from minesweeper_core.logic.base_logic import BaseGameLogic
+
+log: logging.Logger = logging.getLogger(__name__)
+
+# Number of the field shapes which shift masks are kept in memory.
+SHIFT_MASKS_CACHE_SIZE: int = 8
+
+
+@functools.lru_cache(maxsize=SHIFT_MASKS_CACHE_SIZE)
+def get_shift_masks(rows: int, columns: int) -> tuple[int, int, int]:
+    """Return masks used to shift bits to the neighbour cells.
+
+    Args:
+        rows (int): number of rows.
+        columns (int): number of columns.
+
+    Returns:
+        tuple[int, int, int]: masks of all the cells, of the cells
+            without the first column and without the last column.
+    """
+    full: int = (1 << (rows * columns)) - 1
+    not_first_column: int = bits_from_bytes(
+        (b'\x00' + b'\x01' * (columns - 1)) * rows)
+    not_last_column: int = bits_from_bytes(
+        (b'\x01' * (columns - 1) + b'\x00') * rows)
+    return full, not_first_column, not_last_column
+
+
+def shift_to_neighbours(mask: int, rows: int, columns: int) -> list[int]:
+    """Return the mask shifted to each of eight neighbour directions.
+
+    Bit of the cell in the shifted mask moves to the neighbour cell in
+    the direction, bits that move outside of the field are dropped.
+
+    Args:
+        mask (int): bit mask of the cells.
+        rows (int): number of rows.
+        columns (int): number of columns.
+
+    Returns:
+        list[int]: eight shifted masks.
+    """
+    full, not_first_column, not_last_column = get_shift_masks(rows, columns)
+    east: int = (mask << 1) & not_first_column
+    west: int = (mask >> 1) & not_last_column
+    shifted: list[int] = [east, west]
+    for horizontal in (mask, east, west):
+        shifted.append(horizontal >> columns)
+        shifted.append((horizontal << columns) & full)
+    return shifted
+
+
+def dilate(mask: int, rows: int, columns: int) -> int:
+    """Return the mask extended by the neighbours of its cells.
+
+    Args:
+        mask (int): bit mask of the cells.
+        rows (int): number of rows.
+        columns (int): number of columns.
+
+    Returns:
+        int: mask of the cells and their neighbours.
+    """
+    for shifted in shift_to_neighbours(mask, rows, columns):
+        mask |= shifted
+    return mask
+
+
+def count_neighbour_mine_planes(mines: int, rows: int,
+                                columns: int) -> list[int]:
+    """Count mines around every cell of the field at once.
+
+    Eight shifted masks of the mines are summed by the bitwise adder,
+    so the result is the number of mines around every cell split into
+    the bit planes.
+
+    Args:
+        mines (int): bit mask of the mines.
+        rows (int): number of rows.
+        columns (int): number of columns.
+
+    Returns:
+        list[int]: NEIGHBOUR_MINES_PLANES masks, the plane number n
+            keeps the bit n of the number of mines.
+    """
+    planes: list[int] = [0] * NEIGHBOUR_MINES_PLANES
+    for carry in shift_to_neighbours(mines, rows, columns):
+        for plane_number in range(NEIGHBOUR_MINES_PLANES):
+            if not carry:
+                break
+            plane: int = planes[plane_number]
+            planes[plane_number] = plane ^ carry
+            carry &= plane
+    return planes
+
+
+def indexes_of(mask: int) -> list[int]:
+    """Return numbers of the set bits in ascending order.
+
+    Args:
+        mask (int): bit mask.
+
+    Returns:
+        list[int]: bit numbers.
+    """
+    if not mask:
+        return []
+    low: int = (mask & -mask).bit_length() - 1
+    high: int = mask.bit_length()
+    column: bytes = bytes_from_bits(mask >> low, high - low)
+    return list(itertools.compress(range(low, high), column))
+
+
+class BitboardGameLogic(BaseGameLogic[Bitboard]):
+    """Game logic that keeps the field state as bit masks.
+
+    Results of the actions are the same as the ones of GameLogic, but
+    counting mines and opening regions take a few operations over the
+    whole field masks, and the game could be cloned cheaply.
+    """
+
+    _logger: logging.Logger = log
+
+    @staticmethod
+    def _create_board(rows: int, columns: int) -> Bitboard:
+        """Create storage of the field cells state.
+
+        Args:
+            rows (int): number of rows.
+            columns (int): number of columns.
+
+        Returns:
+            Bitboard: board with closed and empty cells.
+        """
+        return Bitboard(rows, columns)
+
+    def clone(self) -> 'BitboardGameLogic':
+        """Return independent copy of the game.
+
+        Copy has the same field, counters and state of the random
+        generator, so the same actions give the same results.
+
+        Returns:
+            BitboardGameLogic: copy of the game.
+        """
+        game: BitboardGameLogic = copy.copy(self)
+        game._board = self._board.copy()
+        game._game_field = Field(self._game_field.field_config,
+                                 FieldView(game._board))
+        game._clear_changes()
+        game._random = random.Random()
+        game._random.setstate(self._random.getstate())
+        return game
+
+    def flag_cell(self, row: int, column: int) -> ChangeSet:
+        """Put or remove flag from the cell.
+
+        Args:
+            row (int): cell row number.
+            column (int): cell column number.
+
+        Returns:
+            ChangeSet: the cell if its flag state was changed.
+        """
+        if self._trace is not None:
+            self._trace('flag_cell, (%d, %d)', row, column)
+        self._validate_coordinates(row, column)
+        self._clear_changes()
+        board: Bitboard = self._board
+        index: int = board.index(row, column)
+        bit: int = 1 << index
+        if board.flags & bit:
+            self._record_change(index)
+            board.flags &= ~bit
+            self._flags_number += 1
+            self._placed_flags_number -= 1
+        elif self._flags_number > 0 and not board.opened & bit:
+            self._record_change(index)
+            board.flags |= bit
+            self._flags_number -= 1
+            self._placed_flags_number += 1
+        return self._build_change_set()
+
+    def _open_cell(self, coordinate: tuple[int, int]) -> None:
+        """Open cell.
+
+        Args:
+            coordinate (tuple[int, int]): coordinate of opening cell
+                as tuple[row, column]
+        """
+        board: Bitboard = self._board
+        index: int = board.index(*coordinate)
+        bit: int = 1 << index
+        if board.mines & bit:
+            self._finish_game(is_player_exploded=True)
+        elif board.flags & bit:
+            self._record_change(index)
+            board.flags &= ~bit
+            self._placed_flags_number -= 1
+        elif board.opened & bit:
+            log.warning('Try of open already opened cell, %s', coordinate)
+        else:
+            self._open_this_and_neighbour_cells(coordinate)
+
+    def _put_mines(self, current_coordinate: tuple[int, int]) -> None:
+        """Put mines to the field.
+
+        Mines are sampled in the same way as by GameLogic, so the same
+        seed gives the same field.
+
+        Args:
+            current_coordinate (tuple[int, int]): coordinate of opening
+                cell as tuple[row, column].
+        """
+        if self._trace is not None:
+            self._trace('_put_mines, skip coordinate: %s', current_coordinate)
+        board: Bitboard = self._board
+        skip_index: int = board.index(*current_coordinate)
+        value, indexes = self._sample_mine_indexes(skip_index)
+        column: bytearray = bytearray(board.size)
+        for index in indexes:
+            column[index] = 1
+        sampled: int = bits_from_bytes(column)
+        if value:
+            board.mines = sampled
+        else:
+            board.mines = board.full_mask & ~sampled & ~(1 << skip_index)
+
+    def _count_neighbour_mines_for_all_field(self) -> None:
+        """Count mines for cells in the field by the shifted masks."""
+        if self._trace is not None:
+            self._trace('_count_neighbour_mines_for_all_field')
+        board: Bitboard = self._board
+        board.neighbour_mines_planes = count_neighbour_mine_planes(
+            board.mines, board.rows, board.columns)
+
+    def _finish_game(self, is_player_exploded: bool = False) -> None:
+        """Open all the cells and set result of the game.
+
+        Args:
+            is_player_exploded (bool, optional): shows of the player
+                status. Defaults to False.
+        """
+        if self._trace is not None:
+            self._trace('_finish_game, is_player_win: %s', is_player_exploded)
+        board: Bitboard = self._board
+        self._record_changes(indexes_of(board.full_mask & ~board.opened))
+        board.opened = board.full_mask
+        self._is_game_finished = True
+        self._is_player_win = not is_player_exploded
+        if self._is_player_win:
+            board.flags |= board.mines
+            self._placed_flags_number = board.flags.bit_count()
+
+    def _open_this_and_neighbour_cells(self,
+                                       coordinate: tuple[int, int]
+                                       ) -> list[int]:
+        """Open current and neighbour cells.
+
+        The region of the cells without mines around is grown from the
+        passed cell by dilating its frontier until it stops changing,
+        then the region and its closed neighbours are opened at once.
+        Opened cells are added to the changes of the action.
+
+        Args:
+            coordinate (tuple[int, int]): current cell coordinate.
+
+        Returns:
+            list[int]: indexes of the cells that were opened.
+        """
+        if self._trace is not None:
+            self._trace('_open_this_and_neighbour_cells, coordinate: %s',
+                        coordinate)
+        board: Bitboard = self._board
+        rows: int = board.rows
+        columns: int = board.columns
+        start_index: int = board.index(*coordinate)
+        start: int = 1 << start_index
+        counted: int = 0
+        for plane in board.neighbour_mines_planes:
+            counted |= plane
+        if counted & start:
+            if board.opened & start:
+                return []
+            self._record_change(start_index)
+            board.opened |= start
+            if not board.mines & start:
+                self._opened_cells_number += 1
+            return [start_index]
+        closed: int = board.full_mask & ~(board.mines | board.opened
+                                          | board.flags)
+        if not closed & start:
+            return []
+        empty: int = closed & ~counted
+        region: int = start
+        frontier: int = start
+        while frontier:
+            frontier = dilate(frontier, rows, columns) & empty & ~region
+            region |= frontier
+        region = dilate(region, rows, columns) & closed
+        revealed: list[int] = indexes_of(region)
+        self._record_changes(revealed)
+        board.opened |= region
+        self._opened_cells_number += len(revealed)
+        return revealed
+
+    def _count_neighbour_mines_for_cell(self, cell: FieldCell) -> None:
+        """Find and count mines around passed cell.
+
+        Args:
+            cell (FieldCell): current cell that is processing.
+        """
+        board: Bitboard = self._board
+        index: int = board.index(cell.row, cell.column)
+        cell.neighbour_mines = sum(
+            (board.mines >> neighbour) & 1
+            for neighbour in self._get_adjacency().neighbours_of(index))
@@ -0,0 +1,96 @@
+"""Module contains functions to count neighbour mines of the whole field.
+
+NumPy is an optional dependency. If it is installed, the counts are
+calculated by the sum of the shifted slices of the padded field,
+otherwise the pure Python implementation is used.
+"""
+import logging
+
+try:
+    import numpy
+    NUMPY_AVAILABLE: bool = True
+except ImportError:  # pragma: no cover - depends on the environment
+    NUMPY_AVAILABLE = False
+
+log: logging.Logger = logging.getLogger(__name__)
+
+
+def count_neighbour_mines(mines: bytes | bytearray,
+                          rows: int, columns: int) -> bytes:
+    """Count mines around every cell of the field.
+
+    Args:
+        mines (bytes | bytearray): row-major field with 1 for the cells
+            that have a mine and 0 for the others.
+        rows (int): number of rows.
+        columns (int): number of columns.
+
+    Returns:
+        bytes: row-major number of mines around every cell.
+    """
+    log.debug('count_neighbour_mines, rows: %d, columns: %d, numpy: %s',
+              rows, columns, NUMPY_AVAILABLE)
+    if NUMPY_AVAILABLE:
+        return count_neighbour_mines_numpy(mines, rows, columns)
+    return count_neighbour_mines_python(mines, rows, columns)
+
+
+def count_neighbour_mines_numpy(mines: bytes | bytearray,
+                                rows: int, columns: int) -> bytes:
+    """Count mines around every cell with NumPy.
+
+    The field is padded by one empty cell on each side and the counts
+    are the sum of the eight slices shifted to the neighbour positions.
+
+    Args:
+        mines (bytes | bytearray): row-major field of the mines.
+        rows (int): number of rows.
+        columns (int): number of columns.
+
+    Returns:
+        bytes: row-major number of mines around every cell.
+    """
+    grid = numpy.frombuffer(mines, dtype=numpy.uint8).reshape(rows, columns)
+    padded = numpy.pad(grid, 1)
+    counts = numpy.zeros((rows, columns), dtype=numpy.uint8)
+    for row_shift in range(3):
+        for column_shift in range(3):
+            if row_shift != 1 or column_shift != 1:
+                counts += padded[row_shift:row_shift + rows,
+                                 column_shift:column_shift + columns]
+    return counts.tobytes()
+
+
+def count_neighbour_mines_python(mines: bytes | bytearray,
+                                 rows: int, columns: int) -> bytes:
+    """Count mines around every cell with Python integers.
+
+    The field is read as one little-endian integer where every byte is
+    a cell. Shifting it by one byte moves cells to the left or right
+    neighbour and shifting it by one row moves cells to the top or
+    bottom neighbour, so the sum of shifted values is the number of
+    mines around every cell. Counts never exceed 8, so bytes don't
+    overflow into each other.
+
+    Args:
+        mines (bytes | bytearray): row-major field of the mines.
+        rows (int): number of rows.
+        columns (int): number of columns.
+
+    Returns:
+        bytes: row-major number of mines around every cell.
+    """
+    size: int = rows * columns
+    row_shift: int = columns * 8
+    field_mask: int = (1 << (size * 8)) - 1
+    not_first_column: int = int.from_bytes(
+        (b'\x00' + b'\xff' * (columns - 1)) * rows, 'little')
+    not_last_column: int = int.from_bytes(
+        (b'\xff' * (columns - 1) + b'\x00') * rows, 'little')
+    grid: int = int.from_bytes(mines, 'little')
+    horizontal: int = (grid
+                       + ((grid << 8) & not_first_column)
+                       + ((grid >> 8) & not_last_column))
+    vertical: int = (horizontal << row_shift) + (horizontal >> row_shift)
+    counts: int = (horizontal + vertical - grid) & field_mask
+    return counts.to_bytes(size, 'little')
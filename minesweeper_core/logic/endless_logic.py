@@ -0,0 +1,475 @@
+"""Module contains EndlessGameLogic class.
+
+Field of the endless game has no bounds. It is split into square chunks
+addressed by (row // chunk_size, column // chunk_size), mines of every
+chunk are generated from the seed of the game and the coordinate of the
+chunk, so the chunk is the same whenever it is generated. Chunks are
+created when their cells are opened, flagged or read, and are kept by
+the ChunkStore, so memory depends on the explored area.
+"""
+import logging
+import pathlib
+import random
+from collections import OrderedDict, deque
+
+import minesweeper_core.logic.counting as counting
+from minesweeper_core.data.board import Board
+from minesweeper_core.data.cell import Cell, FieldCell
+from minesweeper_core.data.chunk_store import (DEFAULT_CAPACITY,
+                                               ChunkCoordinate, ChunkStore)
+from minesweeper_core.data.field_configuration import EndlessConfiguration
+from minesweeper_core.logic.base_logic import FieldDict
+from minesweeper_core.logic.exceptions import IncorrectCoordinatesException
+
+log: logging.Logger = logging.getLogger(__name__)
+
+# Coordinates are limited to keep the names of the spilled chunks and
+# the seeds of the chunks short.
+MAX_COORDINATE: int = 2 ** 31
+
+# Opening of the zero cell opens its region only within this distance
+# (in cells) from the opened cell, as regions of the sparse endless
+# field could be endless too. Zero cells on the edge stay closed, so
+# opening them continues the region.
+MAX_REVEAL_DISTANCE: int = 64
+
+# Offsets of the neighbour cells.
+_NEIGHBOUR_OFFSETS: tuple[tuple[int, int], ...] = tuple(
+    (row, column) for row in (-1, 0, 1) for column in (-1, 0, 1)
+    if row or column)
+
+
+class EndlessGameLogic:
+    """Logic of the endless game with the chunked field.
+
+    Opening and flagging of cells works as in GameLogic: the first open
+    is safe (the cell and its neighbours never have mines), opening of
+    the flagged cell removes the flag, opening of the mine finishes the
+    game and the next actions change nothing. The game can't be won and
+    flags are not limited.
+
+    Actions return FieldDict instead of the ChangeSet of GameLogic, as
+    the ChangeSet addresses cells by the index row * columns + column
+    of the bounded field, and the endless field has no number of
+    columns and has negative coordinates.
+    """
+
+    def __init__(self,
+                 game_config: EndlessConfiguration = EndlessConfiguration(),
+                 rng: random.Random | int | None = None,
+                 max_chunks: int = DEFAULT_CAPACITY,
+                 spill_directory: str | pathlib.Path | None = None) -> None:
+        """Initialize EndlessGameLogic with the passed configuration.
+
+        Args:
+            game_config (EndlessConfiguration, optional): configuration
+                of the game. Defaults to EndlessConfiguration().
+            rng (random.Random | int | None, optional): random generator
+                or seed used to choose seeds of the games. Passing the
+                same seed generates the same field. Defaults to None.
+            max_chunks (int, optional): number of chunks kept in
+                memory. Defaults to DEFAULT_CAPACITY.
+            spill_directory (str | pathlib.Path | None, optional):
+                directory for the chunks evicted from memory. Defaults
+                to the temporary directory.
+        """
+        log.debug('Initializing endless game, config: %s', game_config)
+        if isinstance(rng, random.Random):
+            self._random: random.Random = rng
+        else:
+            self._random = random.Random(rng)
+        self._config: EndlessConfiguration = game_config
+        self._size: int = game_config.chunk_size
+        self._mines_per_chunk: int = round(
+            game_config.mine_density * self._size * self._size)
+        self._mine_layers: OrderedDict[ChunkCoordinate, bytes] = (
+            OrderedDict())
+        self._max_mine_layers: int = max(9, 2 * max_chunks)
+        self._store: ChunkStore = ChunkStore(self._create_chunk, max_chunks,
+                                             spill_directory)
+        self._init_game_state()
+
+    def _init_game_state(self) -> None:
+        """Set seed, state flags and counters of the not started game."""
+        self._seed: int = self._random.getrandbits(64)
+        self._safe_cell: tuple[int, int] | None = None
+        self._is_game_finished: bool = False
+        self._opened_cells_number: int = 0
+        self._placed_flags_number: int = 0
+        self._mine_layers.clear()
+        self._store.clear()
+
+    def reset(self) -> None:
+        """Start the new game with the next seed."""
+        log.debug('reset')
+        self._init_game_state()
+
+    def close(self) -> None:
+        """Remove the spilled chunks and their temporary directory."""
+        self._store.close()
+
+    @property
+    def config(self) -> EndlessConfiguration:
+        """Return configuration of the game.
+
+        Returns:
+            EndlessConfiguration: configuration.
+        """
+        return self._config
+
+    @property
+    def seed(self) -> int:
+        """Return seed of the field.
+
+        Returns:
+            int: seed.
+        """
+        return self._seed
+
+    @property
+    def number_of_opened_cells(self) -> int:
+        """Return number of the opened cells without mines.
+
+        Returns:
+            int: number of opened cells.
+        """
+        return self._opened_cells_number
+
+    @property
+    def number_of_placed_flags(self) -> int:
+        """Return number of flags placed on the field.
+
+        Returns:
+            int: number of placed flags.
+        """
+        return self._placed_flags_number
+
+    @property
+    def is_game_finished(self) -> bool:
+        """Return status of the game.
+
+        Returns:
+            bool: True if the mine was opened.
+        """
+        return self._is_game_finished
+
+    @property
+    def is_player_win(self) -> bool:
+        """Return result of the game, the endless game can't be won.
+
+        Returns:
+            bool: always False.
+        """
+        return False
+
+    @property
+    def number_of_chunks(self) -> int:
+        """Return number of chunks in memory.
+
+        Returns:
+            int: number of chunks.
+        """
+        return len(self._store)
+
+    @property
+    def number_of_spilled_chunks(self) -> int:
+        """Return number of chunks evicted to the files.
+
+        Returns:
+            int: number of chunks.
+        """
+        return self._store.number_of_spilled_chunks
+
+    def open_cell(self, row: int, column: int) -> FieldDict:
+        """Open cell by coordinates.
+
+        The first open makes the cell and its neighbours safe, opening
+        of the cell without mines around opens its region.
+
+        Args:
+            row (int): cell row number.
+            column (int): cell column number.
+
+        Returns:
+            FieldDict: snapshots of the cells whose open or flag state
+                was changed, empty if the game is finished.
+        """
+        log.debug('open_cell, (%d, %d)', row, column)
+        self._validate_coordinates(row, column)
+        if self._is_game_finished:
+            log.warning('Try of open cell of finished game, %s',
+                        (row, column))
+            return {}
+        if self._safe_cell is None:
+            self._safe_cell = (row, column)
+            self._mine_layers.clear()
+            self._store.refresh()
+        chunk, index = self._locate(row, column)
+        changed: list[tuple[int, int]] = []
+        if chunk.mines[index]:
+            chunk.opened[index] = 1
+            self._is_game_finished = True
+            changed.append((row, column))
+        elif chunk.flags[index]:
+            chunk.flags[index] = 0
+            self._placed_flags_number -= 1
+            changed.append((row, column))
+        elif chunk.opened[index]:
+            log.warning('Try of open already opened cell, %s', (row, column))
+        elif chunk.neighbour_mines[index]:
+            chunk.opened[index] = 1
+            self._opened_cells_number += 1
+            changed.append((row, column))
+        else:
+            changed = self._open_region(row, column)
+        result: FieldDict = self._snapshot(changed)
+        self._store.trim()
+        return result
+
+    def flag_cell(self, row: int, column: int) -> FieldDict:
+        """Put or remove flag from the closed cell.
+
+        Args:
+            row (int): cell row number.
+            column (int): cell column number.
+
+        Returns:
+            FieldDict: snapshot of the cell if its flag state was
+                changed, empty if the game is finished.
+        """
+        log.debug('flag_cell, (%d, %d)', row, column)
+        self._validate_coordinates(row, column)
+        if self._is_game_finished:
+            log.warning('Try of flag cell of finished game, %s',
+                        (row, column))
+            return {}
+        chunk, index = self._locate(row, column)
+        changed: list[tuple[int, int]] = []
+        if chunk.flags[index]:
+            chunk.flags[index] = 0
+            self._placed_flags_number -= 1
+            changed.append((row, column))
+        elif not chunk.opened[index]:
+            chunk.flags[index] = 1
+            self._placed_flags_number += 1
+            changed.append((row, column))
+        result: FieldDict = self._snapshot(changed)
+        self._store.trim()
+        return result
+
+    def cell(self, row: int, column: int) -> FieldCell:
+        """Return snapshot of the cell.
+
+        Args:
+            row (int): cell row number.
+            column (int): cell column number.
+
+        Returns:
+            FieldCell: snapshot of the cell.
+        """
+        self._validate_coordinates(row, column)
+        result: FieldCell = self._snapshot([(row, column)])[(row, column)]
+        self._store.trim()
+        return result
+
+    def packed_states(self, top: int, left: int, rows: int,
+                      columns: int) -> bytes:
+        """Return state of the area packed into one byte per cell.
+
+        Bits of the state are the same as the ones of FieldView.
+        Chunks that were not created are not created for reading, their
+        cells are returned as closed cells without mine and number bits.
+
+        Args:
+            top (int): row of the top left cell.
+            left (int): column of the top left cell.
+            rows (int): number of rows of the area.
+            columns (int): number of columns of the area.
+
+        Returns:
+            bytes: row-major packed states of the area.
+        """
+        size: int = self._size
+        result: bytearray = bytearray(rows * columns)
+        for chunk_row in range(top // size, (top + rows - 1) // size + 1):
+            for chunk_column in range(left // size,
+                                      (left + columns - 1) // size + 1):
+                coordinate: ChunkCoordinate = (chunk_row, chunk_column)
+                if coordinate not in self._store:
+                    continue
+                packed: bytes = self._store.get(coordinate).pack()
+                chunk_top: int = chunk_row * size
+                chunk_left: int = chunk_column * size
+                first_column: int = max(left, chunk_left)
+                stop_column: int = min(left + columns, chunk_left + size)
+                for row in range(max(top, chunk_top),
+                                 min(top + rows, chunk_top + size)):
+                    source: int = (row - chunk_top) * size - chunk_left
+                    target: int = (row - top) * columns - left
+                    result[target + first_column:target + stop_column] = (
+                        packed[source + first_column:source + stop_column])
+        self._store.trim()
+        return bytes(result)
+
+    def _open_region(self, row: int, column: int) -> list[tuple[int, int]]:
+        """Open the zero cell and its region within the reveal distance.
+
+        Args:
+            row (int): row of the zero cell.
+            column (int): column of the zero cell.
+
+        Returns:
+            list[tuple[int, int]]: coordinates of the opened cells.
+        """
+        log.debug('_open_region, (%d, %d)', row, column)
+        chunk, index = self._locate(row, column)
+        chunk.opened[index] = 1
+        revealed: list[tuple[int, int]] = [(row, column)]
+        queue: deque[tuple[int, int]] = deque(revealed)
+        while queue:
+            current_row, current_column = queue.popleft()
+            for row_offset, column_offset in _NEIGHBOUR_OFFSETS:
+                neighbour_row: int = current_row + row_offset
+                neighbour_column: int = current_column + column_offset
+                chunk, index = self._locate(neighbour_row, neighbour_column)
+                if chunk.mines[index] or chunk.opened[index] \
+                        or chunk.flags[index]:
+                    continue
+                is_zero: bool = chunk.neighbour_mines[index] == 0
+                distance: int = max(abs(neighbour_row - row),
+                                    abs(neighbour_column - column))
+                if is_zero and distance >= MAX_REVEAL_DISTANCE:
+                    continue
+                chunk.opened[index] = 1
+                revealed.append((neighbour_row, neighbour_column))
+                if is_zero:
+                    queue.append((neighbour_row, neighbour_column))
+        self._opened_cells_number += len(revealed)
+        return revealed
+
+    def _locate(self, row: int, column: int) -> tuple[Board, int]:
+        """Return the chunk of the cell and index of the cell in it.
+
+        Args:
+            row (int): cell row number.
+            column (int): cell column number.
+
+        Returns:
+            tuple[Board, int]: chunk and index of the cell.
+        """
+        size: int = self._size
+        chunk_row, local_row = divmod(row, size)
+        chunk_column, local_column = divmod(column, size)
+        return (self._store.get((chunk_row, chunk_column)),
+                local_row * size + local_column)
+
+    def _snapshot(self, coordinates: list[tuple[int, int]]) -> FieldDict:
+        """Return snapshots of the cells.
+
+        Args:
+            coordinates (list[tuple[int, int]]): coordinates of the cells.
+
+        Returns:
+            FieldDict: snapshots by coordinates.
+        """
+        result: FieldDict = {}
+        for row, column in coordinates:
+            chunk, index = self._locate(row, column)
+            result[(row, column)] = Cell(
+                row=row, column=column,
+                neighbour_mines=chunk.neighbour_mines[index],
+                is_open=chunk.opened[index] == 1,
+                has_mine=chunk.mines[index] == 1,
+                has_flag=chunk.flags[index] == 1)
+        return result
+
+    def _mine_layer(self, coordinate: ChunkCoordinate) -> bytes:
+        """Return mines of the chunk generated from the seed.
+
+        Cells around the first opened cell never have mines. Layers are
+        cached, as every chunk needs layers of its neighbours to count
+        mines around its edge cells.
+
+        Args:
+            coordinate (ChunkCoordinate): coordinate of the chunk.
+
+        Returns:
+            bytes: row-major mines of the chunk.
+        """
+        layer: bytes | None = self._mine_layers.get(coordinate)
+        if layer is not None:
+            self._mine_layers.move_to_end(coordinate)
+            return layer
+        size: int = self._size
+        chunk_row, chunk_column = coordinate
+        generator: random.Random = random.Random(
+            f'{self._seed}:{chunk_row}:{chunk_column}')
+        mines: bytearray = bytearray(size * size)
+        for index in generator.sample(range(size * size),
+                                      self._mines_per_chunk):
+            mines[index] = 1
+        if self._safe_cell is not None:
+            safe_row, safe_column = self._safe_cell
+            for row in range(safe_row - 1, safe_row + 2):
+                for column in range(safe_column - 1, safe_column + 2):
+                    if (row // size, column // size) == coordinate:
+                        mines[(row % size) * size + column % size] = 0
+        layer = bytes(mines)
+        self._mine_layers[coordinate] = layer
+        if len(self._mine_layers) > self._max_mine_layers:
+            self._mine_layers.popitem(last=False)
+        return layer
+
+    def _create_chunk(self, coordinate: ChunkCoordinate) -> Board:
+        """Create the chunk with mines and numbers of mines around cells.
+
+        Mines are counted over the chunk padded by one cell of the
+        neighbour chunks, so the numbers of the edge cells are correct.
+
+        Args:
+            coordinate (ChunkCoordinate): coordinate of the chunk.
+
+        Returns:
+            Board: created chunk.
+        """
+        size: int = self._size
+        padded_size: int = size + 2
+        chunk_row, chunk_column = coordinate
+        layers: dict[tuple[int, int], bytes] = {
+            (row_offset, column_offset): self._mine_layer(
+                (chunk_row + row_offset, chunk_column + column_offset))
+            for row_offset in (-1, 0, 1) for column_offset in (-1, 0, 1)}
+        padded: bytearray = bytearray()
+        for row in range(-1, size + 1):
+            row_offset, local_row = divmod(row, size)
+            start: int = local_row * size
+            west: bytes = layers[(row_offset, -1)]
+            middle: bytes = layers[(row_offset, 0)]
+            east: bytes = layers[(row_offset, 1)]
+            padded.append(west[start + size - 1])
+            padded += middle[start:start + size]
+            padded.append(east[start])
+        counts: bytes = counting.count_neighbour_mines(
+            padded, padded_size, padded_size)
+        chunk: Board = Board(size, size)
+        chunk.mines[:] = layers[(0, 0)]
+        for row in range(size):
+            start = (row + 1) * padded_size + 1
+            chunk.neighbour_mines[row * size:(row + 1) * size] = (
+                counts[start:start + size])
+        return chunk
+
+    def _validate_coordinates(self, row: int, column: int) -> None:
+        """Validate passed coordinates.
+
+        Args:
+            row (int): row number.
+            column (int): column number.
+
+        Raises:
+            IncorrectCoordinatesException: raised if the coordinates are
+                too far from the origin.
+        """
+        if not (-MAX_COORDINATE <= row < MAX_COORDINATE
+                and -MAX_COORDINATE <= column < MAX_COORDINATE):
+            raise IncorrectCoordinatesException('Coordinates are not valid')
@@ -0,0 +1,92 @@
+"""Module contains registry of the game engines.
+
+Every engine is a BaseGameLogic subclass with the same public interface,
+so the controller, UI and tests could work with any of them. The engine
+is chosen by its name, passed explicitly or by the MINESWEEPER_ENGINE
+environment variable.
+"""
+import logging
+import os
+
+from minesweeper_core.logic.base_logic import BaseGameLogic
+from minesweeper_core.logic.bitboard_logic import BitboardGameLogic
+from minesweeper_core.logic.exceptions import UnknownEngineException
+from minesweeper_core.logic.game_logic import GameLogic
+from minesweeper_core.logic.numpy_logic import NUMPY_AVAILABLE, NumpyGameLogic
+from minesweeper_core.logic.reference_logic import ReferenceGameLogic
+
+log: logging.Logger = logging.getLogger(__name__)
+
+# Name of the environment variable with the name of the engine.
+ENGINE_ENVIRONMENT_VARIABLE: str = 'MINESWEEPER_ENGINE'
+
+ENGINE_REFERENCE: str = 'reference'
+ENGINE_ARRAY: str = 'array'
+ENGINE_NUMPY: str = 'numpy'
+ENGINE_BITBOARD: str = 'bitboard'
+
+DEFAULT_ENGINE: str = ENGINE_ARRAY
+
+_ENGINES: dict[str, type[BaseGameLogic]] = {}
+
+
+def register_engine(name: str, engine: type[BaseGameLogic]) -> None:
+    """Register the engine by the name.
+
+    Engine registered with the existing name replaces the previous one.
+
+    Args:
+        name (str): name of the engine.
+        engine (type[BaseGameLogic]): engine class.
+    """
+    log.debug('register_engine, name: %s, engine: %s', name, engine)
+    _ENGINES[name] = engine
+
+
+def get_engine(name: str) -> type[BaseGameLogic]:
+    """Return the engine registered by the name.
+
+    Args:
+        name (str): name of the engine.
+
+    Raises:
+        UnknownEngineException: raised if the engine is not registered.
+
+    Returns:
+        type[BaseGameLogic]: engine class.
+    """
+    if name not in _ENGINES:
+        raise UnknownEngineException(
+            f'Unknown engine: {name}, available: {available_engines()}')
+    return _ENGINES[name]
+
+
+def available_engines() -> list[str]:
+    """Return names of the registered engines.
+
+    Returns:
+        list[str]: names of the engines.
+    """
+    return list(_ENGINES)
+
+
+def get_engine_name(name: str | None = None) -> str:
+    """Return name of the engine that should be used.
+
+    Args:
+        name (str | None, optional): explicitly chosen name. Defaults
+            to the value of the environment variable or DEFAULT_ENGINE.
+
+    Returns:
+        str: name of the engine.
+    """
+    if name is None:
+        name = os.environ.get(ENGINE_ENVIRONMENT_VARIABLE) or DEFAULT_ENGINE
+    return name
+
+
+register_engine(ENGINE_REFERENCE, ReferenceGameLogic)
+register_engine(ENGINE_ARRAY, GameLogic)
+if NUMPY_AVAILABLE:
+    register_engine(ENGINE_NUMPY, NumpyGameLogic)
+register_engine(ENGINE_BITBOARD, BitboardGameLogic)
@@ -1,4 +1,4 @@
-"""Module contains IncorrectCoordinatesException class."""
+"""Module contains exceptions of the game logic."""
 
 
 class IncorrectCoordinatesException(Exception):
@@ -11,3 +11,27 @@ class IncorrectCoordinatesException(Exception):
             message (str): Message description of the problem.
         """
         Exception.__init__(self, message)
+
+
+class UnknownEngineException(Exception):
+    """Exception raised for the name of the not registered game engine."""
+
+    def __init__(self, message: str) -> None:
+        """Initialize default exception with a message.
+
+        Args:
+            message (str): Message description of the problem.
+        """
+        Exception.__init__(self, message)
+
+
+class IncorrectSaveException(Exception):
+    """Exception raised for the data that is not a valid saved game."""
+
+    def __init__(self, message: str) -> None:
+        """Initialize default exception with a message.
+
+        Args:
+            message (str): Message description of the problem.
+        """
+        Exception.__init__(self, message)
@@ -1,151 +1,54 @@
 """Module contains GameLogic class."""
+import itertools
 import logging
-import random
-
-import minesweeper_core.logic.utils as utils
-from minesweeper_core.data.cell import Cell
-from minesweeper_core.data.field import Field
-from minesweeper_core.data.field_configuration import Configuration
-from minesweeper_core.logic.exceptions import IncorrectCoordinatesException
+from collections import deque
+
+import minesweeper_core.logic.counting as counting
+from minesweeper_core.data.board import Board
+from minesweeper_core.data.cell import FieldCell
+from minesweeper_core.data.change_set import ChangeSet
+from minesweeper_core.logic.adjacency import Adjacency
+from minesweeper_core.logic.base_logic import BaseGameLogic
+from minesweeper_core.logic.regions import (MAX_LABELLED_MINE_DENSITY,
+                                            ZeroRegions, label_zero_regions)
+from minesweeper_core.logic.tracing import Trace
 
 log: logging.Logger = logging.getLogger(__name__)
 
-FieldDict = dict[tuple[int, int], Cell]
-
-
-class GameLogic:
-    """Class encapsulates logic of the game."""
-
-    def __init__(self, game_config: Configuration) -> None:
-        """Initialize GameLogic with the passed configuration.
-
-        Args:
-            game_config (Configuration): configuration contains
-                parameters of the game session as size of field and
-                number of mines.
-        """
-        log.debug('Initializing game')
-        self._game_field: Field = Field(game_config, {})
-        self._is_first_time_open = True
-        self._is_game_finished = False
-        self._is_player_win = False
-        self._flags_number = game_config.number_of_mines
-        self._init_field()
-        log.debug('field: %s, first_time: %s, finished: %s, win: %s',
-                  self._game_field,
-                  self._is_first_time_open,
-                  self.is_game_finished,
-                  self.is_player_win)
-
-    def _init_field(self) -> None:
-        """Initialize field with default values."""
-        rows: int = self.rows
-        cols: int = self.columns
-        for row in range(rows):
-            for col in range(cols):
-                coordinate: tuple[int, int] = (row, col)
-                cell: Cell = Cell(row, col)
-                self.field[coordinate] = cell
-        log.debug('Field inited with - rows: %d, cols: %d, total: %d',
-                  rows, cols, len(self.field))
-
-    @property
-    def rows(self) -> int:
-        """Return number of rows.
-
-        Returns:
-            int: number of rows.
-        """
-        return self._game_field.field_config.number_of_rows
-
-    @property
-    def columns(self) -> int:
-        """Return number of columns.
-
-        Returns:
-            int: number of columns.
-        """
-        return self._game_field.field_config.number_of_columns
-
-    @property
-    def field(self) -> FieldDict:
-        """Return field.
+# Translation table that turns 0 to 1 and any other byte to 0.
+_INVERT_TABLE: bytes = b'\x01' + b'\x00' * 255
 
-        Returns:
-            FieldDict: current field.
-        """
-        return self._game_field.field_cells
 
-    @property
-    def number_of_mines(self) -> int:
-        """Return number of mines.
+class GameLogic(BaseGameLogic[Board]):
+    """Class encapsulates logic of the game.
 
-        Returns:
-            int: number of mines.
-        """
-        return self._game_field.field_config.number_of_mines
+    It is the array engine: cells are kept in the byte columns of the
+    Board, regions are opened by the labels made at the first reveal of
+    a zero cell.
+    """
 
-    @property
-    def number_of_flags(self) -> int:
-        """Return number of available flags.
+    _logger: logging.Logger = log
 
-        Returns:
-            int: number of flags.
-        """
-        return self._flags_number
-
-    @property
-    def is_game_finished(self) -> bool:
-        """Return game state status.
-
-        If game is finished - True will be returned.
-        False will be return if game still alive.
-
-        Returns:
-            bool: finished game status.
-        """
-        return self._is_game_finished
+    @staticmethod
+    def _create_board(rows: int, columns: int) -> Board:
+        """Create storage of the field cells state.
 
-    @property
-    def is_player_win(self) -> bool:
-        """Return status of the player in the game.
-
-        If player has not opened cell with bomb/mine, then player status
-        will be True (is_player_win will return True).
-        If player exploded - value will be False.
+        Args:
+            rows (int): number of rows.
+            columns (int): number of columns.
 
         Returns:
-            bool: player win status.
+            Board: board with closed and empty cells.
         """
-        return self._is_player_win
+        return Board(rows, columns)
 
-    def open_cell(self, row: int, column: int) -> None:
-        """Open cell by coordinates.
+    def _init_game_state(self) -> None:
+        """Set state flags and counters of the not started game."""
+        super()._init_game_state()
+        self._zero_regions: ZeroRegions | None = None
+        self._is_field_labelled: bool = False
 
-        Cell with coordinates (row, column) will be opened and status of
-        the game will be reprocessed.
-        After opening the cell, game will check if game is not finished
-        and neighbour cells will be opened also if conditions are valid
-        for it.
-        For first open time - mines will be set to random cells
-        excluding current cell coordinates.
-
-        Args:
-            row (int): cell row number.
-            column (int): cell column number.
-        """
-        log.debug('Open Cell, (%d, %d)', row, column)
-        self._validate_coordinates(row, column)
-        current_coordinate: tuple[int, int] = (row, column)
-        if self._is_first_time_open:
-            log.debug('Open Cell, _is_first_time_open = True')
-            self._put_mines(current_coordinate)
-            self._count_neighbour_mines_for_all_field()
-            self._is_first_time_open = False
-        self._open_cell(current_coordinate)
-        self._process_current_game_state()
-
-    def flag_cell(self, row: int, column: int) -> None:
+    def flag_cell(self, row: int, column: int) -> ChangeSet:
         """Put or remove flag from the cell.
 
         If cell is not open (already) and doesn't have a flag - method
@@ -156,20 +59,34 @@ class GameLogic:
         Args:
             row (int): cell row number.
             column (int): cell column number.
+
+        Returns:
+            ChangeSet: the cell if its flag state was changed.
         """
-        log.debug('flag_cell, (%d, %d)', row, column)
+        trace: Trace | None = self._trace
+        if trace is not None:
+            trace('flag_cell, (%d, %d)', row, column)
         self._validate_coordinates(row, column)
-        cell: Cell = self.field[(row, column)]
-        log.debug('flag_cell, (%d, %d) flag_before -> %s',
-                  row, column, cell.has_flag)
-        if cell.has_flag:
-            cell.has_flag = False
+        self._clear_changes()
+        board: Board = self._board
+        index: int = board.index(row, column)
+        if trace is not None:
+            trace('flag_cell, (%d, %d) flag_before -> %s',
+                  row, column, board.flags[index])
+        if board.flags[index]:
+            self._record_change(index)
+            board.flags[index] = 0
             self._flags_number += 1
-        elif not cell.has_flag and self._flags_number > 0 and not cell.is_open:
-            cell.has_flag = True
+            self._placed_flags_number -= 1
+        elif self._flags_number > 0 and not board.opened[index]:
+            self._record_change(index)
+            board.flags[index] = 1
             self._flags_number -= 1
-        log.debug('flag_cell, (%d, %d) flag_after -> %s',
-                  row, column, cell.has_flag)
+            self._placed_flags_number += 1
+        if trace is not None:
+            trace('flag_cell, (%d, %d) flag_after -> %s',
+                  row, column, board.flags[index])
+        return self._build_change_set()
 
     def _open_cell(self, coordinate: tuple[int, int]) -> None:
         """Open cell.
@@ -180,57 +97,83 @@ class GameLogic:
             coordinate (tuple[int, int]): coordinate of opening cell
                 as tuple[row, column]
         """
-        log.debug('_open_cell.begin')
-        cell: Cell = self.field[coordinate]
-        has_mine: bool = cell.has_mine
-        has_flag: bool = cell.has_flag
-        is_open: bool = cell.is_open
-
-        if has_mine:
-            log.debug('_open_cell.has_mine')
+        trace: Trace | None = self._trace
+        if trace is not None:
+            trace('_open_cell.begin')
+        board: Board = self._board
+        index: int = board.index(*coordinate)
+
+        if board.mines[index]:
+            if trace is not None:
+                trace('_open_cell.has_mine')
             self._finish_game(is_player_exploded=True)
-        elif has_flag:
-            log.debug('_open_cell.begin')
-            cell.has_flag = False
-        elif is_open:
-            log.debug('_open_cell.has_flag')
+        elif board.flags[index]:
+            if trace is not None:
+                trace('_open_cell.has_flag')
+            self._record_change(index)
+            board.flags[index] = 0
+            self._placed_flags_number -= 1
+        elif board.opened[index]:
+            if trace is not None:
+                trace('_open_cell.is_open')
             log.warning('Try of open already opened cell, %s', coordinate)
         else:
-            log.debug('_open_cell. is opening')
-            cell.has_flag = False
+            if trace is not None:
+                trace('_open_cell. is opening')
             self._open_this_and_neighbour_cells(coordinate)
-        log.debug('_open_cell.end')
+        if trace is not None:
+            trace('_open_cell.end')
 
     def _put_mines(self, current_coordinate: tuple[int, int]) -> None:
         """Put mines to the field.
 
         Put to the field mines in random positions excluding passed
-        coordinate.
+        coordinate. Positions are taken by one sample over the cells
+        without the passed coordinate. If mines take more than a half of
+        the field, the safe cells are sampled instead and all the other
+        cells get mines.
 
         Args:
             current_coordinate (tuple[int, int]): coordinate of opening
                 cell as tuple[row, column].
         """
-        log.debug('_put_mines, skip coordinate: %s', current_coordinate)
-        number_of_mines: int = self._game_field.field_config.number_of_mines
-        coordinates: set[tuple[int, int]] = set()
-        while len(coordinates) < number_of_mines:
-            coord: tuple[int, int] = random.choice(list(self.field.keys()))
-            if coord not in coordinates and coord != current_coordinate:
-                log.debug('_put_mines, add coordinate: %s', coord)
-                coordinates.add(coord)
-        for cell_coordinate in coordinates:
-            cell = self.field[cell_coordinate]
-            cell.has_mine = True
-            log.debug('_put_mines, put mine to coordinate: %s, has_mine: %s',
-                      cell_coordinate,
-                      cell.has_mine)
+        if self._trace is not None:
+            self._trace('_put_mines, skip coordinate: %s', current_coordinate)
+        board: Board = self._board
+        mines: bytearray = board.mines
+        skip_index: int = board.index(*current_coordinate)
+        value, indexes = self._sample_mine_indexes(skip_index)
+        if not value:
+            mines[:] = b'\x01' * board.size
+            mines[skip_index] = 0
+        for index in indexes:
+            mines[index] = value
 
     def _count_neighbour_mines_for_all_field(self) -> None:
-        """Count mines for cells in the field."""
-        log.debug('_count_neighbour_mines_for_all_field')
-        for cell in self.field.values():
-            self._count_neighbour_mines_for_cell(cell)
+        """Count mines for cells in the field.
+
+        All the cells are counted at once by the vectorized counting,
+        that uses NumPy if it is installed.
+        """
+        if self._trace is not None:
+            self._trace('_count_neighbour_mines_for_all_field')
+        board: Board = self._board
+        board.neighbour_mines[:] = counting.count_neighbour_mines(
+            board.mines, board.rows, board.columns)
+
+    def _label_zero_regions(self) -> None:
+        """Label zero regions of the field on the first zero cell reveal.
+
+        Fields with more than MAX_LABELLED_MINE_DENSITY of mines are not
+        labelled without reading the board, their regions are small and
+        are searched faster.
+        """
+        self._is_field_labelled = True
+        board: Board = self._board
+        if self.number_of_mines > board.size * MAX_LABELLED_MINE_DENSITY:
+            return
+        self._zero_regions = label_zero_regions(
+            board.mines, board.neighbour_mines, board.rows, board.columns)
 
     def _finish_game(self, is_player_exploded: bool = False) -> None:
         """Check game state.
@@ -243,128 +186,164 @@ class GameLogic:
             is_player_exploded (bool, optional): shows of the player
                 status. Defaults to False.
         """
-        log.debug('_finish_game, is_player_win: %s', is_player_exploded)
-        for cell in self.field.values():
-            cell.is_open = True
+        trace: Trace | None = self._trace
+        if trace is not None:
+            trace('_finish_game, is_player_win: %s', is_player_exploded)
+        board: Board = self._board
+        self._record_changes(list(itertools.compress(
+            range(board.size), board.opened.translate(_INVERT_TABLE))))
+        board.opened[:] = b'\x01' * board.size
         self._is_game_finished = True
         self._is_player_win = not is_player_exploded
         if self._is_player_win:
-            for cell in self.field.values():
-                if cell.has_mine:
-                    cell.has_flag = True
-        log.debug(
-            '_finish_game. Result {_is_game_finished: %s, _is_player_win: %s}',
-            self._is_game_finished, self._is_player_win)
+            index: int = board.mines.find(1)
+            while index != -1:
+                board.flags[index] = 1
+                index = board.mines.find(1, index + 1)
+            self._placed_flags_number = board.flags.count(1)
+        if trace is not None:
+            trace('_finish_game. Result '
+                  '{_is_game_finished: %s, _is_player_win: %s}',
+                  self._is_game_finished, self._is_player_win)
 
     def _open_this_and_neighbour_cells(self,
-                                       coordinate: tuple[int, int]) -> None:
+                                       coordinate: tuple[int, int]
+                                       ) -> list[int]:
         """Open current and neighbour cells.
 
         If the conditions are appropriate for opening neighbour cells,
         they will be opened in addition to the cell represented by
         passed coordinate.
+        Region labelled at the first click is opened at once when it is
+        possible, otherwise cells are opened by the breadth-first search
+        over the cell indexes. A cell is opened when it is added to the
+        queue, so the opened state works as the visited map and every
+        cell is processed at most once. Only cells without mines around
+        are added to the queue, because only they open their neighbours.
+        Opened cells are added to the changes of the action.
 
         Args:
             coordinate (tuple[int, int]): current cell coordinate.
-        """
-        log.debug('_open_this_and_neighbour_cells, coordinate: %s', coordinate)
-        if self.field[coordinate].neighbour_mines > 0:
-            self.field[coordinate].is_open = True
-            log.debug('skip opening neighbours, because has neighbour mines')
-            return
-        queue: set[tuple[int, int]] = set()
-        queue.add(coordinate)
-        while len(queue) > 0:
-            pop_coordinate: tuple[int, int] = queue.pop()
-            log.debug('processing pop_coordinate: %s', pop_coordinate)
-            current_cell: Cell = self.field[pop_coordinate]
-            if utils.is_alone_cell(current_cell):
-                log.debug('utils.is_alone_cell(current_cell)')
-                current_cell.is_open = True
-                neighbours = utils.get_neighbour_coordinates(
-                    pop_coordinate, self.rows, self.columns)
-                for new_coordinate in neighbours:
-                    queue.add(new_coordinate)
-            elif utils.has_neighbour_mines(current_cell):
-                log.debug('utils.has_neighbour_mines(current_cell)')
-                current_cell.is_open = True
-
-    def _count_neighbour_mines_for_cell(self, cell: Cell) -> None:
-        """Find and count mines around passed cell.
 
-        Args:
-            cell (Cell): current cell that is processing.
+        Returns:
+            list[int]: indexes of the cells that were opened.
         """
-        log.debug('_count_neighbour_mines_for_cell, cell: %s', cell)
-        neighbours = self._get_neighbour_cells(cell.row, cell.column)
-        count: int = 0
-        for neighbour_cell in neighbours.values():
-            if neighbour_cell.has_mine:
-                count += 1
-        cell.neighbour_mines = count
-        log.debug('cell: %s, mines_around: %d', cell, cell.neighbour_mines)
-
-    def _get_neighbour_cells(self, row: int, column: int) -> FieldDict:
-        """Find and return all the neighbour cell to the passed coordinates.
+        trace: Trace | None = self._trace
+        if trace is not None:
+            trace('_open_this_and_neighbour_cells, coordinate: %s',
+                  coordinate)
+        board: Board = self._board
+        mines: bytearray = board.mines
+        opened: bytearray = board.opened
+        flags: bytearray = board.flags
+        counts: bytearray = board.neighbour_mines
+        start_index: int = board.index(*coordinate)
+        if counts[start_index] > 0:
+            if trace is not None:
+                trace('skip opening neighbours, because has neighbour mines')
+            if opened[start_index]:
+                return []
+            self._record_change(start_index)
+            opened[start_index] = 1
+            if not mines[start_index]:
+                self._opened_cells_number += 1
+            return [start_index]
+        if mines[start_index] or opened[start_index] or flags[start_index]:
+            return []
+        revealed: list[int] | None = self._open_zero_region(start_index)
+        if revealed is not None:
+            self._opened_cells_number += len(revealed)
+            return revealed
+        adjacency: Adjacency = self._get_adjacency()
+        offsets = adjacency.offsets
+        neighbours = adjacency.neighbours
+        # only closed cells without mine and flag are opened, so the
+        # state of the cell before the action is the number of mines
+        # around it
+        old_states: bytearray = self._old_states
+        old_states.append(counts[start_index])
+        opened[start_index] = 1
+        revealed = [start_index]
+        queue: deque[int] = deque(revealed)
+        while queue:
+            index: int = queue.popleft()
+            if trace is not None:
+                trace('alone cell, open neighbours: %s',
+                      board.coordinate(index))
+            for neighbour in neighbours[offsets[index]:offsets[index + 1]]:
+                if mines[neighbour] or opened[neighbour] or flags[neighbour]:
+                    continue
+                old_states.append(counts[neighbour])
+                opened[neighbour] = 1
+                revealed.append(neighbour)
+                if counts[neighbour] == 0:
+                    queue.append(neighbour)
+        self._changed_indexes.extend(revealed)
+        self._opened_cells_number += len(revealed)
+        return revealed
+
+    def _open_zero_region(self, start_index: int) -> list[int] | None:
+        """Open labelled zero region of the cell and its border.
+
+        Zero cells of the region are opened by the runs of the row
+        cells. The region is opened only if none of its zero cells is
+        opened or flagged, otherwise the search gives another result,
+        because flagged cells stop it. Opened cells are added to the
+        changes of the action.
 
         Args:
-            row (int): row number.
-            column (int): column number.
+            start_index (int): index of the zero cell.
 
         Returns:
-            FieldDict: dictionary that represents field.
+            list[int] | None: indexes of the opened cells, or None if
+                the region should be opened by the search.
         """
-        log.debug('_get_neighbour_cells. (%d, %d)', row, column)
-        neighbours = utils.get_neighbour_coordinates(
-            (row, column), self.rows, self.columns)
-        result_dictionary: FieldDict = {}
-        for n_coordinate in neighbours:
-            result_dictionary[n_coordinate] = self.field[n_coordinate]
-        log.debug(
-            '_get_neighbour_cells. for (%d, %d), number of neighbours: %d',
-            row, column, len(result_dictionary))
-        return result_dictionary
-
-    def _validate_coordinates(self, row: int, column: int) -> None:
-        """Validate passed coordinates.
+        if not self._is_field_labelled:
+            self._label_zero_regions()
+        regions: ZeroRegions | None = self._zero_regions
+        if regions is None:
+            return None
+        region: int = regions.region_of(start_index)
+        if region < 0:
+            return None
+        board: Board = self._board
+        opened: bytearray = board.opened
+        flags: bytearray = board.flags
+        runs: list[tuple[int, int]] = list(regions.runs_of(region))
+        for start, stop in runs:
+            if (opened.find(1, start, stop) != -1
+                    or flags.find(1, start, stop) != -1):
+                if self._trace is not None:
+                    self._trace('zero region %d is changed, search it',
+                                region)
+                return None
+        borders: list[int] = [
+            index for index in regions.borders_of(region)
+            if not opened[index] and not flags[index]]
+        revealed: list[int] = []
+        for start, stop in runs:
+            revealed.extend(range(start, stop))
+        revealed.extend(borders)
+        self._record_changes(revealed)
+        for start, stop in runs:
+            opened[start:stop] = b'\x01' * (stop - start)
+        for index in borders:
+            opened[index] = 1
+        return revealed
+
+    def _count_neighbour_mines_for_cell(self, cell: FieldCell) -> None:
+        """Find and count mines around passed cell.
 
         Args:
-            row (int): row number.
-            column (int): column number.
-
-        Raises:
-            IncorrectCoordinatesException: raised if the coordinates has
-                incorrect values.
-        """
-        log.debug('Validation of (%d, %d)', row, column)
-        is_valid_row: bool = 0 <= row < self.rows
-        is_valid_col: bool = 0 <= column < self.columns
-        log.debug('Validation result - is_valid_row: %s, is_valid_col: %s)',
-                  is_valid_row, is_valid_col)
-        if not is_valid_row or not is_valid_col:
-            raise IncorrectCoordinatesException('Coordinates are not valid')
-
-    def _process_current_game_state(self) -> None:
-        """Check if the game has finished state.
-
-        Gather all the game information and check conditions that will
-        say if the game finished or can be continued.
+            cell (FieldCell): current cell that is processing.
         """
-        log.debug('_process_current_game_state.begin')
-        config = self._game_field.field_config
-        expected_number_of_mines: int = config.number_of_mines
-        expected_number_of_cells: int = self.rows * self.columns
-        log.debug('num_mines: %d, num_cells: %d',
-                  expected_number_of_mines,
-                  expected_number_of_cells)
-        count_opened_cells: int = 0
-        for cell in self.field.values():
-            if cell.is_open:
-                count_opened_cells += 1
-        log.debug('opened: %d', count_opened_cells)
-        total_num: int = count_opened_cells + expected_number_of_mines
-        log.debug('total_num: %d', total_num)
-        if total_num == expected_number_of_cells:
-            log.debug('Game is Finished without flags')
-            self._finish_game(is_player_exploded=False)
-        log.debug('_process_current_game_state.begin')
+        trace: Trace | None = self._trace
+        if trace is not None:
+            trace('_count_neighbour_mines_for_cell, cell: %s', cell)
+        board: Board = self._board
+        index: int = board.index(cell.row, cell.column)
+        count: int = sum(board.mines[neighbour] for neighbour
+                         in self._get_adjacency().neighbours_of(index))
+        cell.neighbour_mines = count
+        if trace is not None:
+            trace('cell: %s, mines_around: %d', cell, cell.neighbour_mines)
@@ -0,0 +1,174 @@
+"""Module contains GameHistory class.
+
+History keeps the actions of the started game as the change sets: the
+indexes of the changed cells with their packed states before and after
+the action, so undo and redo write only the cells changed by the action
+instead of copying the whole field.
+"""
+import logging
+from array import array
+from collections import deque
+from dataclasses import dataclass
+
+from minesweeper_core.data.change_set import ChangeSet
+from minesweeper_core.data.game_status import GameStatus
+
+log: logging.Logger = logging.getLogger(__name__)
+
+# Number of the actions kept by default.
+DEFAULT_MAX_ENTRIES: int = 1000
+
+# Number of the changed cells kept by default over all the actions.
+DEFAULT_MAX_CELLS: int = 4_000_000
+
+
+@dataclass(frozen=True, repr=False)
+class HistoryEntry:
+    """Cells changed by the action and status of the game around it."""
+
+    indexes: array
+    old_states: bytes
+    new_states: bytes
+    old_status: GameStatus
+    new_status: GameStatus
+
+    def __repr__(self) -> str:
+        """Return string representation without the cell states.
+
+        Returns:
+            str: representation.
+        """
+        return (f'HistoryEntry(changed={len(self.indexes)}, '
+                f'old_status={self.old_status}, '
+                f'new_status={self.new_status})')
+
+
+class GameHistory:
+    """Undo and redo stacks of the actions of the started game.
+
+    Memory is limited by the number of actions and by the number of
+    changed cells over all of them, the oldest actions are evicted when
+    any limit is exceeded. The last action is kept even if it changed
+    more cells than the limit, so it could always be undone.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_cells: int = DEFAULT_MAX_CELLS) -> None:
+        """Initialize empty history.
+
+        Args:
+            max_entries (int, optional): number of the kept actions.
+                Defaults to DEFAULT_MAX_ENTRIES.
+            max_cells (int, optional): number of the changed cells kept
+                over all the actions. Defaults to DEFAULT_MAX_CELLS.
+        """
+        self._max_entries: int = max(1, max_entries)
+        self._max_cells: int = max_cells
+        self._undo: deque[HistoryEntry] = deque()
+        self._redo: list[HistoryEntry] = []
+        self._cells: int = 0
+
+    @property
+    def can_undo(self) -> bool:
+        """Return True if there is an action to undo.
+
+        Returns:
+            bool: undo availability.
+        """
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        """Return True if there is an undone action to redo.
+
+        Returns:
+            bool: redo availability.
+        """
+        return bool(self._redo)
+
+    @property
+    def number_of_cells(self) -> int:
+        """Return number of the changed cells kept by the history.
+
+        Returns:
+            int: number of cells.
+        """
+        return self._cells
+
+    def __len__(self) -> int:
+        """Return number of the actions that could be undone.
+
+        Returns:
+            int: number of actions.
+        """
+        return len(self._undo)
+
+    def clear(self) -> None:
+        """Remove all the actions before the next game."""
+        log.debug('clear')
+        self._undo.clear()
+        self._redo.clear()
+        self._cells = 0
+
+    def record(self, change_set: ChangeSet, old_status: GameStatus,
+               new_status: GameStatus) -> None:
+        """Add the action of the started game to the history.
+
+        Actions that changed no cells are not added. A new action
+        removes the undone actions.
+
+        Args:
+            change_set (ChangeSet): cells changed by the action with
+                their states before and after it.
+            old_status (GameStatus): status before the action.
+            new_status (GameStatus): status after the action.
+        """
+        if not change_set:
+            return
+        entry: HistoryEntry = HistoryEntry(
+            array('q', change_set.indexes), change_set.old_states,
+            change_set.states, old_status, new_status)
+        self._redo.clear()
+        self._push(entry)
+
+    def undo(self) -> HistoryEntry | None:
+        """Take the last action to return the cells to its old states.
+
+        Returns:
+            HistoryEntry | None: the action, or None if there is no
+                action to undo.
+        """
+        if not self._undo:
+            return None
+        entry: HistoryEntry = self._undo.pop()
+        self._cells -= len(entry.indexes)
+        self._redo.append(entry)
+        log.debug('undo, %s', entry)
+        return entry
+
+    def redo(self) -> HistoryEntry | None:
+        """Take the last undone action to set the cells to its new states.
+
+        Returns:
+            HistoryEntry | None: the action, or None if there is no
+                undone action.
+        """
+        if not self._redo:
+            return None
+        entry: HistoryEntry = self._redo.pop()
+        self._push(entry)
+        log.debug('redo, %s', entry)
+        return entry
+
+    def _push(self, entry: HistoryEntry) -> None:
+        """Add the action to the undo stack and evict the oldest ones.
+
+        Args:
+            entry (HistoryEntry): the action.
+        """
+        self._undo.append(entry)
+        self._cells += len(entry.indexes)
+        while len(self._undo) > 1 and (len(self._undo) > self._max_entries
+                                       or self._cells > self._max_cells):
+            evicted: HistoryEntry = self._undo.popleft()
+            self._cells -= len(evicted.indexes)
@@ -0,0 +1,71 @@
+"""Module contains NumpyGameLogic class.
+
+NumPy is an optional dependency, the engine can be used only if it is
+installed (NUMPY_AVAILABLE is True).
+"""
+import logging
+
+from minesweeper_core.data.board import Board
+from minesweeper_core.logic.game_logic import GameLogic
+
+try:
+    import numpy
+    NUMPY_AVAILABLE: bool = True
+except ImportError:  # pragma: no cover - depends on the environment
+    NUMPY_AVAILABLE = False
+
+log: logging.Logger = logging.getLogger(__name__)
+
+
+class NumpyGameLogic(GameLogic):
+    """Game logic that processes the whole field by NumPy arrays.
+
+    Arrays are views of the board columns, so the field is still kept
+    in the board and its views are the same as the ones of GameLogic.
+    Mines are put, and the finished game is revealed by the array
+    operations. Regions are opened by the breadth-first search of
+    GameLogic, that visits only the opened cells.
+    """
+
+    _logger: logging.Logger = log
+
+    def _put_mines(self, current_coordinate: tuple[int, int]) -> None:
+        """Put mines to the field.
+
+        Mines are sampled in the same way as by GameLogic, so the same
+        seed gives the same field.
+
+        Args:
+            current_coordinate (tuple[int, int]): coordinate of opening
+                cell as tuple[row, column].
+        """
+        if self._trace is not None:
+            self._trace('_put_mines, skip coordinate: %s', current_coordinate)
+        board: Board = self._board
+        skip_index: int = board.index(*current_coordinate)
+        value, indexes = self._sample_mine_indexes(skip_index)
+        mines = numpy.frombuffer(board.mines, dtype=numpy.uint8)
+        if not value:
+            mines[:] = 1
+            mines[skip_index] = 0
+        mines[numpy.array(indexes, dtype=numpy.intp)] = value
+
+    def _finish_game(self, is_player_exploded: bool = False) -> None:
+        """Open all the cells and set result of the game.
+
+        Args:
+            is_player_exploded (bool, optional): shows of the player
+                status. Defaults to False.
+        """
+        if self._trace is not None:
+            self._trace('_finish_game, is_player_win: %s', is_player_exploded)
+        board: Board = self._board
+        opened = numpy.frombuffer(board.opened, dtype=numpy.uint8)
+        self._record_changes(numpy.flatnonzero(opened == 0).tolist())
+        opened[:] = 1
+        self._is_game_finished = True
+        self._is_player_win = not is_player_exploded
+        if self._is_player_win:
+            flags = numpy.frombuffer(board.flags, dtype=numpy.uint8)
+            flags |= numpy.frombuffer(board.mines, dtype=numpy.uint8)
+            self._placed_flags_number = int(numpy.count_nonzero(flags))
@@ -0,0 +1,247 @@
+"""Module contains ReferenceGameLogic class.
+
+The engine opens and counts cells one by one through the cell views of
+the field, as the first implementation of the game did. It is the
+slowest engine and is kept as the reference to compare results of the
+optimized engines with, so it takes only the game state, the counters
+and the saved game format from the base class and implements the rules
+again.
+"""
+import logging
+
+from minesweeper_core.data.board import Board
+from minesweeper_core.data.cell import FieldCell
+from minesweeper_core.data.change_set import ChangeSet
+from minesweeper_core.logic.base_logic import BaseGameLogic, FieldDict
+from minesweeper_core.logic.tracing import Trace
+
+log: logging.Logger = logging.getLogger(__name__)
+
+# Offsets of the rows and columns of the cells around the cell.
+_NEIGHBOUR_OFFSETS: tuple[tuple[int, int], ...] = tuple(
+    (row_offset, column_offset)
+    for row_offset in (-1, 0, 1) for column_offset in (-1, 0, 1)
+    if row_offset or column_offset)
+
+
+class ReferenceGameLogic(BaseGameLogic[Board]):
+    """Game logic that changes the field cell by cell.
+
+    The rules are implemented here again instead of being taken from
+    the other engines: mines are sampled from the list of the cells,
+    neighbours are found by the offsets of the coordinate, and the
+    cells are read and changed through the views of the field.
+    """
+
+    _logger: logging.Logger = log
+
+    @staticmethod
+    def _create_board(rows: int, columns: int) -> Board:
+        """Create storage of the field cells state.
+
+        Args:
+            rows (int): number of rows.
+            columns (int): number of columns.
+
+        Returns:
+            Board: board with closed and empty cells.
+        """
+        return Board(rows, columns)
+
+    def flag_cell(self, row: int, column: int) -> ChangeSet:
+        """Put or remove flag from the cell.
+
+        Args:
+            row (int): cell row number.
+            column (int): cell column number.
+
+        Returns:
+            ChangeSet: the cell if its flag state was changed.
+        """
+        if self._trace is not None:
+            self._trace('flag_cell, (%d, %d)', row, column)
+        self._validate_coordinates(row, column)
+        self._clear_changes()
+        cell: FieldCell = self.field[(row, column)]
+        if cell.has_flag:
+            self._record_change(self._index_of(cell))
+            cell.has_flag = False
+            self._flags_number += 1
+            self._placed_flags_number -= 1
+        elif self._flags_number > 0 and not cell.is_open:
+            self._record_change(self._index_of(cell))
+            cell.has_flag = True
+            self._flags_number -= 1
+            self._placed_flags_number += 1
+        return self._build_change_set()
+
+    def _open_cell(self, coordinate: tuple[int, int]) -> None:
+        """Open cell.
+
+        Args:
+            coordinate (tuple[int, int]): coordinate of opening cell
+                as tuple[row, column]
+        """
+        cell: FieldCell = self.field[coordinate]
+        if cell.has_mine:
+            self._finish_game(is_player_exploded=True)
+        elif cell.has_flag:
+            self._record_change(self._index_of(cell))
+            cell.has_flag = False
+            self._placed_flags_number -= 1
+        elif cell.is_open:
+            log.warning('Try of open already opened cell, %s', coordinate)
+        else:
+            self._open_this_and_neighbour_cells(coordinate)
+
+    def _put_mines(self, current_coordinate: tuple[int, int]) -> None:
+        """Put mines to the field.
+
+        Mines are sampled from the cells without the passed one, or the
+        safe cells are sampled if mines take more than a half of them.
+        The random generator gets the same calls as by the other
+        engines, so the same seed gives the same field.
+
+        Args:
+            current_coordinate (tuple[int, int]): coordinate of opening
+                cell as tuple[row, column].
+        """
+        if self._trace is not None:
+            self._trace('_put_mines, skip coordinate: %s', current_coordinate)
+        eligible: list[FieldCell] = [
+            cell for coordinate, cell in self.field.items()
+            if coordinate != current_coordinate]
+        number_of_safe: int = len(eligible) - self.number_of_mines
+        if self.number_of_mines <= number_of_safe:
+            for cell in self._random.sample(eligible, self.number_of_mines):
+                cell.has_mine = True
+        else:
+            for cell in eligible:
+                cell.has_mine = True
+            for cell in self._random.sample(eligible, number_of_safe):
+                cell.has_mine = False
+
+    def _count_neighbour_mines_for_all_field(self) -> None:
+        """Count mines for cells in the field one by one."""
+        if self._trace is not None:
+            self._trace('_count_neighbour_mines_for_all_field')
+        for cell in self.field.values():
+            self._count_neighbour_mines_for_cell(cell)
+
+    def _finish_game(self, is_player_exploded: bool = False) -> None:
+        """Open all the cells and set result of the game.
+
+        Args:
+            is_player_exploded (bool, optional): shows of the player
+                status. Defaults to False.
+        """
+        if self._trace is not None:
+            self._trace('_finish_game, is_player_win: %s', is_player_exploded)
+        for index, cell in enumerate(self.field.values()):
+            if not cell.is_open:
+                self._record_change(index)
+                cell.is_open = True
+        self._is_game_finished = True
+        self._is_player_win = not is_player_exploded
+        if self._is_player_win:
+            for cell in self.field.values():
+                if cell.has_mine and not cell.has_flag:
+                    cell.has_flag = True
+                    self._placed_flags_number += 1
+
+    def _open_this_and_neighbour_cells(self,
+                                       coordinate: tuple[int, int]
+                                       ) -> list[int]:
+        """Open current and neighbour cells.
+
+        Cells are processed from the set of the coordinates to visit,
+        cells without mines around add their neighbours to the set.
+        Opened cells are added to the changes of the action and to the
+        number of opened cells.
+
+        Args:
+            coordinate (tuple[int, int]): current cell coordinate.
+
+        Returns:
+            list[int]: indexes of the cells that were opened.
+        """
+        trace: Trace | None = self._trace
+        if trace is not None:
+            trace('_open_this_and_neighbour_cells, coordinate: %s',
+                  coordinate)
+        start: FieldCell = self.field[coordinate]
+        if start.neighbour_mines > 0:
+            if start.is_open:
+                return []
+            self._record_change(self._index_of(start))
+            start.is_open = True
+            self._opened_cells_number += 1
+            return [self._index_of(start)]
+        revealed: list[int] = []
+        queue: set[tuple[int, int]] = {coordinate}
+        while queue:
+            current_cell: FieldCell = self.field[queue.pop()]
+            if trace is not None:
+                trace('visit cell: %s', current_cell)
+            if (current_cell.has_mine or current_cell.is_open
+                    or current_cell.has_flag):
+                continue
+            revealed.append(self._index_of(current_cell))
+            self._record_change(revealed[-1])
+            current_cell.is_open = True
+            if current_cell.neighbour_mines == 0:
+                queue.update(self._neighbour_coordinates(current_cell.row,
+                                                         current_cell.column))
+        self._opened_cells_number += len(revealed)
+        return revealed
+
+    def _count_neighbour_mines_for_cell(self, cell: FieldCell) -> None:
+        """Find and count mines around passed cell.
+
+        Args:
+            cell (FieldCell): current cell that is processing.
+        """
+        neighbours: FieldDict = self._get_neighbour_cells(cell.row,
+                                                          cell.column)
+        cell.neighbour_mines = sum(neighbour.has_mine
+                                   for neighbour in neighbours.values())
+
+    def _get_neighbour_cells(self, row: int, column: int) -> FieldDict:
+        """Find and return all the neighbour cell to the passed coordinates.
+
+        Args:
+            row (int): row number.
+            column (int): column number.
+
+        Returns:
+            FieldDict: dictionary that represents field.
+        """
+        return {coordinate: self.field[coordinate] for coordinate
+                in self._neighbour_coordinates(row, column)}
+
+    def _neighbour_coordinates(self, row: int,
+                               column: int) -> list[tuple[int, int]]:
+        """Return coordinates of the cells around the passed one.
+
+        Args:
+            row (int): row number.
+            column (int): column number.
+
+        Returns:
+            list[tuple[int, int]]: coordinates inside the field.
+        """
+        return [(row + row_offset, column + column_offset)
+                for row_offset, column_offset in _NEIGHBOUR_OFFSETS
+                if 0 <= row + row_offset < self.rows
+                and 0 <= column + column_offset < self.columns]
+
+    def _index_of(self, cell: FieldCell) -> int:
+        """Return flat index (row * columns + column) of the cell.
+
+        Args:
+            cell (FieldCell): cell.
+
+        Returns:
+            int: index of the cell.
+        """
+        return cell.row * self.columns + cell.column
@@ -0,0 +1,292 @@
+"""Module contains ZeroRegions class and labelling of the zero regions.
+
+Zero cell is the cell without a mine and without mines around. Opening
+of the zero cell opens all the zero cells connected to it and their
+neighbours, that is the zero region and its border. After mines are put
+the regions don't change, so they are labelled once and the following
+reveals take the cells of the region instead of searching them.
+"""
+import bisect
+import logging
+import re
+from array import array
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+log: logging.Logger = logging.getLogger(__name__)
+
+# Regions are labelled only if zero cells make long runs on average.
+# On dense fields regions are small and are searched faster than all
+# of them are labelled.
+MIN_AVERAGE_RUN_LENGTH: int = 8
+
+# Fields with more mines per cell are not labelled at all. Their zero
+# runs are always shorter than MIN_AVERAGE_RUN_LENGTH, so the check by
+# the number of mines saves the pass over the field.
+MAX_LABELLED_MINE_DENSITY: float = 0.05
+
+# Zero cells are zero bytes of the field where mines and numbers of
+# mines around are combined.
+_ZERO_RUN: re.Pattern = re.compile(rb'\x00+')
+
+# Translation table that turns 0 to b'0' and any other byte to b'1'.
+_ZERO_TO_DIGIT: bytes = b'0' + b'1' * 255
+
+
+@dataclass(repr=False, frozen=True)
+class ZeroRegions:
+    """Zero regions of the field in the compressed format.
+
+    Zero cells are kept as runs of the consecutive cells of one row,
+    runs are sorted by the index of their first cell. Runs of the region
+    r are region_runs[run_offsets[r]:run_offsets[r + 1]] and border
+    cells of the region are borders[border_offsets[r]:border_offsets[r
+    + 1]], where index of the cell is (row * columns + column).
+    """
+
+    run_starts: array
+    run_stops: array
+    run_regions: array
+    run_offsets: array
+    region_runs: array
+    border_offsets: array
+    borders: array
+
+    @property
+    def number_of_regions(self) -> int:
+        """Return number of the regions.
+
+        Returns:
+            int: number of the regions.
+        """
+        return len(self.run_offsets) - 1
+
+    def region_of(self, index: int) -> int:
+        """Return number of the region of the cell.
+
+        Args:
+            index (int): index of the cell.
+
+        Returns:
+            int: number of the region, or -1 for not zero cell.
+        """
+        run: int = bisect.bisect_right(self.run_starts, index) - 1
+        if run < 0 or index >= self.run_stops[run]:
+            return -1
+        return self.run_regions[run]
+
+    def runs_of(self, region: int) -> Iterator[tuple[int, int]]:
+        """Return runs of the zero cells of the region.
+
+        Args:
+            region (int): number of the region.
+
+        Yields:
+            tuple[int, int]: index of the first cell of the run and index
+                after its last cell.
+        """
+        runs: array = self.region_runs[
+            self.run_offsets[region]:self.run_offsets[region + 1]]
+        for run in runs:
+            yield self.run_starts[run], self.run_stops[run]
+
+    def borders_of(self, region: int) -> array:
+        """Return indexes of the border cells of the region.
+
+        Border cells are the cells with mines around that are neighbours
+        of the zero cells of the region. One cell could be the border of
+        several regions.
+
+        Args:
+            region (int): number of the region.
+
+        Returns:
+            array: sorted indexes of the border cells.
+        """
+        return self.borders[self.border_offsets[region]:
+                            self.border_offsets[region + 1]]
+
+    def __repr__(self) -> str:
+        """Return string representation of the regions.
+
+        Returns:
+            str: representation.
+        """
+        return (f'ZeroRegions(regions={self.number_of_regions}, '
+                f'runs={len(self.run_starts)}, '
+                f'borders={len(self.borders)})')
+
+
+def _find_root(parents: list[int], run: int) -> int:
+    """Find root of the run in the union-find forest with path halving.
+
+    Args:
+        parents (list[int]): parent of every run.
+        run (int): number of the run.
+
+    Returns:
+        int: number of the root run.
+    """
+    while parents[run] != run:
+        parents[run] = parents[parents[run]]
+        run = parents[run]
+    return run
+
+
+def _union_rows(parents: list[int], starts: array, stops: array,
+                previous: range, current: range, shift: int) -> None:
+    """Join runs of two neighbour rows that touch each other.
+
+    Runs of every row are sorted, so touching runs are found by one
+    merge-like pass over both rows. Runs touch if they have neighbour
+    cells, including the diagonal ones.
+
+    Args:
+        parents (list[int]): parent of every run.
+        starts (array): first cell of every run.
+        stops (array): cell after the last cell of every run.
+        previous (range): runs of the previous row.
+        current (range): runs of the current row.
+        shift (int): number of columns, distance between the rows.
+    """
+    previous_run: int = previous.start
+    current_run: int = current.start
+    while previous_run < previous.stop and current_run < current.stop:
+        previous_stop: int = stops[previous_run] + shift
+        current_stop: int = stops[current_run]
+        if (starts[previous_run] + shift <= current_stop
+                and starts[current_run] <= previous_stop):
+            first: int = _find_root(parents, previous_run)
+            second: int = _find_root(parents, current_run)
+            if first != second:
+                parents[max(first, second)] = min(first, second)
+        if previous_stop < current_stop:
+            previous_run += 1
+        else:
+            current_run += 1
+
+
+def _add_border_cells(border: set[int], row_runs: range, starts: array,
+                      stops: array, start: int, stop: int) -> None:
+    """Add cells of the interval that are not zero cells to the border.
+
+    Args:
+        border (set[int]): border cells of the region.
+        row_runs (range): runs of the row of the interval.
+        starts (array): first cell of every run.
+        stops (array): cell after the last cell of every run.
+        start (int): index of the first cell of the interval.
+        stop (int): index after the last cell of the interval.
+    """
+    run: int = max(row_runs.start, bisect.bisect_right(
+        starts, start, row_runs.start, row_runs.stop) - 1)
+    position: int = start
+    while position < stop:
+        if run < row_runs.stop and starts[run] <= position:
+            position = max(position, stops[run])
+            run += 1
+            continue
+        gap_stop: int = stop
+        if run < row_runs.stop:
+            gap_stop = min(stop, starts[run])
+        border.update(range(position, gap_stop))
+        position = gap_stop
+
+
+def label_zero_regions(mines: bytes | bytearray,
+                       neighbour_mines: bytes | bytearray,
+                       rows: int, columns: int,
+                       min_average_run_length: int = MIN_AVERAGE_RUN_LENGTH
+                       ) -> ZeroRegions | None:
+    """Label connected zero regions of the field.
+
+    Zero cells are found as runs of zero bytes of every row, runs of
+    the neighbour rows are joined by the union-find, so the work depends
+    on the number of runs and borders instead of the number of cells.
+
+    Args:
+        mines (bytes | bytearray): row-major field of the mines.
+        neighbour_mines (bytes | bytearray): row-major number of mines
+            around every cell.
+        rows (int): number of rows.
+        columns (int): number of columns.
+        min_average_run_length (int, optional): the shortest average
+            length of the zero runs to label the field. Defaults to
+            MIN_AVERAGE_RUN_LENGTH.
+
+    Returns:
+        ZeroRegions | None: labelled regions, or None if the field is
+            too dense to label it.
+    """
+    size: int = rows * columns
+    # numbers of mines never exceed 8, so the mine bit doesn't overlap
+    combined: bytes = (int.from_bytes(neighbour_mines, 'little')
+                       | int.from_bytes(mines, 'little') << 4
+                       ).to_bytes(size, 'little')
+    digits: bytes = combined.translate(_ZERO_TO_DIGIT)
+    # runs are counted over the whole field, ignoring ends of the rows
+    number_of_runs: int = digits.count(b'10') + digits.startswith(b'0')
+    zero_cells: int = size - digits.count(b'1')
+    log.debug('label_zero_regions, rows: %d, columns: %d, zero cells: %d, '
+              'runs: %d', rows, columns, zero_cells, number_of_runs)
+    if zero_cells < min_average_run_length * number_of_runs:
+        return None
+    starts: array = array('q')
+    stops: array = array('q')
+    row_runs: list[range] = []
+    for row in range(rows):
+        first_run: int = len(starts)
+        row_start: int = row * columns
+        for match in _ZERO_RUN.finditer(combined, row_start,
+                                        row_start + columns):
+            starts.append(match.start())
+            stops.append(match.end())
+        row_runs.append(range(first_run, len(starts)))
+
+    parents: list[int] = list(range(len(starts)))
+    for row in range(1, rows):
+        _union_rows(parents, starts, stops, row_runs[row - 1],
+                    row_runs[row], columns)
+
+    run_regions: array = array('q', bytes(8 * len(starts)))
+    roots: dict[int, int] = {}
+    for run in range(len(starts)):
+        root: int = _find_root(parents, run)
+        run_regions[run] = roots.setdefault(root, len(roots))
+    number_of_regions: int = len(roots)
+
+    region_run_lists: list[list[int]] = [[] for _ in range(number_of_regions)]
+    borders: list[set[int]] = [set() for _ in range(number_of_regions)]
+    for row in range(rows):
+        row_start = row * columns
+        row_stop: int = row_start + columns
+        for run in row_runs[row]:
+            region: int = run_regions[run]
+            region_run_lists[region].append(run)
+            start: int = starts[run]
+            stop: int = stops[run]
+            border: set[int] = borders[region]
+            if start > row_start:
+                border.add(start - 1)
+            if stop < row_stop:
+                border.add(stop)
+            start_column: int = max(start - row_start - 1, 0)
+            stop_column: int = min(stop - row_start + 1, columns)
+            for neighbour_row in (row - 1, row + 1):
+                if 0 <= neighbour_row < rows:
+                    shift: int = neighbour_row * columns
+                    _add_border_cells(border, row_runs[neighbour_row],
+                                      starts, stops, shift + start_column,
+                                      shift + stop_column)
+
+    run_offsets: array = array('q', [0])
+    region_runs: array = array('q')
+    border_offsets: array = array('q', [0])
+    border_cells: array = array('q')
+    for region in range(number_of_regions):
+        region_runs.extend(region_run_lists[region])
+        run_offsets.append(len(region_runs))
+        border_cells.extend(sorted(borders[region]))
+        border_offsets.append(len(border_cells))
+    return ZeroRegions(starts, stops, run_regions, run_offsets, region_runs,
+                       border_offsets, border_cells)
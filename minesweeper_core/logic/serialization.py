@@ -0,0 +1,116 @@
+"""Module contains the binary format of the saved game.
+
+The saved game is the header followed by the packed state of every
+cell, one byte per cell in the row-major order with the bits described
+by the NEIGHBOUR_MINES_MASK, OPEN_BIT, MINE_BIT and FLAG_BIT constants
+of the board. The header keeps the magic bytes, the version of the
+format, the configuration, the counters and the status of the game, all
+the numbers are little-endian.
+"""
+import logging
+import struct
+from dataclasses import dataclass
+
+from minesweeper_core.data.field_configuration import Configuration
+from minesweeper_core.logic.exceptions import IncorrectSaveException
+
+log: logging.Logger = logging.getLogger(__name__)
+
+MAGIC: bytes = b'MSWP'
+FORMAT_VERSION: int = 1
+
+# magic, version, rows, columns, mines, flags left, opened cells, status
+HEADER: struct.Struct = struct.Struct('<4sHIIIIIB')
+
+# Bits of the status byte of the header.
+FIRST_TIME_OPEN_BIT: int = 0x01
+FINISHED_BIT: int = 0x02
+PLAYER_WIN_BIT: int = 0x04
+
+
+@dataclass(frozen=True, repr=False)
+class SavedGame:
+    """State of the game read from or written to the binary format."""
+
+    config: Configuration
+    states: bytes
+    flags_left: int
+    opened_cells: int
+    is_first_time_open: bool
+    is_game_finished: bool
+    is_player_win: bool
+
+    def __repr__(self) -> str:
+        """Return string representation without the cell states.
+
+        Returns:
+            str: representation.
+        """
+        return (f'SavedGame(config={self.config}, '
+                f'flags_left={self.flags_left}, '
+                f'opened_cells={self.opened_cells}, '
+                f'is_first_time_open={self.is_first_time_open}, '
+                f'is_game_finished={self.is_game_finished}, '
+                f'is_player_win={self.is_player_win})')
+
+
+def dump_game(saved: SavedGame) -> bytes:
+    """Write the saved game to the binary format.
+
+    Args:
+        saved (SavedGame): state of the game.
+
+    Returns:
+        bytes: header and packed states of the cells.
+    """
+    log.debug('dump_game, %s', saved)
+    status: int = ((FIRST_TIME_OPEN_BIT if saved.is_first_time_open else 0)
+                   | (FINISHED_BIT if saved.is_game_finished else 0)
+                   | (PLAYER_WIN_BIT if saved.is_player_win else 0))
+    config: Configuration = saved.config
+    header: bytes = HEADER.pack(
+        MAGIC, FORMAT_VERSION, config.number_of_rows,
+        config.number_of_columns, config.number_of_mines, saved.flags_left,
+        saved.opened_cells, status)
+    return header + saved.states
+
+
+def load_game(data: bytes | bytearray | memoryview) -> SavedGame:
+    """Read the saved game from the binary format.
+
+    Any buffer could be read, for example the memory-mapped file, the
+    states of the cells are copied from it by one slice.
+
+    Args:
+        data (bytes | bytearray | memoryview): saved game.
+
+    Raises:
+        IncorrectSaveException: raised if the data is not the saved game
+            or is saved by the newer version of the format.
+
+    Returns:
+        SavedGame: state of the game.
+    """
+    if len(data) < HEADER.size:
+        raise IncorrectSaveException('Saved game is too short')
+    (magic, version, rows, columns, mines, flags_left, opened_cells,
+     status) = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise IncorrectSaveException('Data is not a saved game')
+    if version > FORMAT_VERSION:
+        raise IncorrectSaveException(
+            f'Version {version} of the saved game is not supported')
+    if len(data) != HEADER.size + rows * columns:
+        raise IncorrectSaveException(
+            'Size of the saved game does not match its field')
+    saved: SavedGame = SavedGame(
+        config=Configuration(number_of_rows=rows, number_of_columns=columns,
+                             number_of_mines=mines),
+        states=bytes(data[HEADER.size:]),
+        flags_left=flags_left,
+        opened_cells=opened_cells,
+        is_first_time_open=bool(status & FIRST_TIME_OPEN_BIT),
+        is_game_finished=bool(status & FINISHED_BIT),
+        is_player_win=bool(status & PLAYER_WIN_BIT))
+    log.debug('load_game, %s', saved)
+    return saved
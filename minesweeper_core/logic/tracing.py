@@ -0,0 +1,30 @@
+"""Module contains tracing helpers of the game engines.
+
+Engines resolve the trace function once, when the game is started, and
+keep it in the attribute. The trace is None if the DEBUG level of the
+logger is disabled, so the hot loops only compare the attribute with
+None and don't build arguments of the messages:
+
+    trace: Trace | None = self._trace
+    if trace is not None:
+        trace('opened cell: %s', coordinate)
+"""
+import logging
+from collections.abc import Callable
+
+Trace = Callable[..., None]
+
+
+def get_trace(logger: logging.Logger) -> Trace | None:
+    """Return trace function of the logger.
+
+    Args:
+        logger (logging.Logger): logger of the engine module.
+
+    Returns:
+        Trace | None: debug method of the logger if the DEBUG level is
+            enabled for it, otherwise None.
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        return logger.debug
+    return None
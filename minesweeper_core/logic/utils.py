@@ -1,12 +1,20 @@
 """Module contains ControllerActions class."""
 import logging
 
-from minesweeper_core.data.cell import Cell
+from minesweeper_core.data.cell import FieldCell
+from minesweeper_core.logic.adjacency import Adjacency, get_adjacency
+from minesweeper_core.logic.tracing import Trace, get_trace
 
 log: logging.Logger = logging.getLogger(__name__)
 
+# Offsets of the rows and columns of the cells around the cell.
+_NEIGHBOUR_OFFSETS: tuple[tuple[int, int], ...] = (
+    (-1, -1), (-1, 0), (-1, 1),
+    (0, -1), (0, 1),
+    (1, -1), (1, 0), (1, 1))
 
-def is_alone_cell(field_cell: Cell) -> bool:
+
+def is_alone_cell(field_cell: FieldCell) -> bool:
     """Validate if the cell is alone.
 
     The main idea is that current cell:
@@ -18,19 +26,21 @@ def is_alone_cell(field_cell: Cell) -> bool:
     as alone cell (opening of the neighbour cell should be triggered).
 
     Args:
-        field_cell (Cell): cell to be processed.
+        field_cell (FieldCell): cell to be processed.
 
     Returns:
         bool: result of the condition check.
     """
-    log.debug('is_alone_cell. cell: %s', field_cell)
+    trace: Trace | None = get_trace(log)
+    if trace is not None:
+        trace('is_alone_cell. cell: %s', field_cell)
     return (not field_cell.has_mine
             and not field_cell.is_open
             and not field_cell.has_flag
             and field_cell.neighbour_mines == 0)
 
 
-def has_neighbour_mines(field_cell: Cell) -> bool:
+def has_neighbour_mines(field_cell: FieldCell) -> bool:
     """Validate if the cell is not alone.
 
     The main idea is that current cell:
@@ -42,12 +52,14 @@ def has_neighbour_mines(field_cell: Cell) -> bool:
     as alone cell (opening of the neighbour cell should be triggered).
 
     Args:
-        field_cell (Cell): cell to be processed.
+        field_cell (FieldCell): cell to be processed.
 
     Returns:
         bool: result of the condition check.
     """
-    log.debug('has_neighbour_mines. cell: %s', field_cell)
+    trace: Trace | None = get_trace(log)
+    if trace is not None:
+        trace('has_neighbour_mines. cell: %s', field_cell)
     return (not field_cell.has_mine
             and not field_cell.is_open
             and not field_cell.has_flag
@@ -61,8 +73,10 @@ def get_neighbour_coordinates(current_coordinate: tuple[int, int],
 
     Builds a set (list) of the coordinates that should be in the cells
     around passed cell (current_coordinate).
-    The logic to build and validate coordinates that will cover cells
-    around and filter coordinates that can be out of the field measures.
+    Coordinates are taken from the adjacency table that is cached for
+    the field measures, so cells outside of the field are not included.
+    Neighbours of the coordinate outside of the field are built from
+    the offsets and filtered by the field measures.
 
     ( 0 0 ) ( 0 1 ) ( 0 2 )    ( -1 -1 ) ( -1 +0 ) ( -1 +1 )
     ( 1 0 ) ( 1 1 ) ( 1 2 ) -> ( +0 -1 ) (  1  1 ) ( +0 +1 )
@@ -76,26 +90,24 @@ def get_neighbour_coordinates(current_coordinate: tuple[int, int],
     Returns:
         set[tuple[int, int]]: set of the built coordinates.
     """
-    log.debug('get_neighbour_coordinates. current: %s', current_coordinate)
+    trace: Trace | None = get_trace(log)
+    if trace is not None:
+        trace('get_neighbour_coordinates. current: %s', current_coordinate)
     row, column = current_coordinate
-    coordinate_modifiers: set[tuple[int, int]] = {
-        (-1, -1), (-1, 0), (-1, 1),
-        (0, -1), (0, 1),
-        (1, -1), (1, 0), (1, 1)
-    }
-    result_set: set[tuple[int, int]] = set()
-    for row_modifier, column_modifier in coordinate_modifiers:
-        neighbour_row: int = row + row_modifier
-        neighbour_col: int = column + column_modifier
-        is_not_valid_row: bool = (
-                (neighbour_row < 0) or (neighbour_row >= number_of_rows))
-        is_not_valid_col: bool = ((neighbour_col < 0) or (
-                neighbour_col >= number_of_columns))
-        is_current_cell: bool = (neighbour_row == row
-                                 and neighbour_col == column)
-        if is_not_valid_row or is_not_valid_col or is_current_cell:
-            log.debug('Filter coordinates that are not valid')
-            continue
-        result_set.add((neighbour_row, neighbour_col))
-    log.debug('get_neighbour_coordinates. result num: %d', len(result_set))
+    result_set: set[tuple[int, int]]
+    if 0 <= row < number_of_rows and 0 <= column < number_of_columns:
+        adjacency: Adjacency = get_adjacency(number_of_rows,
+                                             number_of_columns)
+        neighbours = adjacency.neighbours_of(row * number_of_columns + column)
+        result_set = {divmod(index, number_of_columns)
+                      for index in neighbours}
+    else:
+        result_set = {
+            (row + row_offset, column + column_offset)
+            for row_offset, column_offset in _NEIGHBOUR_OFFSETS
+            if 0 <= row + row_offset < number_of_rows
+            and 0 <= column + column_offset < number_of_columns}
+    if trace is not None:
+        trace('get_neighbour_coordinates. filtered: %d, result num: %d',
+              8 - len(result_set), len(result_set))
     return result_set
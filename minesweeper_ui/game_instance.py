@@ -18,13 +18,24 @@ def subscribe_to_updates(callback: Callable[[GameInformation], None]) -> None:
     _signal_receivers.add(callback)
 
 
+def unsubscribe_from_updates(
+        callback: Callable[[GameInformation], None]) -> None:
+    """Remove receiver from the signal receivers list.
+
+    Args:
+        callback (Callable[[GameInformation], None]): callback function
+            that was passed to subscribe_to_updates.
+    """
+    _signal_receivers.discard(callback)
+
+
 def _on_game_status_update_callback(game_info: GameInformation) -> None:
     """Send notification about updates to all receivers.
 
     Args:
         game_info (GameInformation): game information.
     """
-    for callback in _signal_receivers:
+    for callback in list(_signal_receivers):
         callback(game_info)
 
 
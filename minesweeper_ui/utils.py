@@ -1,7 +1,9 @@
 """Util methods that are used in the qt application."""
+import functools
 import importlib.resources as res
 import logging
 
+from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QIcon, QPixmap
 from PyQt6.QtWidgets import QWidget
 
@@ -9,10 +11,17 @@ import resources
 
 log: logging.Logger = logging.getLogger(__name__)
 
+# Number of the scaled images (image name and size pairs) kept in memory.
+SCALED_IMAGE_CACHE_SIZE: int = 64
 
+
+@functools.cache
 def load_icon(img_name: str) -> QIcon:
     """Load image and return built QIcon on this image.
 
+    Icons are cached, so each image is loaded once and the same QIcon
+    is shared by all the widgets.
+
     Args:
         img_name (str): name of the image that should be loaded.
 
@@ -23,21 +32,60 @@ def load_icon(img_name: str) -> QIcon:
     return QIcon(q_pixmap)
 
 
+@functools.cache
 def load_pixmap(img_name: str) -> QPixmap:
     """Load and build QPixmap from the image.
 
+    Pixmaps are cached, so each image is read and decoded once.
+
     Args:
         img_name (str): name of the image that should be loaded.
 
     Returns:
         QPixmap: pixmap that is built from image.
     """
+    log.debug('load_pixmap, img_name: %s', img_name)
     image_png_bytes: bytes = res.read_binary(resources, img_name)
     q_pixmap: QPixmap = QPixmap()
     q_pixmap.loadFromData(image_png_bytes, 'PNG')
     return q_pixmap
 
 
+@functools.lru_cache(maxsize=SCALED_IMAGE_CACHE_SIZE)
+def load_scaled_pixmap(img_name: str, size: int) -> QPixmap:
+    """Return the image scaled to fit the square of the passed size.
+
+    The least recently used scaled images are evicted when the cache
+    is full.
+
+    Args:
+        img_name (str): name of the image.
+        size (int): side of the square in pixels.
+
+    Returns:
+        QPixmap: scaled pixmap.
+    """
+    log.debug('load_scaled_pixmap, img_name: %s, size: %d', img_name, size)
+    return load_pixmap(img_name).scaled(
+        size, size,
+        Qt.AspectRatioMode.KeepAspectRatio,
+        Qt.TransformationMode.SmoothTransformation)
+
+
+@functools.lru_cache(maxsize=SCALED_IMAGE_CACHE_SIZE)
+def load_scaled_icon(img_name: str, size: int) -> QIcon:
+    """Return QIcon built on the image scaled to the passed size.
+
+    Args:
+        img_name (str): name of the image.
+        size (int): side of the square in pixels.
+
+    Returns:
+        QIcon: icon with the scaled pixmap.
+    """
+    return QIcon(load_scaled_pixmap(img_name, size))
+
+
 def get_smallest_side_size(widget: QWidget) -> int:
     """Calculate the smallest side of the widget.
 
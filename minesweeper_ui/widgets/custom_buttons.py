@@ -1,9 +1,14 @@
 """Module contains custom buttons classes."""
 from PyQt6.QtCore import QEvent, QSize, Qt
-from PyQt6.QtGui import QCursor, QIcon
+from PyQt6.QtGui import QCursor
 from PyQt6.QtWidgets import QPushButton, QSizePolicy
 
-from minesweeper_ui.utils import get_smallest_side_size, load_icon
+from minesweeper_ui.utils import get_smallest_side_size, load_scaled_icon
+
+IMAGE_NEW_GAME: str = 'new_game.png'
+IMAGE_EXPLODED: str = 'exploded.png'
+IMAGE_WINNER: str = 'winner.png'
+IMAGE_WINK: str = 'wink.png'
 
 
 class QResetButton(QPushButton):
@@ -22,11 +27,7 @@ class QResetButton(QPushButton):
             parent (_type_): parent widget (container).
         """
         QPushButton.__init__(self, parent)
-        self._img_new_game: QIcon = load_icon('new_game.png')
-        self._img_exploded: QIcon = load_icon('exploded.png')
-        self._img_winner: QIcon = load_icon('winner.png')
-        self._img_wink: QIcon = load_icon('wink.png')
-        self._current_icon: QIcon = self._img_new_game
+        self._current_image: str = IMAGE_NEW_GAME
 
         expanding_policy: QSizePolicy.Policy = QSizePolicy.Policy.Expanding
         vh_size_policy: QSizePolicy = QSizePolicy(expanding_policy,
@@ -61,34 +62,34 @@ class QResetButton(QPushButton):
 
     def _apply_icon_wink(self) -> None:
         """Change current icon to the wink smile."""
-        self._apply_icon(self._img_wink)
+        self._apply_icon(IMAGE_WINK)
 
     def _previous_icon(self) -> None:
         """Change current icon to the previous."""
-        self._apply_icon(self._current_icon)
+        self._apply_icon(self._current_image)
 
-    def _apply_icon(self, icon: QIcon) -> None:
-        """Change current icon to the passed icon.
+    def _apply_icon(self, img_name: str) -> None:
+        """Change current icon to the passed image.
 
         Args:
-            icon (QIcon): icon that should be applied.
+            img_name (str): name of the image that should be applied.
         """
-        self.setIcon(icon)
         smallest_side: int = get_smallest_side_size(self)
+        self.setIcon(load_scaled_icon(img_name, smallest_side))
         self.setStyleSheet('border : 0; background: transparent;')
         self.setIconSize(QSize(smallest_side, smallest_side))
 
     def apply_icon_new_game(self) -> None:
         """Change current icon to the new game icon."""
-        self._current_icon = self._img_new_game
-        self._apply_icon(self._img_new_game)
+        self._current_image = IMAGE_NEW_GAME
+        self._apply_icon(IMAGE_NEW_GAME)
 
     def apply_icon_winner(self) -> None:
         """Change current icon to the winner icon."""
-        self._current_icon = self._img_winner
-        self._apply_icon(self._img_winner)
+        self._current_image = IMAGE_WINNER
+        self._apply_icon(IMAGE_WINNER)
 
     def apply_icon_exploded(self) -> None:
         """Change current icon to the exploded icon."""
-        self._current_icon = self._img_exploded
-        self._apply_icon(self._img_exploded)
+        self._current_image = IMAGE_EXPLODED
+        self._apply_icon(IMAGE_EXPLODED)
@@ -28,9 +28,15 @@ class QDialogForm(QWidget):
         QWidget (_type_): parent widget.
     """
 
-    def __init__(self) -> None:
-        """Initialize form with default configuration."""
+    def __init__(self, max_field_side: int = 100) -> None:
+        """Initialize form with default configuration.
+
+        Args:
+            max_field_side (int, optional): the biggest number of rows
+                and columns of the custom field. Defaults to 100.
+        """
         QWidget.__init__(self)
+        self._max_field_side: int = max_field_side
         self._number_of_rows: int = BEGINNER.number_of_rows
         self._number_of_columns: int = BEGINNER.number_of_columns
         self._number_of_mines: int = BEGINNER.number_of_mines
@@ -97,14 +103,14 @@ class QDialogForm(QWidget):
     def _configure_spin_box_number_of_rows(self) -> None:
         """Configure spin box values for the rows field."""
         self._spin_box_number_of_rows.setMinimum(9)
-        self._spin_box_number_of_rows.setMaximum(100)
+        self._spin_box_number_of_rows.setMaximum(self._max_field_side)
         self._spin_box_number_of_rows.valueChanged.connect(
             self._on_rows_value_changed)
 
     def _configure_spin_box_number_of_columns(self) -> None:
         """Configure spin box values for the columns field."""
         self._spin_box_number_of_columns.setMinimum(9)
-        self._spin_box_number_of_columns.setMaximum(100)
+        self._spin_box_number_of_columns.setMaximum(self._max_field_side)
         self._spin_box_number_of_columns.valueChanged.connect(
             self._on_columns_value_changed)
 
@@ -14,9 +14,15 @@ class QDialogWidget(QDialog):
         QDialog (_type_): parent class.
     """
 
-    def __init__(self) -> None:
-        """Initialize dialog widget."""
+    def __init__(self, max_field_side: int = 100) -> None:
+        """Initialize dialog widget.
+
+        Args:
+            max_field_side (int, optional): the biggest number of rows
+                and columns of the custom field. Defaults to 100.
+        """
         QDialog.__init__(self)
+        self._max_field_side: int = max_field_side
         self.setWindowTitle('Select complexity for new game')
         self.setLayout(self._create_layout())
         self.setFixedSize(QSize(380, 190))
@@ -42,7 +48,7 @@ class QDialogWidget(QDialog):
         Returns:
             QDialogForm: dialog form.
         """
-        self._form: QDialogForm = QDialogForm()
+        self._form: QDialogForm = QDialogForm(self._max_field_side)
         return self._form
 
     @property
@@ -7,11 +7,14 @@ from PyQt6.QtCore import QEvent, QSize, Qt
 from PyQt6.QtGui import QIcon
 from PyQt6.QtWidgets import QPushButton, QSizePolicy
 
-from minesweeper_core.data.cell import Cell
-from minesweeper_ui.utils import get_smallest_side_size, load_icon
+from minesweeper_core.data.cell import FieldCell
+from minesweeper_ui.utils import get_smallest_side_size, load_scaled_icon
 
 log: logging.Logger = logging.getLogger(__name__)
 
+IMAGE_BOMB: str = 'bomb.png'
+IMAGE_FLAG: str = 'flag.png'
+
 
 class CellColor(enum.Enum):
     """Represent available colors that are used in the game.
@@ -127,6 +130,78 @@ def build_style(back_ground_color: CellColor) -> str:
     return style
 
 
+# Visual states of the field button.
+BUTTON_STATE_INITIAL: str = 'initial'
+BUTTON_STATE_FLAG: str = 'flag'
+BUTTON_STATE_MINE: str = 'mine'
+BUTTON_STATE_OPEN: str = 'open'
+
+
+def get_button_state(cell: FieldCell, is_finished: bool) -> str:
+    """Return visual state of the button that represents the cell.
+
+    Args:
+        cell (FieldCell): cell.
+        is_finished (bool): game finished status.
+
+    Returns:
+        str: visual state, open states include the number of mines
+            around the cell, for example 'open-3'.
+    """
+    if is_finished and cell.has_mine:
+        return BUTTON_STATE_MINE
+    if is_finished or cell.is_open:
+        return f'{BUTTON_STATE_OPEN}-{cell.neighbour_mines}'
+    if cell.has_flag:
+        return BUTTON_STATE_FLAG
+    return BUTTON_STATE_INITIAL
+
+
+def _build_state_styles() -> dict[str, str]:
+    """Build styles of all the visual states of the button.
+
+    Returns:
+        dict[str, str]: mapping of the visual state to its style.
+    """
+    styles: dict[str, str] = {
+        BUTTON_STATE_INITIAL: build_style_by_color(
+            FieldColors.COLOR_INITIAL_STATE),
+        BUTTON_STATE_FLAG: build_style_by_color(FieldColors.COLOR_FLAG_STATE),
+        BUTTON_STATE_MINE: build_style_by_color(FieldColors.COLOR_OPEN_STATE),
+    }
+    for number_of_mines in COLOR_TO_MINES_MAPPING:
+        state: str = f'{BUTTON_STATE_OPEN}-{number_of_mines}'
+        styles[state] = build_style_by_mines(number_of_mines)
+    return styles
+
+
+def build_field_style_sheet(styles: dict[str, str]) -> str:
+    """Build style sheet of the field for all the button states.
+
+    Every state is selected by the value of the dynamic property of the
+    button, so the style sheet is parsed once for the whole field.
+
+    Args:
+        styles (dict[str, str]): mapping of the visual state to its style.
+
+    Returns:
+        str: style sheet.
+    """
+    return '\n'.join(
+        f'QPushButton[{STATE_PROPERTY}="{state}"] {{ {style} }}'
+        for state, style in styles.items())
+
+
+# Name of the dynamic property of the button with its visual state.
+STATE_PROPERTY: str = 'cellState'
+
+# Styles of the button visual states, built once at import time.
+STATE_STYLES: dict[str, str] = _build_state_styles()
+
+# Style sheet that should be set to the widget containing the buttons.
+FIELD_STYLE_SHEET: str = build_field_style_sheet(STATE_STYLES)
+
+
 class QFieldButtonCell(QPushButton):
     """Custom button to represent Field Cell.
 
@@ -134,26 +209,26 @@ class QFieldButtonCell(QPushButton):
         QPushButton (_type_): parent class.
     """
 
-    def __init__(self, cell: Cell,
-                 on_mouse_left_button_click: Callable[[Cell], None],
-                 on_mouse_right_button_click: Callable[[Cell], None]) -> None:
+    def __init__(self, cell: FieldCell,
+                 on_mouse_left_button_click: Callable[[FieldCell], None],
+                 on_mouse_right_button_click: Callable[[FieldCell], None]
+                 ) -> None:
         """Initialize button.
 
         Args:
-            cell (Cell): instance of the related cell.
-            on_mouse_left_button_click (Callable[[Cell], None]):
+            cell (FieldCell): instance of the related cell.
+            on_mouse_left_button_click (Callable[[FieldCell], None]):
                 handler of the left mouse button click
-            on_mouse_right_button_click (Callable[[Cell], None]):
+            on_mouse_right_button_click (Callable[[FieldCell], None]):
                 handler of the right mouse button click
         """
         QPushButton.__init__(self)
-        self._img_bomb: QIcon = load_icon('bomb.png')
-        self._img_flag: QIcon = load_icon('flag.png')
-        self._cell: Cell = cell
+        self._cell: FieldCell = cell
+        self._state: str | None = None
         self._on_mouse_left_button_click: Callable[
-            [Cell], None] = on_mouse_left_button_click
+            [FieldCell], None] = on_mouse_left_button_click
         self._on_mouse_right_button_click: Callable[
-            [Cell], None] = on_mouse_right_button_click
+            [FieldCell], None] = on_mouse_right_button_click
         size_policy: QSizePolicy = QSizePolicy(
             QSizePolicy.Policy.Expanding,
             QSizePolicy.Policy.Expanding
@@ -199,14 +274,52 @@ class QFieldButtonCell(QPushButton):
         """Handle right mouse button click event."""
         self._on_mouse_right_button_click(self.cell)
 
+    def apply_state(self, cell: FieldCell, is_finished: bool) -> None:
+        """Apply style of the cell state if it differs from current one.
+
+        Buttons remember the last applied state, so the style of the
+        button that already shows the state of the cell is not touched.
+
+        Args:
+            cell (FieldCell): current state of the related cell.
+            is_finished (bool): game finished status.
+        """
+        self._cell = cell
+        state: str = get_button_state(cell, is_finished)
+        if state == self._state:
+            return
+        if state == BUTTON_STATE_INITIAL:
+            self.apply_style_initial()
+        elif state == BUTTON_STATE_FLAG:
+            self.apply_style_flag()
+        elif is_finished:
+            self.apply_style_finish()
+        else:
+            self.apply_style_open()
+
+    def _apply_state_style(self, state: str) -> None:
+        """Switch style of the button to the style of the visual state.
+
+        Style is taken from FIELD_STYLE_SHEET of the parent widget by
+        the dynamic property, so the style sheet is not parsed again,
+        the button is only polished with the already parsed rules.
+
+        Args:
+            state (str): visual state of the button.
+        """
+        self._state = state
+        self.setProperty(STATE_PROPERTY, state)
+        style = self.style()
+        style.unpolish(self)
+        style.polish(self)
+
     def apply_style_initial(self) -> None:
         """Change button state that should be initial after game starts."""
         self.setEnabled(True)
         self.setChecked(False)
         self.setText('')
         self.setIcon(QIcon())
-        self.setStyleSheet(
-            build_style_by_color(FieldColors.COLOR_INITIAL_STATE))
+        self._apply_state_style(BUTTON_STATE_INITIAL)
 
     def apply_style_open(self) -> None:
         """Change button state that should be in open cell."""
@@ -215,14 +328,20 @@ class QFieldButtonCell(QPushButton):
         mines = self._cell.neighbour_mines
         val: str = f'{mines}' if mines > 0 else ''
         self.setText(val)
-        self.setStyleSheet(build_style_by_mines(self.cell.neighbour_mines))
+        self.setIcon(QIcon())
+        self._apply_state_style(f'{BUTTON_STATE_OPEN}-{mines}')
 
     def apply_style_flag(self) -> None:
-        """Change button state that should be in flagged cell."""
+        """Change button state that should be in flagged cell.
+
+        The cell is flagged again when the action of the finished game
+        is undone, so the number of the open cell is removed as well.
+        """
         self.setEnabled(True)
         self.setChecked(False)
-        self._apply_icon(self._img_flag)
-        self.setStyleSheet(build_style_by_color(FieldColors.COLOR_FLAG_STATE))
+        self.setText('')
+        self._apply_icon(IMAGE_FLAG)
+        self._apply_state_style(BUTTON_STATE_FLAG)
 
     def apply_style_finish(self) -> None:
         """Change button state that should be when game is finished."""
@@ -233,36 +352,37 @@ class QFieldButtonCell(QPushButton):
         final_value: str = '' if self.cell.has_mine else number_of_mines
         self.setText(final_value)
         if self.cell.has_mine:
-            self.setStyleSheet(
-                build_style_by_color(FieldColors.COLOR_OPEN_STATE))
-            self._apply_icon(self._img_bomb)
+            self._apply_state_style(BUTTON_STATE_MINE)
+            self._apply_icon(IMAGE_BOMB)
         else:
             self.apply_style_open()
 
-    def _apply_icon(self, icon: QIcon) -> None:
-        """Change icon to the passed.
+    def _apply_icon(self, img_name: str) -> None:
+        """Change icon to the image scaled to the button size.
+
+        Scaled icons are shared by all the buttons of the same size.
 
         Args:
-            icon (QIcon): icon.
+            img_name (str): name of the image.
         """
-        self.setIcon(icon)
         smallest_side: int = get_smallest_side_size(self)
+        self.setIcon(load_scaled_icon(img_name, smallest_side))
         self.setIconSize(QSize(smallest_side, smallest_side))
 
     @property
-    def cell(self) -> Cell:
+    def cell(self) -> FieldCell:
         """Return related cell.
 
         Returns:
-            Cell: cell
+            FieldCell: cell
         """
         return self._cell
 
     @cell.setter
-    def cell(self, cell: Cell) -> None:
+    def cell(self, cell: FieldCell) -> None:
         """Set related cell for this button.
 
         Args:
-            cell (Cell): cell.
+            cell (FieldCell): cell.
         """
         self._cell = cell
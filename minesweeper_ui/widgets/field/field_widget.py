@@ -6,26 +6,27 @@ from PyQt6.QtWidgets import QGridLayout, QLayoutItem, QWidget
 import minesweeper_ui.game_instance as instance
 from minesweeper_core.api.dtos import GameInformation
 from minesweeper_core.api.markers import ControllerActions
-from minesweeper_core.data.cell import Cell
-from minesweeper_ui.widgets.field.field_button import QFieldButtonCell
+from minesweeper_core.data.cell import FieldCell
+from minesweeper_ui.widgets.field.field_button import (FIELD_STYLE_SHEET,
+                                                       QFieldButtonCell)
 
 log: logging.Logger = logging.getLogger(__name__)
 
 
-def _on_mouse_right_button_click(cell: Cell) -> None:
+def _on_mouse_right_button_click(cell: FieldCell) -> None:
     """Handle right button click event from the button.
 
     Args:
-        cell (Cell): cell related to the button.
+        cell (FieldCell): cell related to the button.
     """
     instance.CONTROLLER.flag_cell(cell.row, cell.column)
 
 
-def _on_mouse_left_button_click(cell: Cell) -> None:
+def _on_mouse_left_button_click(cell: FieldCell) -> None:
     """Handle left button click event from the button.
 
     Args:
-        cell (Cell): cell related to the button.
+        cell (FieldCell): cell related to the button.
     """
     instance.CONTROLLER.open_cell(cell.row, cell.column)
 
@@ -41,6 +42,7 @@ class QWidgetFieldMinesweeper(QWidget):
         """Initialize widget and configure defaults."""
         super().__init__()
         log.debug('start')
+        self.setStyleSheet(FIELD_STYLE_SHEET)
         self._init_widget_layout()
         self._init_field_buttons()
         self._subscribe_to_game_events()
@@ -49,7 +51,10 @@ class QWidgetFieldMinesweeper(QWidget):
             ControllerActions.NEW_GAME: self._build_mines_field,
             ControllerActions.RESET_GAME: self._reset_field_state,
             ControllerActions.CELL_OPENED: self._update_mines_field_state,
-            ControllerActions.CELL_FLAGGED: self._update_mines_field_state}
+            ControllerActions.CELL_FLAGGED: self._update_mines_field_state,
+            ControllerActions.GAME_LOADED: self._build_mines_field,
+            ControllerActions.UNDO: self._update_mines_field_state,
+            ControllerActions.REDO: self._update_mines_field_state}
         log.debug('end')
 
     def _init_widget_layout(self) -> None:
@@ -60,35 +65,85 @@ class QWidgetFieldMinesweeper(QWidget):
         self.setLayout(self._field_grid_layout)
 
     def _init_field_buttons(self) -> None:
-        """Initialize buttons container."""
+        """Initialize buttons container.
+
+        Container is a pool of the buttons placed in the layout by their
+        coordinates. Buttons are created once and are hidden when the
+        field is smaller than the pool, so the next game reuses them.
+        """
         self._field_buttons: dict[tuple[int, int], QFieldButtonCell] = {}
+        self._number_of_rows: int = 0
+        self._number_of_columns: int = 0
 
     def _subscribe_to_game_events(self) -> None:
         """Subscribe to the update events of the game controller."""
         instance.subscribe_to_updates(self._on_game_status_update_callback)
 
+    def unsubscribe_from_game_events(self) -> None:
+        """Stop receiving game updates before the widget is removed."""
+        instance.unsubscribe_from_updates(
+            self._on_game_status_update_callback)
+
     def _build_mines_field(self, game_info: GameInformation) -> None:
         """Build field of the buttons that represent game field.
 
+        Buttons of the pool are reused in place, only buttons missing
+        for the bigger field are created and the ones outside of the
+        smaller field are hidden.
+
         Args:
             game_info (GameInformation): game information.
         """
         if game_info is not None:
-            self.clear_field()
-            field = game_info.game_field.values()
-            for cell in field:
-                row_index: int = cell.row
-                col_index: int = cell.column
-                left_btn_handler = _on_mouse_left_button_click
-                right_btn_handler = _on_mouse_right_button_click
-                btn: QFieldButtonCell = QFieldButtonCell(
-                    cell=cell,
-                    on_mouse_left_button_click=left_btn_handler,
-                    on_mouse_right_button_click=right_btn_handler)
-                btn.apply_style_initial()
-                self._field_grid_layout.addWidget(btn, row_index, col_index)
-                self._field_grid_layout.setColumnMinimumWidth(col_index, 10)
-                self._field_buttons[(row_index, col_index)] = btn
+            rows: int = game_info.number_of_rows
+            columns: int = game_info.number_of_columns
+            self.setUpdatesEnabled(False)
+            for cell in game_info.game_field.values():
+                btn: QFieldButtonCell | None = self._field_buttons.get(
+                    (cell.row, cell.column))
+                if btn is None:
+                    btn = self._create_field_button(cell)
+                btn.apply_state(cell, game_info.is_finished)
+                if btn.isHidden():
+                    btn.show()
+            self._hide_field_buttons_outside(rows, columns)
+            for col_index in range(max(columns, self._number_of_columns)):
+                self._field_grid_layout.setColumnMinimumWidth(
+                    col_index, 10 if col_index < columns else 0)
+            self._number_of_rows = rows
+            self._number_of_columns = columns
+            self.setUpdatesEnabled(True)
+
+    def _create_field_button(self, cell: FieldCell) -> QFieldButtonCell:
+        """Create button for the cell and add it to the pool and layout.
+
+        Args:
+            cell (FieldCell): cell related to the button.
+
+        Returns:
+            QFieldButtonCell: created button.
+        """
+        btn: QFieldButtonCell = QFieldButtonCell(
+            cell=cell,
+            on_mouse_left_button_click=_on_mouse_left_button_click,
+            on_mouse_right_button_click=_on_mouse_right_button_click)
+        self._field_grid_layout.addWidget(btn, cell.row, cell.column)
+        self._field_buttons[(cell.row, cell.column)] = btn
+        return btn
+
+    def _hide_field_buttons_outside(self, rows: int, columns: int) -> None:
+        """Hide pooled buttons that are outside of the field.
+
+        Args:
+            rows (int): number of rows of the field.
+            columns (int): number of columns of the field.
+        """
+        if rows >= self._number_of_rows and columns >= self._number_of_columns:
+            return
+        for (row_index, col_index), btn in self._field_buttons.items():
+            if (row_index >= rows or col_index >= columns) and (
+                    not btn.isHidden()):
+                btn.hide()
 
     def clear_field(self) -> None:
         """Remove all buttons from the widget.
@@ -100,6 +155,8 @@ class QWidgetFieldMinesweeper(QWidget):
             if layout_item.widget():
                 layout_item.widget().deleteLater()
         self._field_buttons.clear()
+        self._number_of_rows = 0
+        self._number_of_columns = 0
         self.layout().update()
 
     def _on_game_status_update_callback(self,
@@ -117,6 +174,8 @@ class QWidgetFieldMinesweeper(QWidget):
     def _reset_field_state(self, game_info: GameInformation) -> None:
         """Reset all buttons in the widget.
 
+        Buttons that already show the initial state are not restyled.
+
         Args:
             game_info (GameInformation): game information.
         """
@@ -124,22 +183,24 @@ class QWidgetFieldMinesweeper(QWidget):
             row_index: int = cell.row
             col_index: int = cell.column
             btn: QFieldButtonCell = self._field_buttons[(row_index, col_index)]
-            btn.cell = cell
-            btn.apply_style_initial()
+            btn.apply_state(cell, game_info.is_finished)
 
     def _update_mines_field_state(self, game_info: GameInformation) -> None:
         """Update buttons state in the widget based on the game info.
 
+        Only buttons of the cells from the change set of the action are
+        updated. If the change set is not available, all the buttons
+        are checked, but only the ones with changed state are restyled.
+
         Args:
             game_info (GameInformation): game information.
         """
-        for cell in game_info.game_field.values():
+        changed_cells = game_info.changed_cells
+        if changed_cells is None:
+            cells = game_info.game_field.values()
+        else:
+            cells = changed_cells.cells()
+        for cell in cells:
             button: QFieldButtonCell = self._field_buttons[(
                 cell.row, cell.column)]
-            button.apply_style_initial()
-            if game_info.is_finished:
-                button.apply_style_finish()
-            elif cell.is_open:
-                button.apply_style_open()
-            elif cell.has_flag:
-                button.apply_style_flag()
+            button.apply_state(cell, game_info.is_finished)
@@ -0,0 +1,529 @@
+"""Module contains QPaintedFieldMinesweeper class.
+
+The widget draws the game field in one paintEvent instead of creating
+a button per cell. Only the cells inside the viewport are read from the
+game field and painted, so the cost of the widget depends on the size
+of the viewport, not on the size of the field.
+"""
+import logging
+from collections.abc import Mapping
+
+from PyQt6.QtCore import QPoint, QRect, Qt
+from PyQt6.QtGui import (QColor, QKeyEvent, QMouseEvent, QPainter,
+                         QPaintEvent, QResizeEvent, QWheelEvent)
+from PyQt6.QtWidgets import QAbstractScrollArea, QFrame
+
+import minesweeper_ui.game_instance as instance
+from minesweeper_core.api.dtos import GameInformation
+from minesweeper_core.api.markers import ControllerActions
+from minesweeper_core.data.board import (FLAG_BIT, MINE_BIT,
+                                         NEIGHBOUR_MINES_MASK, OPEN_BIT,
+                                         FieldView)
+from minesweeper_core.data.cell import FieldCell
+from minesweeper_ui.utils import load_scaled_pixmap
+from minesweeper_ui.widgets.field.field_button import (
+    BUTTON_STATE_FLAG, BUTTON_STATE_INITIAL, BUTTON_STATE_MINE,
+    BUTTON_STATE_OPEN, COLOR_TEXT_MAPPING, COLOR_TO_MINES_MAPPING, IMAGE_BOMB,
+    IMAGE_FLAG, CellColor, FieldColors)
+
+log: logging.Logger = logging.getLogger(__name__)
+
+# Limits of the side of the painted cell in pixels. Fields that don't
+# fit the viewport with the current size of the cell are scrolled.
+MIN_CELL_SIZE: int = 4
+MAX_CELL_SIZE: int = 64
+
+# Cells smaller than this size are painted without borders, numbers and
+# images, only by the color of their state.
+MIN_DETAILED_CELL_SIZE: int = 8
+
+# Ratio of the cell sizes of the neighbour zoom levels.
+ZOOM_FACTOR: float = 1.25
+
+# Changes with more cells repaint the whole visible field instead of
+# the separate cells.
+MAX_DIRTY_CELLS: int = 64
+
+
+def get_packed_state_name(state: int, is_finished: bool) -> str:
+    """Return visual state of the cell by its packed state.
+
+    Visual states are the same as the states of the field buttons.
+
+    Args:
+        state (int): cell state packed into one byte.
+        is_finished (bool): game finished status.
+
+    Returns:
+        str: visual state, open states include the number of mines
+            around the cell, for example 'open-3'.
+    """
+    if is_finished and state & MINE_BIT:
+        return BUTTON_STATE_MINE
+    if is_finished or state & OPEN_BIT:
+        return f'{BUTTON_STATE_OPEN}-{state & NEIGHBOUR_MINES_MASK}'
+    if state & FLAG_BIT:
+        return BUTTON_STATE_FLAG
+    return BUTTON_STATE_INITIAL
+
+
+def pack_cell_state(cell: FieldCell) -> int:
+    """Pack state of the cell into one byte.
+
+    Args:
+        cell (FieldCell): cell.
+
+    Returns:
+        int: packed state.
+    """
+    return (cell.neighbour_mines
+            | (OPEN_BIT if cell.is_open else 0)
+            | (MINE_BIT if cell.has_mine else 0)
+            | (FLAG_BIT if cell.has_flag else 0))
+
+
+def _build_state_colors() -> dict[str, CellColor]:
+    """Build background colors of all the visual states of the cell.
+
+    Returns:
+        dict[str, CellColor]: mapping of the visual state to its color.
+    """
+    colors: dict[str, CellColor] = {
+        BUTTON_STATE_INITIAL: FieldColors.COLOR_INITIAL_STATE.value,
+        BUTTON_STATE_FLAG: FieldColors.COLOR_FLAG_STATE.value,
+        BUTTON_STATE_MINE: FieldColors.COLOR_OPEN_STATE.value,
+    }
+    for number_of_mines, color in COLOR_TO_MINES_MAPPING.items():
+        colors[f'{BUTTON_STATE_OPEN}-{number_of_mines}'] = color
+    return colors
+
+
+# Background colors of the visual states of the cell.
+STATE_COLORS: dict[str, CellColor] = _build_state_colors()
+
+# Visual states of all the packed states, indexed by [is_finished][state].
+_STATE_NAMES: tuple[tuple[str, ...], tuple[str, ...]] = tuple(
+    tuple(get_packed_state_name(state, is_finished) for state in range(256))
+    for is_finished in (False, True))
+
+
+class QPaintedFieldMinesweeper(QAbstractScrollArea):
+    """Represent the Game Field painted by one widget.
+
+    The widget keeps only the reference to the game field, states of
+    the visible cells are read on every paint and changed cells are
+    repainted by the change set of the action. The field is fitted to
+    the viewport until it is zoomed by Ctrl + mouse wheel or Ctrl + '+',
+    Ctrl + '-' keys, Ctrl + '0' fits it again.
+
+    Args:
+        QAbstractScrollArea (_type_): parent class.
+    """
+
+    def __init__(self) -> None:
+        """Initialize widget and configure defaults."""
+        super().__init__()
+        log.debug('start')
+        self._game_field: Mapping[tuple[int, int], FieldCell] = {}
+        self._rows: int = 0
+        self._columns: int = 0
+        self._is_finished: bool = False
+        self._cell_size: int = MIN_CELL_SIZE
+        self._is_fitted: bool = True
+        self._colors: dict[str, tuple[QColor, QColor]] = {
+            state: (QColor(color.value),
+                    QColor(COLOR_TEXT_MAPPING[color].value))
+            for state, color in STATE_COLORS.items()}
+        self.setFrameShape(QFrame.Shape.NoFrame)
+        self.setFocusPolicy(Qt.FocusPolicy.WheelFocus)
+        self._status_update_handlers = {
+            ControllerActions.NEW_GAME: self._load_field,
+            ControllerActions.RESET_GAME: self._load_field,
+            ControllerActions.CELL_OPENED: self._update_field_state,
+            ControllerActions.CELL_FLAGGED: self._update_field_state,
+            ControllerActions.GAME_LOADED: self._load_field,
+            ControllerActions.UNDO: self._update_field_state,
+            ControllerActions.REDO: self._update_field_state}
+        self._subscribe_to_game_events()
+        game_info: GameInformation | None = (
+            instance.CONTROLLER.get_game_info())
+        if game_info is not None:
+            self._load_field(game_info)
+        log.debug('end')
+
+    def _subscribe_to_game_events(self) -> None:
+        """Subscribe to the update events of the game controller."""
+        instance.subscribe_to_updates(self._on_game_status_update_callback)
+
+    def unsubscribe_from_game_events(self) -> None:
+        """Stop receiving game updates before the widget is removed."""
+        instance.unsubscribe_from_updates(
+            self._on_game_status_update_callback)
+
+    def _on_game_status_update_callback(self,
+                                        game_info: GameInformation) -> None:
+        """Handle game update event.
+
+        Args:
+            game_info (GameInformation): game information.
+        """
+        log.debug('_on_game_status_update_callback, game_info: %s', game_info)
+        if game_info is not None:
+            handler = self._status_update_handlers[game_info.controller_action]
+            handler(game_info)
+
+    def _load_field(self, game_info: GameInformation) -> None:
+        """Show the field of the game and fit it to the viewport.
+
+        Args:
+            game_info (GameInformation): game information.
+        """
+        log.debug('_load_field, rows: %d, columns: %d',
+                  game_info.number_of_rows, game_info.number_of_columns)
+        self._game_field = game_info.game_field
+        self._rows = game_info.number_of_rows
+        self._columns = game_info.number_of_columns
+        self._is_finished = game_info.is_finished
+        self.fit_to_viewport()
+
+    def _update_field_state(self, game_info: GameInformation) -> None:
+        """Repaint the visible cells changed by the action.
+
+        If the change set is not available, the whole viewport is
+        repainted.
+
+        Args:
+            game_info (GameInformation): game information.
+        """
+        changed_cells = game_info.changed_cells
+        is_finished_changed: bool = self._is_finished != game_info.is_finished
+        self._is_finished = game_info.is_finished
+        if (changed_cells is None or is_finished_changed
+                or len(changed_cells) > MAX_DIRTY_CELLS):
+            self.viewport().update()
+            return
+        visible: QRect = self.viewport().rect()
+        for index in changed_cells.indexes:
+            cell_rect: QRect = self._cell_rect(index)
+            if visible.intersects(cell_rect):
+                self.viewport().update(cell_rect)
+
+    @property
+    def cell_size(self) -> int:
+        """Return side of the painted cell in pixels.
+
+        Returns:
+            int: side of the cell.
+        """
+        return self._cell_size
+
+    def fit_to_viewport(self) -> None:
+        """Choose the cell size that fits the field into the viewport."""
+        self._is_fitted = True
+        self._set_cell_size(self._fitted_cell_size())
+
+    def zoom(self, steps: int, anchor: QPoint | None = None) -> None:
+        """Change the cell size by the number of zoom steps.
+
+        The cell under the anchor keeps its position in the viewport.
+
+        Args:
+            steps (int): positive steps zoom in, negative zoom out.
+            anchor (QPoint | None, optional): position in the viewport.
+                Defaults to the center of the viewport.
+        """
+        size: float = self._cell_size * ZOOM_FACTOR ** steps
+        new_size: int = round(size)
+        if new_size == self._cell_size:
+            new_size += 1 if steps > 0 else -1
+        self._is_fitted = False
+        self._set_cell_size(new_size, anchor)
+
+    def _fitted_cell_size(self) -> int:
+        """Return the cell size that fits the field into the viewport.
+
+        Returns:
+            int: side of the cell in pixels.
+        """
+        if not self._rows or not self._columns:
+            return MIN_CELL_SIZE
+        return min(self.viewport().width() // self._columns,
+                   self.viewport().height() // self._rows)
+
+    def _set_cell_size(self, size: int, anchor: QPoint | None = None) -> None:
+        """Apply the cell size and update scroll bars and the viewport.
+
+        Args:
+            size (int): side of the cell in pixels.
+            anchor (QPoint | None, optional): position in the viewport
+                that keeps the same cell under it. Defaults to the
+                center of the viewport.
+        """
+        if anchor is None:
+            anchor = self.viewport().rect().center()
+        origin: QPoint = self._origin()
+        field_x: float = (anchor.x() - origin.x()) / self._cell_size
+        field_y: float = (anchor.y() - origin.y()) / self._cell_size
+        self._cell_size = max(MIN_CELL_SIZE, min(MAX_CELL_SIZE, size))
+        self._update_scroll_bars()
+        self.horizontalScrollBar().setValue(
+            round(field_x * self._cell_size) - anchor.x())
+        self.verticalScrollBar().setValue(
+            round(field_y * self._cell_size) - anchor.y())
+        self.viewport().update()
+
+    def _update_scroll_bars(self) -> None:
+        """Set ranges of the scroll bars by the size of the field."""
+        viewport_width: int = self.viewport().width()
+        viewport_height: int = self.viewport().height()
+        horizontal = self.horizontalScrollBar()
+        horizontal.setRange(
+            0, max(0, self._columns * self._cell_size - viewport_width))
+        horizontal.setPageStep(viewport_width)
+        horizontal.setSingleStep(self._cell_size)
+        vertical = self.verticalScrollBar()
+        vertical.setRange(
+            0, max(0, self._rows * self._cell_size - viewport_height))
+        vertical.setPageStep(viewport_height)
+        vertical.setSingleStep(self._cell_size)
+
+    def _origin(self) -> QPoint:
+        """Return position of the top left corner of the field.
+
+        The field that is smaller than the viewport is centered,
+        otherwise it is moved by the scroll bars.
+
+        Returns:
+            QPoint: position of the field in the viewport.
+        """
+        field_width: int = self._columns * self._cell_size
+        field_height: int = self._rows * self._cell_size
+        viewport_width: int = self.viewport().width()
+        viewport_height: int = self.viewport().height()
+        x: int = ((viewport_width - field_width) // 2
+                  if field_width < viewport_width
+                  else -self.horizontalScrollBar().value())
+        y: int = ((viewport_height - field_height) // 2
+                  if field_height < viewport_height
+                  else -self.verticalScrollBar().value())
+        return QPoint(x, y)
+
+    def _cell_rect(self, index: int) -> QRect:
+        """Return area of the cell in the viewport.
+
+        Args:
+            index (int): index of the cell.
+
+        Returns:
+            QRect: area of the cell.
+        """
+        origin: QPoint = self._origin()
+        row, column = divmod(index, self._columns)
+        return QRect(origin.x() + column * self._cell_size,
+                     origin.y() + row * self._cell_size,
+                     self._cell_size, self._cell_size)
+
+    def cell_at(self, position: QPoint) -> tuple[int, int] | None:
+        """Return coordinate of the cell under the position.
+
+        Args:
+            position (QPoint): position in the viewport.
+
+        Returns:
+            tuple[int, int] | None: coordinate as tuple[row, column] or
+                None if there is no cell under the position.
+        """
+        origin: QPoint = self._origin()
+        x: int = position.x() - origin.x()
+        y: int = position.y() - origin.y()
+        if x < 0 or y < 0:
+            return None
+        row: int = y // self._cell_size
+        column: int = x // self._cell_size
+        if row >= self._rows or column >= self._columns:
+            return None
+        return row, column
+
+    def _read_states(self, row: int, first_column: int,
+                     last_column: int) -> bytes:
+        """Return packed states of the cells of the row.
+
+        Args:
+            row (int): row number.
+            first_column (int): first column.
+            last_column (int): column after the last one.
+
+        Returns:
+            bytes: packed states of the cells.
+        """
+        start: int = row * self._columns
+        if isinstance(self._game_field, FieldView):
+            return self._game_field.packed_states(start + first_column,
+                                                  start + last_column)
+        return bytes(pack_cell_state(self._game_field[(row, column)])
+                     for column in range(first_column, last_column))
+
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        """Keep the field fitted or update the scroll bars on resize.
+
+        Args:
+            event (QResizeEvent): resize event.
+        """
+        super().resizeEvent(event)
+        if self._is_fitted:
+            self._set_cell_size(self._fitted_cell_size())
+        else:
+            self._update_scroll_bars()
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        """Paint cells of the field inside the exposed area.
+
+        Args:
+            event (QPaintEvent): paint event.
+        """
+        if not self._rows or not self._columns:
+            return
+        cell_size: int = self._cell_size
+        origin: QPoint = self._origin()
+        area: QRect = event.rect().translated(-origin.x(), -origin.y())
+        first_row: int = max(0, area.top() // cell_size)
+        last_row: int = min(self._rows, area.bottom() // cell_size + 1)
+        first_column: int = max(0, area.left() // cell_size)
+        last_column: int = min(self._columns,
+                               area.right() // cell_size + 1)
+        if first_row >= last_row or first_column >= last_column:
+            return
+        painter: QPainter = QPainter(self.viewport())
+        painter.translate(origin)
+        font = painter.font()
+        font.setPixelSize(max(1, cell_size * 3 // 5))
+        painter.setFont(font)
+        self._paint_cells(painter, first_row, last_row,
+                          first_column, last_column)
+        if cell_size >= MIN_DETAILED_CELL_SIZE:
+            self._paint_grid(painter, first_row, last_row,
+                             first_column, last_column)
+        painter.end()
+
+    def _paint_cells(self, painter: QPainter,
+                     first_row: int, last_row: int,
+                     first_column: int, last_column: int) -> None:
+        """Paint background, numbers and images of the visible cells.
+
+        The area is filled with the color of the initial state at once,
+        so the closed cells are not painted one by one.
+
+        Args:
+            painter (QPainter): painter translated to the field origin.
+            first_row (int): first painted row.
+            last_row (int): row after the last painted one.
+            first_column (int): first painted column.
+            last_column (int): column after the last painted one.
+        """
+        cell_size: int = self._cell_size
+        painter.fillRect(
+            first_column * cell_size, first_row * cell_size,
+            (last_column - first_column) * cell_size,
+            (last_row - first_row) * cell_size,
+            self._colors[BUTTON_STATE_INITIAL][0])
+        names: tuple[str, ...] = _STATE_NAMES[self._is_finished]
+        colors: dict[str, tuple[QColor, QColor]] = self._colors
+        is_detailed: bool = cell_size >= MIN_DETAILED_CELL_SIZE
+        flag = load_scaled_pixmap(IMAGE_FLAG, cell_size)
+        bomb = load_scaled_pixmap(IMAGE_BOMB, cell_size)
+        center = Qt.AlignmentFlag.AlignCenter
+        for row in range(first_row, last_row):
+            states: bytes = self._read_states(row, first_column, last_column)
+            y: int = row * cell_size
+            for column, state in enumerate(states, first_column):
+                name: str = names[state]
+                if name == BUTTON_STATE_INITIAL:
+                    continue
+                x: int = column * cell_size
+                background, text = colors[name]
+                painter.fillRect(x, y, cell_size, cell_size, background)
+                if not is_detailed:
+                    continue
+                if name == BUTTON_STATE_FLAG:
+                    painter.drawPixmap(x, y, flag)
+                elif name == BUTTON_STATE_MINE:
+                    painter.drawPixmap(x, y, bomb)
+                elif state & NEIGHBOUR_MINES_MASK:
+                    painter.setPen(text)
+                    painter.drawText(x, y, cell_size, cell_size, center,
+                                     str(state & NEIGHBOUR_MINES_MASK))
+
+    def _paint_grid(self, painter: QPainter,
+                    first_row: int, last_row: int,
+                    first_column: int, last_column: int) -> None:
+        """Paint borders of the visible cells.
+
+        Args:
+            painter (QPainter): painter translated to the field origin.
+            first_row (int): first painted row.
+            last_row (int): row after the last painted one.
+            first_column (int): first painted column.
+            last_column (int): column after the last painted one.
+        """
+        cell_size: int = self._cell_size
+        painter.setPen(QColor(CellColor.COLOR_BLACK.value))
+        left: int = first_column * cell_size
+        right: int = last_column * cell_size
+        top: int = first_row * cell_size
+        bottom: int = last_row * cell_size
+        for row in range(first_row, last_row + 1):
+            y: int = row * cell_size
+            painter.drawLine(left, y, right, y)
+        for column in range(first_column, last_column + 1):
+            x: int = column * cell_size
+            painter.drawLine(x, top, x, bottom)
+
+    def mousePressEvent(self, event: QMouseEvent) -> None:
+        """Open or flag the cell under the mouse.
+
+        Args:
+            event (QMouseEvent): mouse event.
+        """
+        coordinate = self.cell_at(event.position().toPoint())
+        log.debug('mousePressEvent, coordinate: %s', coordinate)
+        if coordinate is None:
+            return
+        row, column = coordinate
+        if event.button() == Qt.MouseButton.LeftButton:
+            instance.CONTROLLER.open_cell(row, column)
+        elif event.button() == Qt.MouseButton.RightButton:
+            instance.CONTROLLER.flag_cell(row, column)
+
+    def wheelEvent(self, event: QWheelEvent) -> None:
+        """Zoom the field by Ctrl + mouse wheel, otherwise scroll it.
+
+        Args:
+            event (QWheelEvent): wheel event.
+        """
+        if not event.modifiers() & Qt.KeyboardModifier.ControlModifier:
+            super().wheelEvent(event)
+            return
+        delta: int = event.angleDelta().y()
+        if delta:
+            self.zoom(1 if delta > 0 else -1,
+                      event.position().toPoint())
+        event.accept()
+
+    def keyPressEvent(self, event: QKeyEvent) -> None:
+        """Zoom the field by Ctrl + '+', Ctrl + '-' and Ctrl + '0' keys.
+
+        Args:
+            event (QKeyEvent): key event.
+        """
+        if not event.modifiers() & Qt.KeyboardModifier.ControlModifier:
+            super().keyPressEvent(event)
+            return
+        key: int = event.key()
+        if key in (Qt.Key.Key_Plus.value, Qt.Key.Key_Equal.value):
+            self.zoom(1)
+        elif key == Qt.Key.Key_Minus.value:
+            self.zoom(-1)
+        elif key == Qt.Key.Key_0.value:
+            self.fit_to_viewport()
+        else:
+            super().keyPressEvent(event)
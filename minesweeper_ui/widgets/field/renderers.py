@@ -0,0 +1,52 @@
+"""Module contains available renderers of the game field.
+
+Renderer could be changed at runtime from the menu, the default one is
+taken from the MINESWEEPER_FIELD_RENDERER environment variable.
+"""
+import logging
+import os
+
+from PyQt6.QtWidgets import QWidget
+
+from minesweeper_ui.widgets.field.field_widget import QWidgetFieldMinesweeper
+from minesweeper_ui.widgets.field.painted_field_widget import \
+    QPaintedFieldMinesweeper
+
+log: logging.Logger = logging.getLogger(__name__)
+
+# Field of the buttons, one QPushButton per cell.
+FIELD_RENDERER_BUTTONS: str = 'buttons'
+# Field painted by one widget.
+FIELD_RENDERER_PAINTED: str = 'painted'
+
+FIELD_RENDERERS: dict[str, type[QWidget]] = {
+    FIELD_RENDERER_BUTTONS: QWidgetFieldMinesweeper,
+    FIELD_RENDERER_PAINTED: QPaintedFieldMinesweeper
+}
+
+# The biggest number of rows or columns the renderer handles smoothly.
+MAX_FIELD_SIDES: dict[str, int] = {
+    FIELD_RENDERER_BUTTONS: 100,
+    FIELD_RENDERER_PAINTED: 1000
+}
+
+DEFAULT_FIELD_RENDERER: str = os.environ.get('MINESWEEPER_FIELD_RENDERER',
+                                             FIELD_RENDERER_BUTTONS)
+
+
+def create_field_widget(renderer: str) -> QWidget:
+    """Create field widget of the renderer.
+
+    Args:
+        renderer (str): name of the renderer.
+
+    Raises:
+        ValueError: raised if the renderer is unknown.
+
+    Returns:
+        QWidget: field widget subscribed to the game updates.
+    """
+    log.debug('create_field_widget, renderer: %s', renderer)
+    if renderer not in FIELD_RENDERERS:
+        raise ValueError(f'Unknown field renderer: {renderer}')
+    return FIELD_RENDERERS[renderer]()
@@ -14,7 +14,11 @@ from minesweeper_core.constants.configurations import BEGINNER
 from minesweeper_core.data.field_configuration import Configuration
 from minesweeper_ui.widgets.custom_buttons import QResetButton
 from minesweeper_ui.widgets.dialogs.new_game.dialog_widget import QDialogWidget
-from minesweeper_ui.widgets.field.field_widget import QWidgetFieldMinesweeper
+from minesweeper_ui.widgets.field.renderers import (DEFAULT_FIELD_RENDERER,
+                                                    FIELD_RENDERER_BUTTONS,
+                                                    FIELD_RENDERER_PAINTED,
+                                                    MAX_FIELD_SIDES,
+                                                    create_field_widget)
 
 log: logging.Logger = logging.getLogger(__name__)
 
@@ -36,7 +40,8 @@ class QMainWindowMinesweeper(QMainWindow):
         self._timer_time: int = 0
 
         self.setWindowTitle('Minesweeper')
-        self._field_widget: QWidgetFieldMinesweeper = QWidgetFieldMinesweeper()
+        self._field_renderer: str = DEFAULT_FIELD_RENDERER
+        self._field_widget: QWidget = create_field_widget(self._field_renderer)
         self._init_menu_items()
         self._create_window_container_widget_and_layout()
         self._create_control_widget_container_and_layout()
@@ -84,6 +89,12 @@ class QMainWindowMinesweeper(QMainWindow):
         """Create actions for the game menu."""
         self._action_new_game: QAction = QAction(self._game_menu)
         self._action_reset_game: QAction = QAction(self._game_menu)
+        self._action_undo: QAction = QAction(self._game_menu)
+        self._action_redo: QAction = QAction(self._game_menu)
+        self._action_painted_field: QAction = QAction(self._game_menu)
+        self._action_painted_field.setCheckable(True)
+        self._action_painted_field.setChecked(
+            self._field_renderer == FIELD_RENDERER_PAINTED)
         self._action_exit: QAction = QAction(self._game_menu)
 
     def _set_game_menu_action_roles(self) -> None:
@@ -92,12 +103,21 @@ class QMainWindowMinesweeper(QMainWindow):
             QAction.MenuRole.ApplicationSpecificRole)
         self._action_reset_game.setMenuRole(
             QAction.MenuRole.ApplicationSpecificRole)
+        self._action_undo.setMenuRole(
+            QAction.MenuRole.ApplicationSpecificRole)
+        self._action_redo.setMenuRole(
+            QAction.MenuRole.ApplicationSpecificRole)
+        self._action_painted_field.setMenuRole(
+            QAction.MenuRole.ApplicationSpecificRole)
         self._action_exit.setMenuRole(QAction.MenuRole.QuitRole)
 
     def _set_game_menu_action_texts(self) -> None:
         """Set text for the menu actions."""
         self._action_new_game.setText('New Game')
         self._action_reset_game.setText('Reset Game')
+        self._action_undo.setText('Undo')
+        self._action_redo.setText('Redo')
+        self._action_painted_field.setText('Painted Field')
         self._action_exit.setText('Exit')
 
     def _add_game_menu_action_tool_tips(self) -> None:
@@ -105,18 +125,28 @@ class QMainWindowMinesweeper(QMainWindow):
         self._action_new_game.setToolTip('Start New Game')
         self._action_reset_game.setToolTip(
             'Start New Game with Previous Configuration')
+        self._action_undo.setToolTip('Undo The Last Action')
+        self._action_redo.setToolTip('Redo The Undone Action')
+        self._action_painted_field.setToolTip(
+            'Paint Field in One Widget Instead of Buttons')
         self._action_exit.setToolTip('Exit From The Game')
 
     def _add_game_menu_action_shortcuts(self) -> None:
         """Set keyboard shortcuts to the menu actions."""
         self._action_new_game.setShortcut('Ctrl+N')
         self._action_reset_game.setShortcut('Ctrl+R')
+        self._action_undo.setShortcut('Ctrl+Z')
+        self._action_redo.setShortcut('Ctrl+Shift+Z')
+        self._action_painted_field.setShortcut('Ctrl+P')
         self._action_exit.setShortcut('Ctrl+Q')
 
     def _game_menu_add_game_menu_actions(self) -> None:
         """Add menu actions to the game menu."""
         self._game_menu.addActions([self._action_new_game,
                                     self._action_reset_game,
+                                    self._action_undo,
+                                    self._action_redo,
+                                    self._action_painted_field,
                                     self._action_exit])
 
     def _create_window_container_widget_and_layout(self) -> None:
@@ -182,6 +212,10 @@ class QMainWindowMinesweeper(QMainWindow):
             self._on_new_game_action_triggered)
         self._action_reset_game.triggered.connect(
             self._on_reset_game_action_triggered)
+        self._action_undo.triggered.connect(self._on_undo_action_triggered)
+        self._action_redo.triggered.connect(self._on_redo_action_triggered)
+        self._action_painted_field.toggled.connect(
+            self._on_painted_field_action_toggled)
         self._action_exit.triggered.connect(
             self._on_exit_game_action_triggered)
 
@@ -206,6 +240,67 @@ class QMainWindowMinesweeper(QMainWindow):
         log.debug('checked: %s', checked)
         instance.CONTROLLER.reset_game()
 
+    @staticmethod
+    def _on_undo_action_triggered(checked: bool = False) -> None:
+        """Handle on undo action clicked event.
+
+        Args:
+            checked (bool, optional): status of the menu action.
+                Defaults to False.
+        """
+        log.debug('checked: %s', checked)
+        instance.CONTROLLER.undo()
+
+    @staticmethod
+    def _on_redo_action_triggered(checked: bool = False) -> None:
+        """Handle on redo action clicked event.
+
+        Args:
+            checked (bool, optional): status of the menu action.
+                Defaults to False.
+        """
+        log.debug('checked: %s', checked)
+        instance.CONTROLLER.redo()
+
+    def _on_painted_field_action_toggled(self, checked: bool) -> None:
+        """Handle on painted field action toggled event.
+
+        Replaces the field widget with the widget of the chosen
+        renderer. The field of the current game that is too big for
+        the buttons keeps the painted renderer.
+
+        Args:
+            checked (bool): status of the menu action.
+        """
+        log.debug('checked: %s', checked)
+        renderer: str = (FIELD_RENDERER_PAINTED if checked
+                         else FIELD_RENDERER_BUTTONS)
+        game_info: GameInformation | None = (
+            instance.CONTROLLER.get_game_info())
+        max_side: int = MAX_FIELD_SIDES[renderer]
+        if game_info is not None and max_side < max(
+                game_info.number_of_rows, game_info.number_of_columns):
+            log.warning('field is too big for the renderer: %s', renderer)
+            self._action_painted_field.setChecked(not checked)
+            return
+        self._set_field_renderer(renderer)
+
+    def _set_field_renderer(self, renderer: str) -> None:
+        """Replace the field widget with the widget of the renderer.
+
+        Args:
+            renderer (str): name of the renderer.
+        """
+        if renderer == self._field_renderer:
+            return
+        old_widget: QWidget = self._field_widget
+        old_widget.unsubscribe_from_game_events()
+        self._field_renderer = renderer
+        self._field_widget = create_field_widget(renderer)
+        self._window_container_widget_layout.replaceWidget(
+            old_widget, self._field_widget)
+        old_widget.deleteLater()
+
     @staticmethod
     def _on_exit_game_action_triggered(checked: bool = False) -> None:
         """Handle on exit game action clicked event.
@@ -217,10 +312,10 @@ class QMainWindowMinesweeper(QMainWindow):
         log.debug('checked: %s', checked)
         sys.exit()
 
-    @staticmethod
-    def _show_new_game_dialog() -> None:
+    def _show_new_game_dialog(self) -> None:
         """Create and show new game popup dialog."""
-        popup: QDialogWidget = QDialogWidget()
+        popup: QDialogWidget = QDialogWidget(
+            MAX_FIELD_SIDES[self._field_renderer])
         popup_result: int = popup.exec()
 
         if popup_result:
@@ -246,8 +341,12 @@ class QMainWindowMinesweeper(QMainWindow):
         self._lcd_flags.display(game_info.number_of_flags_left)
         self._change_reset_button_icon(game_info)
         if game_info.controller_action in [ControllerActions.NEW_GAME,
-                                           ControllerActions.RESET_GAME]:
+                                           ControllerActions.RESET_GAME,
+                                           ControllerActions.GAME_LOADED]:
             self._on_game_update_new_reset(game_info)
+        elif (game_info.controller_action is ControllerActions.UNDO
+              and not game_info.is_finished and not self._timer.isActive()):
+            self._timer.start()
 
     def _change_reset_button_icon(self, game_info: GameInformation) -> None:
         """Change reset button icon based on the vent information.
@@ -0,0 +1,356 @@
+"""Differential harness that compares game engines in lockstep.
+
+Every scenario is generated from its seed: the field configuration,
+the seed of the mines and the random sequence of open and flag actions,
+including actions on flagged, opened and invalid cells and actions
+after the end of the game. Both engines play the scenario and their
+state is compared after every step. Failed scenarios are minimized by
+removing the actions that are not needed to reproduce the difference.
+
+Run from the root of the repository:
+
+    python -m tests.differential.harness --engine bitboard \
+        --scenarios 1000000 --workers 8
+"""
+import argparse
+import dataclasses
+import logging
+import multiprocessing
+import random
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+from minesweeper_core.data.field_configuration import Configuration
+from minesweeper_core.logic.base_logic import BaseGameLogic
+from minesweeper_core.logic.engines import (ENGINE_REFERENCE,
+                                            available_engines, get_engine)
+from minesweeper_core.logic.exceptions import IncorrectCoordinatesException
+
+ACTION_OPEN: str = 'open'
+ACTION_FLAG: str = 'flag'
+
+# Limits of the generated scenarios.
+MAX_FIELD_SIDE: int = 12
+MAX_ACTIONS: int = 40
+
+# Number of scenarios sent to a worker at once.
+CHUNK_SIZE: int = 500
+
+Action = tuple[str, int, int]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """Scenario of the game generated from the seed."""
+
+    seed: int
+    config: Configuration
+    actions: tuple[Action, ...]
+
+
+@dataclass(frozen=True)
+class Counterexample:
+    """Scenario that gives different results of the engines."""
+
+    engine: str
+    scenario: Scenario
+    step: int
+    difference: str
+
+
+def generate_scenario(seed: int) -> Scenario:
+    """Generate scenario from the seed.
+
+    Args:
+        seed (int): seed of the scenario.
+
+    Returns:
+        Scenario: generated scenario.
+    """
+    generator: random.Random = random.Random(seed)
+    rows: int = generator.randint(1, MAX_FIELD_SIDE)
+    columns: int = generator.randint(1, MAX_FIELD_SIDE)
+    cells: int = rows * columns
+    mines: int = generator.randint(1, cells - 1) if cells > 1 else 0
+    if generator.random() < 0.3:
+        # sparse fields have big zero regions
+        mines = min(mines, generator.randint(0, 3))
+    actions: list[Action] = []
+    for _ in range(generator.randint(1, MAX_ACTIONS)):
+        kind: str = ACTION_FLAG if generator.random() < 0.35 else ACTION_OPEN
+        if generator.random() < 0.02:
+            # invalid coordinates should raise the same exception
+            actions.append((kind, rows, generator.randrange(columns)))
+        elif actions and generator.random() < 0.2:
+            # repeat the cell of the previous action, so flagged and
+            # opened cells are opened and flagged again
+            _, row, column = actions[generator.randrange(len(actions))]
+            actions.append((kind, row, column))
+        else:
+            actions.append((kind, generator.randrange(rows),
+                            generator.randrange(columns)))
+    return Scenario(seed, Configuration(number_of_rows=rows,
+                                        number_of_columns=columns,
+                                        number_of_mines=mines),
+                    tuple(actions))
+
+
+def snapshot(game: BaseGameLogic) -> tuple:
+    """Return comparable state of the game.
+
+    Args:
+        game (BaseGameLogic): game.
+
+    Returns:
+        tuple: counters, statuses and state of all the cells.
+    """
+    cells = tuple((cell.row, cell.column, cell.neighbour_mines,
+                   cell.is_open, cell.has_mine, cell.has_flag)
+                  for cell in game.field.values())
+    return (game.number_of_flags, game.number_of_placed_flags,
+            game.number_of_opened_cells, game.number_of_cells_left,
+            game.is_game_finished, game.is_player_win, cells)
+
+
+def apply_action(game: BaseGameLogic, action: Action) -> object:
+    """Apply action to the game.
+
+    Args:
+        game (BaseGameLogic): game.
+        action (Action): action as tuple[kind, row, column].
+
+    Returns:
+        object: sorted changed cells or the type of raised exception.
+    """
+    kind, row, column = action
+    try:
+        if kind == ACTION_OPEN:
+            changes = game.open_cell(row, column)
+        else:
+            changes = game.flag_cell(row, column)
+    except IncorrectCoordinatesException as exception:
+        return type(exception)
+    return sorted(changes.items())
+
+
+def describe_difference(expected: object, actual: object) -> str:
+    """Describe the first difference of two results.
+
+    Args:
+        expected (object): result of the reference engine.
+        actual (object): result of the compared engine.
+
+    Returns:
+        str: description.
+    """
+    if isinstance(expected, tuple) and isinstance(actual, tuple):
+        names = ('number_of_flags', 'number_of_placed_flags',
+                 'number_of_opened_cells', 'number_of_cells_left',
+                 'is_game_finished', 'is_player_win')
+        for name, left, right in zip(names, expected, actual):
+            if left != right:
+                return f'{name}: expected {left}, got {right}'
+        for left, right in zip(expected[-1], actual[-1]):
+            if left != right:
+                return f'cell: expected {left}, got {right}'
+    return f'changed cells: expected {expected}, got {actual}'
+
+
+def find_difference(reference: type[BaseGameLogic],
+                    engine: type[BaseGameLogic],
+                    scenario: Scenario) -> tuple[int, str] | None:
+    """Play the scenario by both engines and compare them.
+
+    Args:
+        reference (type[BaseGameLogic]): reference engine.
+        engine (type[BaseGameLogic]): compared engine.
+        scenario (Scenario): played scenario.
+
+    Returns:
+        tuple[int, str] | None: number of the action after which the
+            state differs (-1 for the new game) and the difference, or
+            None if the engines give the same results.
+    """
+    expected_game: BaseGameLogic = reference(scenario.config,
+                                             rng=scenario.seed)
+    actual_game: BaseGameLogic = engine(scenario.config, rng=scenario.seed)
+    expected: object = snapshot(expected_game)
+    actual: object = snapshot(actual_game)
+    if expected != actual:
+        return -1, describe_difference(expected, actual)
+    for step, action in enumerate(scenario.actions):
+        expected = apply_action(expected_game, action)
+        actual = apply_action(actual_game, action)
+        if expected == actual:
+            expected = snapshot(expected_game)
+            actual = snapshot(actual_game)
+        if expected != actual:
+            return step, describe_difference(expected, actual)
+    return None
+
+
+def minimize(reference: type[BaseGameLogic], engine: type[BaseGameLogic],
+             scenario: Scenario) -> tuple[Scenario, int, str]:
+    """Remove actions that are not needed to reproduce the difference.
+
+    Actions after the failed one are dropped, then chunks of the
+    remaining actions are removed while the scenario still fails, from
+    the half of the actions down to the single actions.
+
+    Args:
+        reference (type[BaseGameLogic]): reference engine.
+        engine (type[BaseGameLogic]): compared engine.
+        scenario (Scenario): failed scenario.
+
+    Returns:
+        tuple[Scenario, int, str]: minimized scenario, the failed step
+            and the difference.
+    """
+    step, difference = find_difference(reference, engine, scenario)
+    actions: list[Action] = list(scenario.actions[:step + 1])
+    chunk: int = max(1, len(actions) // 2)
+    while actions:
+        start: int = 0
+        removed: bool = False
+        while start < len(actions):
+            candidate = dataclasses.replace(
+                scenario, actions=tuple(actions[:start]
+                                        + actions[start + chunk:]))
+            result = find_difference(reference, engine, candidate)
+            if result is None:
+                start += chunk
+                continue
+            step, difference = result
+            actions = list(candidate.actions[:step + 1])
+            removed = True
+        if chunk == 1 and not removed:
+            break
+        chunk = max(1, chunk // 2)
+    minimized: Scenario = dataclasses.replace(scenario, actions=tuple(actions))
+    return minimized, step, difference
+
+
+def check_seeds(reference: type[BaseGameLogic],
+                engine: type[BaseGameLogic], engine_name: str,
+                seeds: Iterable[int], limit: int) -> list[Counterexample]:
+    """Check scenarios of the seeds and return minimized failures.
+
+    Args:
+        reference (type[BaseGameLogic]): reference engine.
+        engine (type[BaseGameLogic]): compared engine.
+        engine_name (str): name of the compared engine for the report.
+        seeds (Iterable[int]): seeds of the scenarios.
+        limit (int): the biggest number of returned counterexamples.
+
+    Returns:
+        list[Counterexample]: minimized counterexamples.
+    """
+    counterexamples: list[Counterexample] = []
+    for seed in seeds:
+        scenario: Scenario = generate_scenario(seed)
+        if find_difference(reference, engine, scenario) is None:
+            continue
+        minimized, step, difference = minimize(reference, engine, scenario)
+        counterexamples.append(
+            Counterexample(engine_name, minimized, step, difference))
+        if len(counterexamples) >= limit:
+            break
+    return counterexamples
+
+
+def _check_chunk(task: tuple[str, str, int, int, int]
+                 ) -> tuple[int, list[Counterexample]]:
+    """Check chunk of the seeds in the worker process.
+
+    Args:
+        task (tuple[str, str, int, int, int]): names of the reference
+            and compared engines, first seed, number of seeds and
+            limit of the counterexamples.
+
+    Returns:
+        tuple[int, list[Counterexample]]: number of checked scenarios
+            and found counterexamples.
+    """
+    reference_name, engine_name, start, count, limit = task
+    return count, check_seeds(get_engine(reference_name),
+                              get_engine(engine_name), engine_name,
+                              range(start, start + count), limit)
+
+
+def run(engine_names: list[str], scenarios: int, seed: int = 0,
+        workers: int | None = None,
+        reference_name: str = ENGINE_REFERENCE,
+        limit: int = 5) -> Iterator[tuple[int, list[Counterexample]]]:
+    """Check scenarios of the engines in parallel.
+
+    Args:
+        engine_names (list[str]): names of the compared engines.
+        scenarios (int): number of scenarios per engine.
+        seed (int, optional): first seed. Defaults to 0.
+        workers (int | None, optional): number of processes. Defaults
+            to the number of the CPU cores.
+        reference_name (str, optional): name of the reference engine.
+            Defaults to the reference engine.
+        limit (int, optional): the biggest number of counterexamples
+            per chunk. Defaults to 5.
+
+    Yields:
+        tuple[int, list[Counterexample]]: number of checked scenarios
+            and counterexamples of every chunk.
+    """
+    tasks = [(reference_name, engine_name, start,
+              min(CHUNK_SIZE, seed + scenarios - start), limit)
+             for engine_name in engine_names
+             for start in range(seed, seed + scenarios, CHUNK_SIZE)]
+    with multiprocessing.Pool(workers) as pool:
+        yield from pool.imap_unordered(_check_chunk, tasks)
+
+
+def main() -> None:
+    """Parse arguments, run the harness and print the report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--engine', action='append', dest='engines',
+                        choices=available_engines(),
+                        help='compared engine, all engines by default')
+    parser.add_argument('--reference', default=ENGINE_REFERENCE,
+                        choices=available_engines())
+    parser.add_argument('--scenarios', type=int, default=100_000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--limit', type=int, default=5,
+                        help='counterexamples to report')
+    arguments = parser.parse_args()
+    # warnings about repeated actions of the scenarios are expected
+    logging.disable(logging.WARNING)
+    engines: list[str] = arguments.engines or [
+        name for name in available_engines() if name != arguments.reference]
+
+    start: float = time.perf_counter()
+    checked: int = 0
+    found: list[Counterexample] = []
+    for count, counterexamples in run(engines, arguments.scenarios,
+                                      arguments.seed, arguments.workers,
+                                      arguments.reference, arguments.limit):
+        checked += count
+        found.extend(counterexamples)
+    elapsed: float = time.perf_counter() - start
+    print(f'engines: {", ".join(engines)}, reference: {arguments.reference}')
+    print(f'checked {checked} scenarios in {elapsed:.1f} s, '
+          f'{len(found)} counterexamples')
+    found.sort(key=lambda example: len(example.scenario.actions))
+    for example in found[:arguments.limit]:
+        config: Configuration = example.scenario.config
+        print(f'\n{example.engine}, seed {example.scenario.seed}, '
+              f'{config.number_of_rows}x{config.number_of_columns} '
+              f'with {config.number_of_mines} mines')
+        for step, action in enumerate(example.scenario.actions):
+            marker: str = ' <- differs' if step == example.step else ''
+            print(f'  {step}: {action}{marker}')
+        print(f'  {example.difference}')
+    if found:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+import pytest
+
+from minesweeper_core.data.change_set import ChangeSet
+from minesweeper_core.logic.engines import (ENGINE_REFERENCE,
+                                            available_engines, get_engine)
+from minesweeper_core.logic.game_logic import GameLogic
+from minesweeper_core.logic.reference_logic import ReferenceGameLogic
+from tests.differential.harness import (ACTION_FLAG, check_seeds,
+                                        find_difference, generate_scenario,
+                                        minimize, run)
+
+SEEDS: range = range(200)
+
+
+class FlagCountingGameLogic(GameLogic):
+    """Engine that forgets to return the flag when it is removed."""
+
+    def flag_cell(self, row: int, column: int) -> ChangeSet:
+        flags_number: int = self.number_of_flags
+        changes: ChangeSet = super().flag_cell(row, column)
+        if self.number_of_flags > flags_number:
+            self._flags_number = flags_number
+        return changes
+
+
+class TestHarness:
+    def test_generate_scenario_is_reproducible(self) -> None:
+        assert generate_scenario(42) == generate_scenario(42)
+        assert generate_scenario(42) != generate_scenario(43)
+
+    @pytest.mark.parametrize('engine_name', [
+        name for name in available_engines() if name != ENGINE_REFERENCE])
+    def test_engines_match_reference(self, engine_name: str) -> None:
+        counterexamples = check_seeds(ReferenceGameLogic,
+                                      get_engine(engine_name), engine_name,
+                                      SEEDS, limit=1)
+        assert counterexamples == []
+
+    def test_difference_is_found_and_minimized(self) -> None:
+        counterexamples = check_seeds(ReferenceGameLogic,
+                                      FlagCountingGameLogic, 'broken',
+                                      SEEDS, limit=1)
+        assert len(counterexamples) == 1
+        example = counterexamples[0]
+        assert 'number_of_flags' in example.difference
+        assert len(example.scenario.actions) == example.step + 1
+        flags = [action for action in example.scenario.actions
+                 if action[0] == ACTION_FLAG]
+        assert len(flags) == 2
+        # the minimized scenario still fails, but no shorter one does
+        assert find_difference(ReferenceGameLogic, FlagCountingGameLogic,
+                               example.scenario) is not None
+        minimized, step, _ = minimize(ReferenceGameLogic,
+                                      FlagCountingGameLogic,
+                                      example.scenario)
+        assert minimized == example.scenario
+        assert step == example.step
+
+    def test_run_in_parallel(self) -> None:
+        results = list(run(['bitboard'], scenarios=20, workers=2))
+        assert sum(count for count, _ in results) == 20
+        assert all(counterexamples == [] for _, counterexamples in results)
@@ -1,10 +1,18 @@
 import unittest.mock as mock
 
+import pytest
+
 from minesweeper_core.api.controller import MinesweeperController
+from minesweeper_core.api.markers import ControllerActions
 from minesweeper_core.constants.configurations import (BEGINNER,
                                                        INTERMEDIATE)
 from minesweeper_core.data.field_configuration import Configuration
+from minesweeper_core.logic.bitboard_logic import BitboardGameLogic
+from minesweeper_core.logic.engines import ENGINE_ENVIRONMENT_VARIABLE
+from minesweeper_core.logic.exceptions import (IncorrectSaveException,
+                                               UnknownEngineException)
 from minesweeper_core.logic.game_logic import GameLogic
+from minesweeper_core.logic.reference_logic import ReferenceGameLogic
 
 
 class TestMinesweeperController:
@@ -18,8 +26,9 @@ class TestMinesweeperController:
         assert game._on_game_status_update_callback is mock_method
         mock_method.assert_not_called()
 
-    @mock.patch('minesweeper_core.api.controller.GameLogic')
-    def test_start_new_game(self, game_logic_mock) -> None:
+    @mock.patch('minesweeper_core.api.controller.get_engine')
+    def test_start_new_game(self, get_engine_mock) -> None:
+        game_logic_mock = get_engine_mock.return_value
         mock_callback = mock.Mock()
         mock_game_logic = mock.Mock()
         game_logic_mock.return_value = mock_game_logic
@@ -43,8 +52,9 @@ class TestMinesweeperController:
         assert game._game_instance is mock_game_logic
         mock_callback.assert_called_once()
 
-    @mock.patch('minesweeper_core.api.controller.GameLogic')
-    def test_reset_game(self, game_logic_mock) -> None:
+    @mock.patch('minesweeper_core.api.controller.get_engine')
+    def test_reset_game(self, get_engine_mock) -> None:
+        game_logic_mock = get_engine_mock.return_value
         mock_callback = mock.Mock()
         mock_game_logic = mock.Mock()
         game_logic_mock.return_value = mock_game_logic
@@ -68,16 +78,36 @@ class TestMinesweeperController:
         game.reset_game()
         assert game._last_config is INTERMEDIATE
         assert game._game_instance is mock_game_logic
+        mock_game_logic.reset.assert_called_once()
+        game_logic_mock.assert_called_once()
         mock_callback.assert_called()
 
-    @mock.patch('minesweeper_core.api.controller.GameLogic')
-    def test_open_cell(self, game_logic_mock) -> None:
+    def test_start_new_game_reuses_instance_of_same_config(self) -> None:
+        game = MinesweeperController()
+        game.start_new_game(INTERMEDIATE)
+        game_instance = game._game_instance
+        game_instance.open_cell(0, 0)
+
+        game.start_new_game(Configuration(number_of_rows=16,
+                                          number_of_columns=16,
+                                          number_of_mines=40))
+        assert game._game_instance is game_instance
+        assert game_instance.number_of_opened_cells == 0
+
+        game.start_new_game(BEGINNER)
+        assert game._game_instance is not game_instance
+        assert game._last_config is BEGINNER
+
+    @mock.patch('minesweeper_core.api.controller.get_engine')
+    def test_open_cell(self, get_engine_mock) -> None:
+        game_logic_mock = get_engine_mock.return_value
         mock_callback = mock.Mock()
         mock_open = mock.Mock()
         mock_game_logic = mock.Mock()
         field_dict = {}
         attrs = {
             'open_cell': mock_open,
+            'is_game_started': False,
             'rows.return_value': 25,
             'columns.return_value': 39,
             'number_of_mines.return_value': 17,
@@ -99,14 +129,16 @@ class TestMinesweeperController:
         assert game._game_instance is mock_game_logic
         mock_open.assert_called_once_with(2, 5)
 
-    @mock.patch('minesweeper_core.api.controller.GameLogic')
-    def test_flag_cell(self, game_logic_mock) -> None:
+    @mock.patch('minesweeper_core.api.controller.get_engine')
+    def test_flag_cell(self, get_engine_mock) -> None:
+        game_logic_mock = get_engine_mock.return_value
         mock_callback = mock.Mock()
         mock_flag = mock.Mock()
         mock_game_logic = mock.Mock()
         field_dict = {}
         attrs = {
             'flag_cell': mock_flag,
+            'is_game_started': False,
             'rows.return_value': 25,
             'columns.return_value': 39,
             'number_of_mines.return_value': 17,
@@ -128,8 +160,9 @@ class TestMinesweeperController:
         assert game._game_instance is mock_game_logic
         mock_flag.assert_called_once_with(2, 5)
 
-    @mock.patch('minesweeper_core.api.controller.GameLogic')
-    def test_get_game_info(self, game_logic_mock) -> None:
+    @mock.patch('minesweeper_core.api.controller.get_engine')
+    def test_get_game_info(self, get_engine_mock) -> None:
+        game_logic_mock = get_engine_mock.return_value
         config = Configuration(
             number_of_rows=23,
             number_of_columns=17,
@@ -156,9 +189,105 @@ class TestMinesweeperController:
         assert not info.is_finished
         assert not info.is_player_win
 
+    def test_open_and_flag_cell_pass_change_set(self) -> None:
+        mock_callback = mock.Mock()
+        game = MinesweeperController(
+            on_game_status_update_callback=mock_callback)
+        game.start_new_game(INTERMEDIATE)
+
+        change_set = game.flag_cell(2, 5)
+        info = mock_callback.call_args.args[0]
+        assert info.changed_cells is change_set
+        assert list(change_set) == [(2, 5)]
+
+        change_set = game.open_cell(0, 0)
+        info = mock_callback.call_args.args[0]
+        assert info.changed_cells is change_set
+        assert (0, 0) in change_set
+
+    def test_open_cell_without_game(self) -> None:
+        game = MinesweeperController()
+        assert len(game.open_cell(0, 0)) == 0
+        assert len(game.flag_cell(0, 0)) == 0
+
+    def test_dumps_and_loads(self, tmp_path) -> None:
+        mock_callback = mock.Mock()
+        game = MinesweeperController(
+            on_game_status_update_callback=mock_callback, engine='bitboard')
+        assert game.dumps() is None
+        game.start_new_game(INTERMEDIATE)
+        game.open_cell(0, 0)
+        game.flag_cell(15, 15)
+        data = game.dumps()
+
+        game.start_new_game(BEGINNER)
+        game.loads(data)
+        info = mock_callback.call_args.args[0]
+        assert info.controller_action is ControllerActions.GAME_LOADED
+        assert isinstance(game._game_instance, BitboardGameLogic)
+        assert game._last_config == INTERMEDIATE
+        assert info.number_of_flags_left == INTERMEDIATE.number_of_mines - 1
+        assert game.dumps() == data
+
+        path = tmp_path / 'game.save'
+        game.save(path)
+        game.reset_game()
+        game.load(path)
+        assert game.dumps() == data
+        with pytest.raises(IncorrectSaveException):
+            game.loads(b'not a saved game')
+        assert game.dumps() == data
+
+    def test_undo_and_redo(self) -> None:
+        mock_callback = mock.Mock()
+        game = MinesweeperController(
+            on_game_status_update_callback=mock_callback)
+        game.start_new_game(INTERMEDIATE)
+        game.open_cell(0, 0)
+        closed = next(coordinate for coordinate, cell
+                      in game._game_instance.field.items()
+                      if not cell.is_open)
+        game.flag_cell(*closed)
+        assert game.can_undo and not game.can_redo
+
+        change_set = game.undo()
+        info = mock_callback.call_args.args[0]
+        assert info.controller_action is ControllerActions.UNDO
+        assert info.changed_cells is change_set
+        assert not change_set[closed].has_flag
+        assert info.number_of_flags_left == INTERMEDIATE.number_of_mines
+
+        change_set = game.redo()
+        info = mock_callback.call_args.args[0]
+        assert info.controller_action is ControllerActions.REDO
+        assert change_set[closed].has_flag
+        assert info.number_of_flags_left == INTERMEDIATE.number_of_mines - 1
+
+    def test_undo_without_game(self) -> None:
+        game = MinesweeperController()
+        assert len(game.undo()) == 0
+        assert len(game.redo()) == 0
+
     def test_get_game_info_just_created(self) -> None:
         game = MinesweeperController()
         info = game.get_game_info()
 
         assert game._last_config is BEGINNER
         assert info is None
+
+    def test_engine_from_argument(self) -> None:
+        game = MinesweeperController(engine='bitboard')
+        game.start_new_game(BEGINNER)
+        assert game.engine_name == 'bitboard'
+        assert isinstance(game._game_instance, BitboardGameLogic)
+
+    def test_engine_from_environment(self, monkeypatch) -> None:
+        monkeypatch.setenv(ENGINE_ENVIRONMENT_VARIABLE, 'reference')
+        game = MinesweeperController()
+        game.start_new_game(BEGINNER)
+        assert game.engine_name == 'reference'
+        assert isinstance(game._game_instance, ReferenceGameLogic)
+
+    def test_unknown_engine(self) -> None:
+        with pytest.raises(UnknownEngineException):
+            MinesweeperController(engine='unknown')
@@ -0,0 +1,60 @@
+from minesweeper_core.data.bitboard import (Bitboard, BitboardCell,
+                                            bits_from_bytes, bytes_from_bits)
+from minesweeper_core.data.board import Board, FieldView
+from minesweeper_core.data.cell import Cell
+
+
+class TestBitboard:
+    def test_bits_and_bytes_conversion(self) -> None:
+        column = bytes([1, 0, 0, 1, 1, 0, 0, 0, 0, 1])
+        mask = bits_from_bytes(column)
+        assert mask == 0b1000011001
+        assert bytes_from_bits(mask, len(column)) == column
+        assert bits_from_bytes(b'') == 0
+        assert bytes_from_bits(0, 0) == b''
+
+    def test_cell_views(self) -> None:
+        bitboard = Bitboard(2, 3)
+        cell = bitboard.cell(4)
+        assert isinstance(cell, BitboardCell)
+        cell.has_mine = True
+        cell.is_open = True
+        cell.neighbour_mines = 5
+        assert bitboard.mines == 1 << 4
+        assert bitboard.opened == 1 << 4
+        assert cell == Cell(1, 1, 5, True, True, False)
+        cell.has_mine = False
+        assert bitboard.mines == 0
+
+    def test_pack_is_the_same_as_board(self) -> None:
+        board = Board(3, 4)
+        bitboard = Bitboard(3, 4)
+        for field in (FieldView(board), FieldView(bitboard)):
+            field[(0, 1)].has_mine = True
+            field[(1, 1)].neighbour_mines = 8
+            field[(1, 1)].is_open = True
+            field[(2, 3)].has_flag = True
+            field[(2, 3)].neighbour_mines = 3
+        assert bitboard.pack() == board.pack()
+        assert bitboard.pack(4, 9) == board.pack(4, 9)
+        indexes = [11, 5, 1]
+        assert (bitboard.packed_states(indexes)
+                == board.packed_states(indexes))
+        assert FieldView(bitboard) == FieldView(board)
+
+    def test_unpack_is_the_same_as_board(self) -> None:
+        states = bytes([0x20, 0x18, 0, 0x43, 0x17, 0x05])
+        board = Board(2, 3)
+        bitboard = Bitboard(2, 3)
+        board.unpack(states)
+        bitboard.unpack(states)
+        assert bitboard.pack() == states
+        assert FieldView(bitboard) == FieldView(board)
+
+    def test_copy_and_clear(self) -> None:
+        bitboard = Bitboard(2, 2)
+        bitboard.cell(0).has_flag = True
+        copied = bitboard.copy()
+        bitboard.clear()
+        assert bitboard.pack() == bytes(4)
+        assert copied.cell(0).has_flag
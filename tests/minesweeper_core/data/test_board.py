@@ -0,0 +1,159 @@
+import pytest
+
+from minesweeper_core.data.board import (FLAG_BIT, MINE_BIT, OPEN_BIT, Board,
+                                         BoardCell, FieldView)
+from minesweeper_core.data.cell import Cell, FieldCell
+
+
+class TestBoard:
+    def test_init(self) -> None:
+        board = Board(3, 4)
+        assert board.rows == 3
+        assert board.columns == 4
+        assert board.size == 12
+        assert board.mines == bytearray(12)
+        assert board.opened == bytearray(12)
+        assert board.flags == bytearray(12)
+        assert board.neighbour_mines == bytearray(12)
+
+    def test_columns_are_allocated_on_first_access(self) -> None:
+        board = Board(2000, 2000)
+        view = FieldView(board)
+        assert not board.is_allocated
+        assert view[(1999, 1999)] == Cell(1999, 1999)
+        assert view.packed_states(0, 4) == bytes(4)
+        assert board.packed_states([5, 7]) == bytes(2)
+        assert board.packed_state(5) == 0
+        board.clear()
+        assert not board.is_allocated
+
+        view[(0, 1)].has_flag = True
+        assert board.is_allocated
+        assert len(board.flags) == board.size
+        assert view.packed_states(0, 2) == bytes([0, FLAG_BIT])
+
+    def test_index_and_coordinate(self) -> None:
+        board = Board(3, 4)
+        assert board.index(0, 0) == 0
+        assert board.index(1, 2) == 6
+        assert board.index(2, 3) == 11
+        assert board.coordinate(6) == (1, 2)
+        assert board.coordinate(11) == (2, 3)
+
+    def test_clear(self) -> None:
+        board = Board(2, 2)
+        mines = board.mines
+        board.mines[0] = 1
+        board.opened[1] = 1
+        board.flags[2] = 1
+        board.neighbour_mines[3] = 1
+        board.clear()
+        assert board.mines is mines
+        assert board.pack() == bytes(4)
+
+    def test_pack(self) -> None:
+        board = Board(2, 3)
+        board.mines[0] = 1
+        board.neighbour_mines[1] = 8
+        board.opened[1] = 1
+        board.flags[5] = 1
+        board.neighbour_mines[5] = 1
+        expected = bytes([MINE_BIT, OPEN_BIT | 8, 0, 0, 0, FLAG_BIT | 1])
+        assert board.pack() == expected
+        assert board.pack() == board.packed_states(range(board.size))
+        assert bytes(map(board.packed_state, range(board.size))) == expected
+        assert board.pack(1, 3) == expected[1:3]
+        assert board.pack(4, 4) == b''
+
+    def test_unpack(self) -> None:
+        states = bytes([MINE_BIT, OPEN_BIT | 8, 0, 0, 0, FLAG_BIT | 1])
+        board = Board(2, 3)
+        board.unpack(states)
+        assert board.pack() == states
+        assert board.mines == bytearray([1, 0, 0, 0, 0, 0])
+        assert board.neighbour_mines == bytearray([0, 8, 0, 0, 0, 1])
+        board.unpack(bytes(6))
+        assert board.pack() == bytes(6)
+
+    def test_unpack_of_default_state_does_not_allocate(self) -> None:
+        board = Board(2, 3)
+        board.unpack(bytes(6))
+        assert not board.is_allocated
+
+
+class TestBoardCell:
+    def test_read_state(self) -> None:
+        board = Board(3, 3)
+        board.mines[4] = 1
+        board.neighbour_mines[4] = 2
+        cell = BoardCell(board, 4)
+        assert isinstance(cell, FieldCell)
+        assert cell.row == 1
+        assert cell.column == 1
+        assert cell.has_mine
+        assert not cell.is_open
+        assert not cell.has_flag
+        assert cell.neighbour_mines == 2
+
+    def test_write_state(self) -> None:
+        board = Board(3, 3)
+        cell = BoardCell(board, 5)
+        cell.is_open = True
+        cell.has_flag = True
+        cell.has_mine = True
+        cell.neighbour_mines = 3
+        assert board.opened[5] == 1
+        assert board.flags[5] == 1
+        assert board.mines[5] == 1
+        assert board.neighbour_mines[5] == 3
+        cell.has_mine = False
+        assert board.mines[5] == 0
+
+    def test_equality(self) -> None:
+        board = Board(3, 3)
+        assert BoardCell(board, 1) == BoardCell(board, 1)
+        assert BoardCell(board, 1) != BoardCell(board, 2)
+        assert BoardCell(board, 1) == Cell(0, 1)
+        assert Cell(0, 1) == BoardCell(board, 1)
+
+    def test_repr(self) -> None:
+        board = Board(3, 3)
+        board.flags[5] = 1
+        assert repr(BoardCell(board, 5)) == (
+            'BoardCell(row=1, column=2, neighbour_mines=0, is_open=False, '
+            'has_mine=False, has_flag=True)')
+
+
+class TestFieldView:
+    def test_len_and_iter(self) -> None:
+        field = FieldView(Board(2, 3))
+        assert len(field) == 6
+        assert list(field) == [(0, 0), (0, 1), (0, 2),
+                               (1, 0), (1, 1), (1, 2)]
+
+    def test_getitem(self) -> None:
+        board = Board(2, 3)
+        field = FieldView(board)
+        field[(1, 2)].has_flag = True
+        assert board.flags[5] == 1
+        assert field[(1, 2)].has_flag
+
+    def test_getitem_outside_of_board(self) -> None:
+        field = FieldView(Board(2, 3))
+        with pytest.raises(KeyError):
+            _ = field[(2, 0)]
+        with pytest.raises(KeyError):
+            _ = field[(0, -1)]
+
+    def test_contains(self) -> None:
+        field = FieldView(Board(2, 3))
+        assert (1, 1) in field
+        assert (3, 1) not in field
+        assert 'cell' not in field
+
+    def test_packed_states(self) -> None:
+        board = Board(2, 3)
+        board.opened[4] = 1
+        field = FieldView(board)
+        assert field.packed_states() == bytes([0, 0, 0, 0, OPEN_BIT, 0])
+        assert field.packed_states(3, 5) == bytes([0, OPEN_BIT])
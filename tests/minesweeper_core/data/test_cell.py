@@ -0,0 +1,19 @@
+import pytest
+
+from minesweeper_core.data.cell import Cell
+
+
+class TestCell:
+    def test_defaults(self) -> None:
+        cell = Cell(1, 2)
+        assert (cell.row, cell.column) == (1, 2)
+        assert cell.neighbour_mines == 0
+        assert not cell.is_open
+        assert not cell.has_mine
+        assert not cell.has_flag
+
+    def test_has_no_instance_dict(self) -> None:
+        cell = Cell(1, 2)
+        assert not hasattr(cell, '__dict__')
+        with pytest.raises(AttributeError):
+            cell.unknown = 1
@@ -0,0 +1,35 @@
+import pytest
+
+from minesweeper_core.data.board import Board
+from minesweeper_core.data.cell import Cell
+from minesweeper_core.data.change_set import ChangeSet
+
+
+class TestChangeSet:
+    def test_empty(self) -> None:
+        change_set = ChangeSet()
+        assert len(change_set) == 0
+        assert list(change_set) == []
+        assert change_set.indexes == ()
+
+    def test_cells_are_snapshots(self) -> None:
+        board = Board(3, 4)
+        board.opened[6] = 1
+        board.neighbour_mines[6] = 3
+        board.mines[7] = 1
+        board.flags[7] = 1
+        change_set = ChangeSet(4, [6, 7], board.packed_states([6, 7]))
+        board.opened[7] = 1
+
+        assert list(change_set) == [(1, 2), (1, 3)]
+        assert change_set[(1, 2)] == Cell(
+            row=1, column=2, neighbour_mines=3, is_open=True)
+        assert change_set[(1, 3)] == Cell(
+            row=1, column=3, has_mine=True, has_flag=True)
+        assert list(change_set.cells()) == list(change_set.values())
+
+    def test_missing_cell(self) -> None:
+        change_set = ChangeSet(4, [6], b'\x10')
+        assert (1, 2) in change_set
+        with pytest.raises(KeyError):
+            _ = change_set[(0, 0)]
@@ -0,0 +1,88 @@
+import pytest
+
+from minesweeper_core.data.board import Board
+from minesweeper_core.data.chunk_store import ChunkStore
+
+
+def create_chunk(coordinate: tuple[int, int]) -> Board:
+    chunk = Board(2, 2)
+    chunk.mines[:] = bytes([1, 0, 0, coordinate[0] % 2])
+    return chunk
+
+
+class TestChunkStore:
+    def test_get_creates_chunk_once(self) -> None:
+        store = ChunkStore(create_chunk)
+        chunk = store.get((3, -4))
+        assert store.get((3, -4)) is chunk
+        assert (3, -4) in store
+        assert len(store) == 1
+
+    def test_trim_keeps_capacity(self) -> None:
+        store = ChunkStore(create_chunk, capacity=2)
+        for column in range(5):
+            store.get((0, column))
+        assert len(store) == 5
+        store.trim()
+        assert len(store) == 2
+        assert (0, 3) in store and (0, 4) in store
+
+    def test_untouched_chunks_are_dropped(self, tmp_path) -> None:
+        store = ChunkStore(create_chunk, capacity=1, directory=tmp_path)
+        store.get((0, 0))
+        store.get((0, 1))
+        store.trim()
+        assert (0, 0) not in store
+        assert store.number_of_spilled_chunks == 0
+        assert list(tmp_path.iterdir()) == []
+
+    def test_touched_chunks_are_spilled_and_loaded(self, tmp_path) -> None:
+        store = ChunkStore(create_chunk, capacity=1, directory=tmp_path)
+        chunk = store.get((1, 0))
+        chunk.opened[1] = 1
+        chunk.flags[0] = 1
+        store.get((0, 1))
+        store.trim()
+        assert (1, 0) in store
+        assert store.number_of_spilled_chunks == 1
+        assert len(list(tmp_path.iterdir())) == 1
+        loaded = store.get((1, 0))
+        assert loaded is not chunk
+        assert loaded.opened == bytearray([0, 1, 0, 0])
+        assert loaded.flags == bytearray([1, 0, 0, 0])
+        assert loaded.mines == bytearray([1, 0, 0, 1])
+        assert store.number_of_spilled_chunks == 0
+        assert list(tmp_path.iterdir()) == []
+
+    def test_refresh_keeps_player_state(self) -> None:
+        mines = [bytes(4)]
+        store = ChunkStore(lambda coordinate: _with_mines(mines[0]))
+        store.get((0, 0)).flags[2] = 1
+        mines[0] = bytes([0, 1, 1, 0])
+        store.refresh()
+        chunk = store.get((0, 0))
+        assert chunk.mines == bytearray(mines[0])
+        assert chunk.flags == bytearray([0, 0, 1, 0])
+
+    @pytest.mark.parametrize('own_directory', [False, True])
+    def test_close_removes_spilled_chunks(self, tmp_path,
+                                          own_directory: bool) -> None:
+        directory = None if own_directory else tmp_path
+        store = ChunkStore(create_chunk, capacity=1, directory=directory)
+        store.get((0, 0)).opened[0] = 1
+        store.get((0, 1))
+        store.trim()
+        path = store._path((0, 0))
+        assert path.exists()
+        store.close()
+        assert not path.exists()
+        assert len(store) == 0 and store.number_of_spilled_chunks == 0
+        assert tmp_path.exists()
+        if own_directory:
+            assert not path.parent.exists()
+
+
+def _with_mines(mines: bytes) -> Board:
+    chunk = Board(2, 2)
+    chunk.mines[:] = mines
+    return chunk
@@ -0,0 +1,53 @@
+from minesweeper_core.logic.adjacency import (ADJACENCY_CACHE_SIZE,
+                                              build_adjacency, get_adjacency)
+
+
+class TestAdjacency:
+    def test_build_adjacency_offsets(self) -> None:
+        adjacency = build_adjacency(4, 4)
+        assert len(adjacency.offsets) == 17
+        assert adjacency.offsets[0] == 0
+        assert adjacency.offsets[-1] == len(adjacency.neighbours)
+        assert len(adjacency.neighbours) == 4 * 3 + 8 * 5 + 4 * 8
+
+    def test_neighbours_of_corner(self) -> None:
+        adjacency = build_adjacency(4, 4)
+        assert sorted(adjacency.neighbours_of(0)) == [1, 4, 5]
+        assert sorted(adjacency.neighbours_of(15)) == [10, 11, 14]
+
+    def test_neighbours_of_edge(self) -> None:
+        adjacency = build_adjacency(4, 4)
+        assert sorted(adjacency.neighbours_of(4)) == [0, 1, 5, 8, 9]
+
+    def test_neighbours_of_center(self) -> None:
+        adjacency = build_adjacency(4, 4)
+        assert sorted(adjacency.neighbours_of(5)) == [0, 1, 2, 4, 6, 8, 9, 10]
+
+    def test_neighbours_of_single_row_and_column(self) -> None:
+        assert sorted(build_adjacency(1, 3).neighbours_of(1)) == [0, 2]
+        assert sorted(build_adjacency(3, 1).neighbours_of(1)) == [0, 2]
+        assert list(build_adjacency(1, 1).neighbours_of(0)) == []
+
+    def test_neighbours_match_coordinates(self) -> None:
+        rows, columns = 5, 7
+        adjacency = build_adjacency(rows, columns)
+        for row in range(rows):
+            for column in range(columns):
+                expected = sorted(
+                    (r * columns + c)
+                    for r in range(row - 1, row + 2)
+                    for c in range(column - 1, column + 2)
+                    if 0 <= r < rows and 0 <= c < columns
+                    and (r, c) != (row, column))
+                index = row * columns + column
+                assert sorted(adjacency.neighbours_of(index)) == expected
+
+    def test_get_adjacency_is_shared(self) -> None:
+        assert get_adjacency(9, 9) is get_adjacency(9, 9)
+        assert get_adjacency(9, 9) is not get_adjacency(9, 10)
+
+    def test_get_adjacency_is_bounded(self) -> None:
+        get_adjacency.cache_clear()
+        for size in range(1, ADJACENCY_CACHE_SIZE + 5):
+            get_adjacency(size, size)
+        assert get_adjacency.cache_info().currsize == ADJACENCY_CACHE_SIZE
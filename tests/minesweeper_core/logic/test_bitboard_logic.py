@@ -0,0 +1,74 @@
+import random
+
+import minesweeper_core.logic.counting as counting
+from minesweeper_core.constants.configurations import ADVANCED
+from minesweeper_core.data.bitboard import bits_from_bytes
+from minesweeper_core.data.field_configuration import Configuration
+from minesweeper_core.logic.bitboard_logic import (BitboardGameLogic,
+                                                   count_neighbour_mine_planes,
+                                                   dilate, indexes_of)
+from minesweeper_core.logic.game_logic import GameLogic
+from tests.minesweeper_core.logic import test_game_logic
+
+
+class TestBitboardGameLogic(test_game_logic.TestGameLogic):
+    engine = BitboardGameLogic
+    trace_logger_name = 'minesweeper_core.logic.bitboard_logic'
+
+    def test_same_results_as_game_logic(self) -> None:
+        config = Configuration(
+            number_of_rows=16, number_of_columns=30, number_of_mines=60)
+        for seed in range(20):
+            actions = random.Random(seed)
+            game = GameLogic(config, rng=seed)
+            bitboard_game = BitboardGameLogic(config, rng=seed)
+            while not game.is_game_finished:
+                row = actions.randrange(config.number_of_rows)
+                column = actions.randrange(config.number_of_columns)
+                if actions.random() < 0.2:
+                    changes = game.flag_cell(row, column)
+                    bitboard_changes = bitboard_game.flag_cell(row, column)
+                else:
+                    changes = game.open_cell(row, column)
+                    bitboard_changes = bitboard_game.open_cell(row, column)
+                assert dict(changes) == dict(bitboard_changes)
+                assert game.field == bitboard_game.field
+                assert (game.number_of_opened_cells
+                        == bitboard_game.number_of_opened_cells)
+                assert game.number_of_flags == bitboard_game.number_of_flags
+            assert game.is_player_win == bitboard_game.is_player_win
+
+    def test_clone(self) -> None:
+        game = BitboardGameLogic(ADVANCED, rng=5)
+        game.open_cell(12, 12)
+        clone = game.clone()
+        assert clone.field == game.field
+
+        clone.flag_cell(0, 0)
+        game.open_cell(0, 0)
+        assert clone.field[(0, 0)].has_flag != game.field[(0, 0)].has_flag
+        assert clone.number_of_flags == game.number_of_flags - 1
+
+
+class TestBitboardHelpers:
+    def test_count_neighbour_mine_planes(self) -> None:
+        rows, columns = 7, 11
+        column = bytes(random.Random(3).choice((0, 0, 1))
+                       for _ in range(rows * columns))
+        planes = count_neighbour_mine_planes(bits_from_bytes(column),
+                                             rows, columns)
+        counts = [sum(((plane >> index) & 1) << number
+                      for number, plane in enumerate(planes))
+                  for index in range(rows * columns)]
+        assert bytes(counts) == counting.count_neighbour_mines_python(
+            column, rows, columns)
+
+    def test_dilate(self) -> None:
+        # cell (0, 2) of the 3x3 field doesn't wrap to the next row
+        assert indexes_of(dilate(1 << 2, 3, 3)) == [1, 2, 4, 5]
+        assert indexes_of(dilate(1 << 4, 3, 3)) == list(range(9))
+
+    def test_indexes_of(self) -> None:
+        assert indexes_of(0) == []
+        assert indexes_of(0b101000) == [3, 5]
+        assert indexes_of(1 << 100) == [100]
@@ -0,0 +1,57 @@
+import random
+
+import pytest
+
+import minesweeper_core.logic.counting as counting
+
+
+def _count_by_coordinates(mines: bytes, rows: int, columns: int) -> bytes:
+    result = bytearray(rows * columns)
+    for row in range(rows):
+        for column in range(columns):
+            result[row * columns + column] = sum(
+                mines[r * columns + c]
+                for r in range(row - 1, row + 2)
+                for c in range(column - 1, column + 2)
+                if 0 <= r < rows and 0 <= c < columns
+                and (r, c) != (row, column))
+    return bytes(result)
+
+
+FIELD_SIZES = [(1, 1), (1, 7), (7, 1), (3, 3), (9, 9), (16, 30)]
+
+
+class TestCounting:
+    @pytest.mark.parametrize('rows,columns', FIELD_SIZES)
+    def test_count_python_random_field(self, rows: int, columns: int) -> None:
+        generator = random.Random(rows * 100 + columns)
+        mines = bytes(generator.random() < 0.3 for _ in range(rows * columns))
+        expected = _count_by_coordinates(mines, rows, columns)
+        assert counting.count_neighbour_mines_python(
+            mines, rows, columns) == expected
+
+    @pytest.mark.parametrize('rows,columns', FIELD_SIZES)
+    def test_count_python_full_field(self, rows: int, columns: int) -> None:
+        mines = b'\x01' * (rows * columns)
+        expected = _count_by_coordinates(mines, rows, columns)
+        assert counting.count_neighbour_mines_python(
+            mines, rows, columns) == expected
+
+    @pytest.mark.parametrize('rows,columns', FIELD_SIZES)
+    def test_count_numpy(self, rows: int, columns: int) -> None:
+        pytest.importorskip('numpy')
+        generator = random.Random(rows * 100 + columns)
+        mines = bytes(generator.random() < 0.3 for _ in range(rows * columns))
+        expected = _count_by_coordinates(mines, rows, columns)
+        assert counting.count_neighbour_mines_numpy(
+            mines, rows, columns) == expected
+
+    def test_count_neighbour_mines_without_numpy(self, monkeypatch) -> None:
+        monkeypatch.setattr(counting, 'NUMPY_AVAILABLE', False)
+        mines = bytes([1, 0, 0,
+                       0, 0, 0,
+                       0, 0, 1])
+        assert counting.count_neighbour_mines(mines, 3, 3) == bytes(
+            [0, 1, 0,
+             1, 2, 1,
+             0, 1, 0])
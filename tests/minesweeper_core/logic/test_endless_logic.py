@@ -0,0 +1,151 @@
+import pytest
+
+from minesweeper_core.data.field_configuration import EndlessConfiguration
+from minesweeper_core.logic.endless_logic import (MAX_COORDINATE,
+                                                  MAX_REVEAL_DISTANCE,
+                                                  EndlessGameLogic)
+from minesweeper_core.logic.exceptions import IncorrectCoordinatesException
+
+SMALL_CHUNKS = EndlessConfiguration(mine_density=0.2, chunk_size=8)
+
+
+def area(game: EndlessGameLogic, top: int, left: int, size: int):
+    return {(row, column): game.cell(row, column)
+            for row in range(top, top + size)
+            for column in range(left, left + size)}
+
+
+class TestEndlessGameLogic:
+    def test_field_is_defined_by_seed(self) -> None:
+        first = EndlessGameLogic(SMALL_CHUNKS, rng=5)
+        second = EndlessGameLogic(SMALL_CHUNKS, rng=5)
+        first.open_cell(3, 3)
+        second.open_cell(3, 3)
+        assert area(first, -20, -20, 40) == area(second, -20, -20, 40)
+
+    def test_first_open_is_safe(self) -> None:
+        for seed in range(20):
+            game = EndlessGameLogic(
+                EndlessConfiguration(mine_density=0.8, chunk_size=4),
+                rng=seed)
+            game.open_cell(4, -1)
+            assert not game.is_game_finished
+            for row in range(3, 6):
+                for column in range(-2, 1):
+                    assert not game.cell(row, column).has_mine
+
+    def test_numbers_match_mines_across_chunks(self) -> None:
+        game = EndlessGameLogic(SMALL_CHUNKS, rng=3)
+        game.open_cell(0, 0)
+        cells = area(game, -17, -17, 34)
+        for (row, column), cell in cells.items():
+            if -16 < row < 16 and -16 < column < 16:
+                mines = sum(cells[(row + row_offset,
+                                   column + column_offset)].has_mine
+                            for row_offset in (-1, 0, 1)
+                            for column_offset in (-1, 0, 1)
+                            if row_offset or column_offset)
+                assert cell.neighbour_mines == mines
+
+    def test_flag_cell(self) -> None:
+        game = EndlessGameLogic(SMALL_CHUNKS, rng=1)
+        changed = game.flag_cell(-100, 250)
+        assert changed[(-100, 250)].has_flag
+        assert game.number_of_placed_flags == 1
+        changed = game.open_cell(-100, 250)
+        assert not changed[(-100, 250)].has_flag
+        assert not changed[(-100, 250)].is_open
+        assert game.number_of_placed_flags == 0
+
+    def test_open_mine_finishes_game(self) -> None:
+        game = EndlessGameLogic(SMALL_CHUNKS, rng=2)
+        game.open_cell(0, 0)
+        mine = next(coordinate
+                    for coordinate, cell in area(game, 10, 10, 8).items()
+                    if cell.has_mine)
+        changed = game.open_cell(*mine)
+        assert list(changed) == [mine]
+        assert changed[mine].is_open
+        assert game.is_game_finished
+        assert not game.is_player_win
+
+    def test_finished_game_ignores_actions(self) -> None:
+        game = EndlessGameLogic(SMALL_CHUNKS, rng=2)
+        game.open_cell(0, 0)
+        cells = area(game, 10, 10, 8)
+        mine = next(coordinate for coordinate, cell in cells.items()
+                    if cell.has_mine)
+        closed = next(coordinate for coordinate, cell in cells.items()
+                      if not cell.has_mine and not cell.is_open)
+        game.open_cell(*mine)
+        assert game.open_cell(*closed) == {}
+        assert game.flag_cell(*closed) == {}
+        assert not game.cell(*closed).is_open
+        assert not game.cell(*closed).has_flag
+        assert game.number_of_placed_flags == 0
+
+    def test_reveal_is_bounded(self) -> None:
+        game = EndlessGameLogic(
+            EndlessConfiguration(mine_density=0.0, chunk_size=16), rng=1)
+        changed = game.open_cell(0, 0)
+        side = 2 * MAX_REVEAL_DISTANCE - 1
+        assert len(changed) == side * side
+        assert game.number_of_opened_cells == side * side
+        assert not game.cell(0, MAX_REVEAL_DISTANCE).is_open
+        changed = game.open_cell(0, MAX_REVEAL_DISTANCE)
+        assert (0, 2 * MAX_REVEAL_DISTANCE - 1) in changed
+
+    def test_chunks_are_evicted_and_loaded(self, tmp_path) -> None:
+        game = EndlessGameLogic(SMALL_CHUNKS, rng=4, max_chunks=4,
+                                spill_directory=tmp_path)
+        game.open_cell(0, 0)
+        opened = {coordinate for coordinate, cell
+                  in area(game, -8, -8, 16).items() if cell.is_open}
+        game.flag_cell(5000, 5000)
+        for column in range(0, 200, 8):
+            game.cell(-3000, column)
+        assert game.number_of_chunks <= 4
+        assert game.number_of_spilled_chunks >= 2
+        assert game.cell(5000, 5000).has_flag
+        assert opened == {coordinate for coordinate, cell
+                          in area(game, -8, -8, 16).items()
+                          if cell.is_open}
+
+    def test_packed_states(self) -> None:
+        game = EndlessGameLogic(SMALL_CHUNKS, rng=6)
+        game.open_cell(2, 2)
+        game.flag_cell(-3, 9)
+        cells = area(game, -4, -4, 20)
+        packed = game.packed_states(-4, -4, 20, 12)
+        for (row, column), cell in cells.items():
+            if column >= 8:
+                continue
+            state = packed[(row + 4) * 12 + column + 4]
+            assert bool(state & 0x10) == cell.is_open
+            assert bool(state & 0x40) == cell.has_flag
+            assert bool(state & 0x20) == cell.has_mine
+            assert state & 0x0F == cell.neighbour_mines
+
+    def test_packed_states_do_not_create_chunks(self) -> None:
+        game = EndlessGameLogic(SMALL_CHUNKS, rng=6)
+        assert game.packed_states(100, 100, 30, 30) == bytes(900)
+        assert game.number_of_chunks == 0
+
+    def test_reset(self) -> None:
+        game = EndlessGameLogic(SMALL_CHUNKS, rng=7)
+        seed = game.seed
+        game.open_cell(0, 0)
+        game.flag_cell(30, 30)
+        game.reset()
+        assert game.seed != seed
+        assert game.number_of_chunks == 0
+        assert game.number_of_opened_cells == 0
+        assert game.number_of_placed_flags == 0
+        assert not game.is_game_finished
+
+    @pytest.mark.parametrize('row, column', [
+        (MAX_COORDINATE, 0), (0, -MAX_COORDINATE - 1)])
+    def test_incorrect_coordinates(self, row: int, column: int) -> None:
+        game = EndlessGameLogic(SMALL_CHUNKS)
+        with pytest.raises(IncorrectCoordinatesException):
+            game.open_cell(row, column)
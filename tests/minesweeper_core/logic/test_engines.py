@@ -0,0 +1,42 @@
+import pytest
+
+from minesweeper_core.logic.bitboard_logic import BitboardGameLogic
+from minesweeper_core.logic.engines import (DEFAULT_ENGINE, ENGINE_ARRAY,
+                                            ENGINE_BITBOARD,
+                                            ENGINE_ENVIRONMENT_VARIABLE,
+                                            ENGINE_REFERENCE,
+                                            available_engines, get_engine,
+                                            get_engine_name, register_engine)
+from minesweeper_core.logic.exceptions import UnknownEngineException
+from minesweeper_core.logic.game_logic import GameLogic
+from minesweeper_core.logic.reference_logic import ReferenceGameLogic
+
+
+class TestEngines:
+    def test_registered_engines(self) -> None:
+        assert get_engine(ENGINE_REFERENCE) is ReferenceGameLogic
+        assert get_engine(ENGINE_ARRAY) is GameLogic
+        assert get_engine(ENGINE_BITBOARD) is BitboardGameLogic
+        assert DEFAULT_ENGINE in available_engines()
+
+    def test_unknown_engine(self) -> None:
+        with pytest.raises(UnknownEngineException):
+            get_engine('unknown')
+
+    def test_register_engine(self) -> None:
+        class CustomGameLogic(GameLogic):
+            pass
+
+        register_engine('custom', CustomGameLogic)
+        try:
+            assert get_engine('custom') is CustomGameLogic
+        finally:
+            register_engine('custom', GameLogic)
+
+    def test_get_engine_name(self, monkeypatch) -> None:
+        monkeypatch.delenv(ENGINE_ENVIRONMENT_VARIABLE, raising=False)
+        assert get_engine_name() == DEFAULT_ENGINE
+        assert get_engine_name(ENGINE_REFERENCE) == ENGINE_REFERENCE
+        monkeypatch.setenv(ENGINE_ENVIRONMENT_VARIABLE, ENGINE_BITBOARD)
+        assert get_engine_name() == ENGINE_BITBOARD
+        assert get_engine_name(ENGINE_ARRAY) == ENGINE_ARRAY
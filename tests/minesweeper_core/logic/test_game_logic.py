@@ -1,16 +1,25 @@
+import logging
+import random
+from collections.abc import Mapping
+
 import pytest
 
 from minesweeper_core.constants.configurations import ADVANCED, \
     BEGINNER, INTERMEDIATE
+from minesweeper_core.data.cell import Cell
 from minesweeper_core.data.field_configuration import Configuration
+from minesweeper_core.logic.base_logic import BaseGameLogic
 from minesweeper_core.logic.exceptions import IncorrectCoordinatesException
 from minesweeper_core.logic.game_logic import GameLogic
 
 
 class TestGameLogic:
+    engine: type[BaseGameLogic] = GameLogic
+    trace_logger_name: str = 'minesweeper_core.logic.game_logic'
+
     def test_init_with_beginner_config(self) -> None:
         config = BEGINNER
-        game = GameLogic(BEGINNER)
+        game = self.engine(BEGINNER)
         game_rows = game.rows
         game_cols = game.columns
         game_mines = game._game_field.field_config.number_of_mines
@@ -41,7 +50,7 @@ class TestGameLogic:
 
     def test_init_with_intermediate_config(self) -> None:
         config = INTERMEDIATE
-        game = GameLogic(config)
+        game = self.engine(config)
         game_rows = game.rows
         game_cols = game.columns
         game_mines = game._game_field.field_config.number_of_mines
@@ -72,7 +81,7 @@ class TestGameLogic:
 
     def test_init_with_advanced_config(self) -> None:
         config = ADVANCED
-        game = GameLogic(config)
+        game = self.engine(config)
         game_rows = game.rows
         game_cols = game.columns
         game_mines = game._game_field.field_config.number_of_mines
@@ -102,77 +111,124 @@ class TestGameLogic:
             assert cell.neighbour_mines == 0
 
     def test_get_property_rows(self) -> None:
-        game = GameLogic(BEGINNER)
+        game = self.engine(BEGINNER)
         assert game.rows == 9
         assert isinstance(game.rows, int)
 
     def test_get_property_columns(self) -> None:
-        game = GameLogic(BEGINNER)
+        game = self.engine(BEGINNER)
         assert game.columns == 9
         assert isinstance(game.columns, int)
 
     def test_get_property_field(self) -> None:
-        game = GameLogic(BEGINNER)
+        game = self.engine(BEGINNER)
         assert game.field is not None
-        assert isinstance(game.field, dict)
+        assert isinstance(game.field, Mapping)
 
     def test_get_property_is_game_finished(self) -> None:
-        game = GameLogic(BEGINNER)
+        game = self.engine(BEGINNER)
         assert not game.is_game_finished
         assert isinstance(game.is_game_finished, bool)
 
     def test_get_property_is_player_win(self) -> None:
-        game = GameLogic(BEGINNER)
+        game = self.engine(BEGINNER)
         assert not game.is_player_win
         assert isinstance(game.is_player_win, bool)
 
     def test_get_property_number_of_mines(self) -> None:
-        game = GameLogic(BEGINNER)
+        game = self.engine(BEGINNER)
         assert game.number_of_mines == 10
         assert isinstance(game.number_of_mines, int)
 
     def test_get_property_number_of_flags(self) -> None:
-        game = GameLogic(BEGINNER)
+        game = self.engine(BEGINNER)
         assert game.number_of_flags == 10
         assert isinstance(game.number_of_flags, int)
 
+    def test_get_property_counters(self) -> None:
+        game = self.engine(BEGINNER)
+        assert game.number_of_placed_flags == 0
+        assert game.number_of_opened_cells == 0
+        assert game.number_of_cells_left == 71
+
+    def test_counters_are_updated_by_open_and_flag(self) -> None:
+        config = Configuration(
+            number_of_rows=5, number_of_columns=5, number_of_mines=3)
+        game = self.engine(config)
+        game._put_mines = lambda _: print()
+        # * - - - -
+        # - - - - -
+        # - - - * -
+        # - - - - -
+        # - - - - *
+        game.field[(0, 0)].has_mine = True
+        game.field[(2, 3)].has_mine = True
+        game.field[(4, 4)].has_mine = True
+        game.open_cell(4, 0)
+        assert game.number_of_opened_cells == 14
+        assert game.number_of_cells_left == 8
+        game.flag_cell(0, 0)
+        game.flag_cell(0, 1)
+        assert game.number_of_placed_flags == 2
+        assert game.number_of_flags == 1
+        game.open_cell(0, 1)
+        assert game.number_of_placed_flags == 1
+        assert game.number_of_flags == 1
+        assert game.number_of_opened_cells == 14
+        game.open_cell(0, 1)
+        assert game.number_of_opened_cells == 15
+        assert game.number_of_cells_left == 7
+
+    def test_counters_after_win(self) -> None:
+        config = Configuration(
+            number_of_rows=3, number_of_columns=3, number_of_mines=1)
+        game = self.engine(config)
+        game._put_mines = lambda _: print()
+        game.field[(0, 0)].has_mine = True
+        game.open_cell(2, 2)
+        assert game.is_game_finished
+        assert game.is_player_win
+        assert game.number_of_opened_cells == 8
+        assert game.number_of_cells_left == 0
+        assert game.number_of_placed_flags == 1
+
     def test_set_property_number_of_flags(self) -> None:
-        game = GameLogic(BEGINNER)
+        game = self.engine(BEGINNER)
         with pytest.raises(AttributeError):
             game.number_of_flags = 100
 
     def test_set_property_number_of_mines(self) -> None:
-        game = GameLogic(BEGINNER)
+        game = self.engine(BEGINNER)
         with pytest.raises(AttributeError):
             game.number_of_mines = 100
 
     def test_set_property_rows(self) -> None:
-        game = GameLogic(BEGINNER)
+        game = self.engine(BEGINNER)
         with pytest.raises(AttributeError):
             game.rows = 10
 
     def test_set_property_columns(self) -> None:
-        game = GameLogic(BEGINNER)
+        game = self.engine(BEGINNER)
         with pytest.raises(AttributeError):
             game.columns = 10
 
     def test_set_property_field(self) -> None:
-        game = GameLogic(BEGINNER)
+        game = self.engine(BEGINNER)
         with pytest.raises(AttributeError):
             game.field = {}
 
     def test_set_property_is_game_finished(self) -> None:
-        game = GameLogic(BEGINNER)
+        game = self.engine(BEGINNER)
         with pytest.raises(AttributeError):
             game.is_game_finished = True
 
     def test_set_property_is_player_win(self) -> None:
-        game = GameLogic(BEGINNER)
+        game = self.engine(BEGINNER)
         with pytest.raises(AttributeError):
             game.is_player_win = True
 
     def test_open_cell_first_time(self) -> None:
-        game = GameLogic(BEGINNER)
+        game = self.engine(BEGINNER)
         number_of_mines_in_field = 0
         number_of_opened_fields = 0
         for cell in game.field.values():
@@ -200,8 +256,45 @@ class TestGameLogic:
         assert number_of_mines_in_field_after == 10
         assert number_of_opened_fields_after >= 1
 
+    def test_reset(self) -> None:
+        game = self.engine(BEGINNER, rng=3)
+        field = game.field
+        game.flag_cell(8, 8)
+        game.open_cell(0, 0)
+        game.reset()
+
+        assert game.field is field
+        assert game.number_of_flags == BEGINNER.number_of_mines
+        assert game.number_of_placed_flags == 0
+        assert game.number_of_opened_cells == 0
+        assert not game.is_game_finished
+        assert not game.is_player_win
+        assert all(cell == Cell(cell.row, cell.column)
+                   for cell in field.values())
+
+        game.open_cell(4, 4)
+        assert sum(cell.has_mine for cell in field.values()) == 10
+        assert field[(4, 4)].is_open
+
+    def test_trace_is_resolved_on_start(self, caplog) -> None:
+        logger_name = self.trace_logger_name
+        game = self.engine(BEGINNER, rng=3)
+        assert game._trace is None
+
+        with caplog.at_level(logging.DEBUG, logger=logger_name):
+            game.open_cell(4, 4)
+            assert not [record for record in caplog.records
+                        if record.levelno == logging.DEBUG]
+
+            game.reset()
+            assert game._trace is not None
+            game.open_cell(4, 4)
+            assert 'Open Cell, (4, 4)' in caplog.messages
+            assert {record.name for record in caplog.records} == {
+                logger_name}
+
     def test_flag_cell(self) -> None:
-        game = GameLogic(BEGINNER)
+        game = self.engine(BEGINNER)
         game._put_mines = lambda coordinates: print(coordinates)
         game.field[(0, 0)].has_mine = True
         game.field[(5, 5)].has_mine = True
@@ -235,8 +328,65 @@ class TestGameLogic:
         game.flag_cell(3, 1)
         assert game._flags_number == BEGINNER.number_of_mines
 
+    def test_open_cell_returns_change_set(self) -> None:
+        config = Configuration(
+            number_of_rows=5, number_of_columns=5, number_of_mines=3)
+        game = self.engine(config)
+        game._put_mines = lambda _: print()
+        game.field[(0, 0)].has_mine = True
+        game.field[(2, 3)].has_mine = True
+        game.field[(4, 4)].has_mine = True
+        change_set = game.open_cell(4, 0)
+
+        opened = sorted(coordinate for coordinate, cell in game.field.items()
+                        if cell.is_open)
+        assert sorted(change_set) == opened
+        assert change_set[(2, 2)] == game.field[(2, 2)]
+        assert len(game.open_cell(4, 0)) == 0
+
+    def test_flag_cell_returns_change_set(self) -> None:
+        game = self.engine(BEGINNER)
+        change_set = game.flag_cell(3, 4)
+        assert list(change_set) == [(3, 4)]
+        assert change_set[(3, 4)].has_flag
+        change_set = game.flag_cell(3, 4)
+        assert not change_set[(3, 4)].has_flag
+
+    @pytest.mark.parametrize('seed', range(4))
+    def test_change_set_keeps_old_states(self, seed: int) -> None:
+        generator = random.Random(seed)
+        game = self.engine(INTERMEDIATE, rng=seed)
+        while not game.is_game_finished:
+            is_game_started = game.is_game_started
+            before = game.dumps()[-game.rows * game.columns:]
+            row = generator.randrange(game.rows)
+            column = generator.randrange(game.columns)
+            if generator.random() < 0.3:
+                change_set = game.flag_cell(row, column)
+            else:
+                change_set = game.open_cell(row, column)
+            if not is_game_started:
+                continue
+            assert change_set.old_states == bytes(
+                before[index] for index in change_set.indexes)
+
+    def test_open_cell_with_mine_changes_all_closed_cells(self) -> None:
+        config = Configuration(
+            number_of_rows=3, number_of_columns=3, number_of_mines=2)
+        game = self.engine(config)
+        game._put_mines = lambda _: print()
+        game.field[(0, 0)].has_mine = True
+        game.field[(0, 2)].has_mine = True
+        game.open_cell(2, 0)
+        game.flag_cell(0, 2)
+        change_set = game.open_cell(0, 0)
+
+        assert game.is_game_finished
+        assert sorted(change_set) == [(0, 0), (0, 1), (0, 2)]
+        assert change_set[(0, 0)].is_open
+
     def test__open_cell_has_mine(self) -> None:
-        game = GameLogic(BEGINNER)
+        game = self.engine(BEGINNER)
         game.open_cell(0, 0)
         game.field[(1, 1)].has_mine = True
         game.field[(1, 1)].has_flag = False
@@ -248,7 +398,7 @@ class TestGameLogic:
         assert game.field[(1, 1)].is_open
 
     def test__open_cell_has_flag(self) -> None:
-        game = GameLogic(BEGINNER)
+        game = self.engine(BEGINNER)
         game.open_cell(0, 0)
         game.field[(2, 2)].has_mine = False
         game.field[(2, 2)].has_flag = True
@@ -261,7 +411,7 @@ class TestGameLogic:
         assert not game.field[(2, 2)].is_open
 
     def test__open_cell_normal_cell(self) -> None:
-        game = GameLogic(BEGINNER)
+        game = self.engine(BEGINNER)
         game.open_cell(0, 0)
         game.field[(3, 3)].has_mine = False
         game.field[(3, 3)].has_flag = False
@@ -273,7 +423,7 @@ class TestGameLogic:
         assert game.field[(3, 3)].is_open
 
     def test__open_cell_already_opened_cell(self) -> None:
-        game = GameLogic(BEGINNER)
+        game = self.engine(BEGINNER)
         game.open_cell(0, 0)
         game.field[(4, 4)].has_mine = False
         game.field[(4, 4)].has_flag = False
@@ -285,7 +435,7 @@ class TestGameLogic:
         assert game.field[(4, 4)].is_open
 
     def test__put_mines(self) -> None:
-        game = GameLogic(BEGINNER)
+        game = self.engine(BEGINNER)
         count_mines_before = 0
         for cell in game.field.values():
             if cell.has_mine:
@@ -302,10 +452,38 @@ class TestGameLogic:
         assert count_mines_after > count_mines_before
         assert count_mines_after == BEGINNER.number_of_mines
 
+    def test__put_mines_high_density(self) -> None:
+        config = Configuration(
+            number_of_rows=9, number_of_columns=9, number_of_mines=71)
+        game = self.engine(config)
+        game._put_mines((4, 4))
+
+        mines = [coordinate for coordinate, cell in game.field.items()
+                 if cell.has_mine]
+        assert len(mines) == 71
+        assert (4, 4) not in mines
+
+    def test__put_mines_all_but_one(self) -> None:
+        config = Configuration(
+            number_of_rows=3, number_of_columns=3, number_of_mines=8)
+        game = self.engine(config)
+        game._put_mines((0, 2))
+
+        for coordinate, cell in game.field.items():
+            assert cell.has_mine == (coordinate != (0, 2))
+
+    def test__put_mines_with_seed_is_reproducible(self) -> None:
+        first_game = self.engine(ADVANCED, rng=42)
+        second_game = self.engine(ADVANCED, rng=random.Random(42))
+        first_game.open_cell(10, 10)
+        second_game.open_cell(10, 10)
+
+        assert first_game.field == second_game.field
+
     def test__open_neighbour_cells(self) -> None:
         config = Configuration(
             number_of_rows=5, number_of_columns=5, number_of_mines=3)
-        game = GameLogic(config)
+        game = self.engine(config)
         # * - - - -     ->      * - - - -
         # - - - - -     ->      1 1 1 - -
         # - - - * -     ->      - - 1 * -
@@ -331,8 +509,40 @@ class TestGameLogic:
         assert game.field[(3, 3)].is_open
         assert game.field[(4, 3)].is_open
 
+    def test__open_neighbour_cells_returns_opened_cells(self) -> None:
+        config = Configuration(
+            number_of_rows=5, number_of_columns=5, number_of_mines=3)
+        game = self.engine(config)
+        game._is_first_time_open = False
+        game.field[(0, 0)].has_mine = True
+        game.field[(2, 3)].has_mine = True
+        game.field[(4, 4)].has_mine = True
+        game.field[(1, 3)].has_flag = True
+        game._count_neighbour_mines_for_all_field()
+        opened = game._open_this_and_neighbour_cells((4, 0))
+
+        opened_coordinates = sorted(divmod(index, 5) for index in opened)
+        assert len(opened) == len(set(opened))
+        assert opened_coordinates == sorted(
+            coordinate for coordinate, cell in game.field.items()
+            if cell.is_open)
+        assert (1, 3) not in opened_coordinates
+        assert game.number_of_opened_cells == len(opened)
+
+    def test__open_neighbour_cells_of_big_empty_field(self) -> None:
+        config = Configuration(
+            number_of_rows=300, number_of_columns=300, number_of_mines=1)
+        game = self.engine(config)
+        game._put_mines = lambda _: print()
+        game.field[(0, 0)].has_mine = True
+        game.open_cell(150, 150)
+
+        assert game.is_game_finished
+        assert game.is_player_win
+        assert game.number_of_opened_cells == 300 * 300 - 1
+
     def test__validate_coordinates(self) -> None:
-        game = GameLogic(BEGINNER)
+        game = self.engine(BEGINNER)
         with pytest.raises(IncorrectCoordinatesException):
             game._validate_coordinates(-1, 0)
         with pytest.raises(IncorrectCoordinatesException):
@@ -349,7 +559,7 @@ class TestGameLogic:
     def test__process_current_game_state_without_flags(self) -> None:
         config = Configuration(
             number_of_rows=5, number_of_columns=5, number_of_mines=3)
-        game = GameLogic(config)
+        game = self.engine(config)
         game._put_mines = lambda _: print()
         # * - - - -
         # - - - - -
@@ -382,7 +592,7 @@ class TestGameLogic:
     def test__process_current_game_state_with_flags(self) -> None:
         config = Configuration(
             number_of_rows=5, number_of_columns=5, number_of_mines=3)
-        game = GameLogic(config)
+        game = self.engine(config)
         game._put_mines = lambda _: print()
         # * - - - -
         # - - - - -
@@ -0,0 +1,169 @@
+import random
+
+import pytest
+
+from minesweeper_core.api.controller import MinesweeperController
+from minesweeper_core.data.board import FLAG_BIT, OPEN_BIT
+from minesweeper_core.data.change_set import ChangeSet
+from minesweeper_core.data.field_configuration import Configuration
+from minesweeper_core.data.game_status import GameStatus
+from minesweeper_core.logic.engines import available_engines
+from minesweeper_core.logic.history import GameHistory
+
+STATUS = GameStatus(flags_left=10, placed_flags=0, opened_cells=0)
+
+
+def change_set(indexes: list[int], state: int,
+               old_state: int = 0) -> ChangeSet:
+    return ChangeSet(9, indexes, bytes([state] * len(indexes)),
+                     bytes([old_state] * len(indexes)))
+
+
+class TestGameHistory:
+    def test_record_undo_and_redo(self) -> None:
+        history = GameHistory()
+        flagged = GameStatus(flags_left=9, placed_flags=1, opened_cells=0)
+        history.record(change_set([4], FLAG_BIT | 2, 2), STATUS, flagged)
+        history.record(change_set([4], 2, FLAG_BIT | 2), flagged, STATUS)
+        assert len(history) == 2 and history.can_undo
+
+        entry = history.undo()
+        assert entry.old_states == bytes([FLAG_BIT | 2])
+        assert entry.new_states == bytes([2])
+        assert entry.old_status == flagged
+        entry = history.undo()
+        assert entry.old_states == bytes([2])
+        assert history.undo() is None
+        assert not history.can_undo and history.can_redo
+
+        assert history.redo().new_states == bytes([FLAG_BIT | 2])
+        assert len(history) == 1
+
+    def test_old_states_are_kept(self) -> None:
+        history = GameHistory()
+        old_states = bytes([1, OPEN_BIT | FLAG_BIT | 1, FLAG_BIT | 1])
+        history.record(ChangeSet(9, [1, 2, 3], bytes([OPEN_BIT | 1] * 3),
+                                 old_states), STATUS, STATUS)
+        entry = history.undo()
+        assert entry.old_states == old_states
+        assert entry.new_states == bytes([OPEN_BIT | 1] * 3)
+
+    def test_new_action_removes_undone_actions(self) -> None:
+        history = GameHistory()
+        history.record(change_set([1], FLAG_BIT), STATUS, STATUS)
+        history.undo()
+        history.record(change_set([2], FLAG_BIT), STATUS, STATUS)
+        assert not history.can_redo
+
+    def test_empty_action_is_not_recorded(self) -> None:
+        history = GameHistory()
+        history.record(ChangeSet(), STATUS, STATUS)
+        assert len(history) == 0
+
+    def test_oldest_actions_are_evicted(self) -> None:
+        history = GameHistory(max_entries=3, max_cells=10)
+        for index in range(5):
+            history.record(change_set([index], FLAG_BIT), STATUS, STATUS)
+        assert len(history) == 3
+        assert history.number_of_cells == 3
+        history.record(change_set(list(range(10, 19)), OPEN_BIT),
+                       STATUS, STATUS)
+        assert len(history) == 2
+        assert history.number_of_cells == 10
+        history.record(change_set(list(range(20, 40)), OPEN_BIT),
+                       STATUS, STATUS)
+        assert len(history) == 1
+        assert history.number_of_cells == 20
+
+
+class TestControllerHistory:
+    @pytest.mark.parametrize('engine', available_engines())
+    @pytest.mark.parametrize('seed', range(4))
+    def test_undo_and_redo_restore_game(self, engine: str,
+                                        seed: int) -> None:
+        generator = random.Random(seed)
+        controller = MinesweeperController(engine=engine)
+        controller.start_new_game(Configuration(12, 15, 25))
+        controller._game_instance._random.seed(seed)
+        controller.open_cell(6, 7)
+        snapshots = [controller.dumps()]
+        while not controller._game_instance.is_game_finished:
+            row = generator.randrange(12)
+            column = generator.randrange(15)
+            if generator.random() < 0.3:
+                controller.flag_cell(row, column)
+            else:
+                controller.open_cell(row, column)
+            if controller.dumps() != snapshots[-1]:
+                snapshots.append(controller.dumps())
+        assert len(controller._history) == len(snapshots) - 1
+
+        for snapshot in reversed(snapshots[:-1]):
+            controller.undo()
+            assert controller.dumps() == snapshot
+        assert not controller.can_undo
+        for snapshot in snapshots[1:]:
+            controller.redo()
+            assert controller.dumps() == snapshot
+        assert not controller.can_redo
+
+    @pytest.mark.parametrize('engine', available_engines())
+    def test_undo_win_keeps_flags_of_player(self, engine: str) -> None:
+        controller = MinesweeperController(engine=engine)
+        controller.start_new_game(Configuration(9, 9, 10))
+        controller.open_cell(4, 4)
+        field = controller._game_instance.field
+        mines = [coordinate for coordinate, cell in field.items()
+                 if cell.has_mine]
+        controller.flag_cell(*mines[0])
+        for coordinate, cell in field.items():
+            if not cell.has_mine and not cell.is_open:
+                before_win = controller.dumps()
+                controller.open_cell(*coordinate)
+        after_win = controller.dumps()
+        assert controller._game_instance.is_player_win
+
+        controller.undo()
+        assert controller.dumps() == before_win
+        assert field[mines[0]].has_flag
+        assert not any(field[coordinate].has_flag
+                       for coordinate in mines[1:])
+        controller.redo()
+        assert controller.dumps() == after_win
+
+    @pytest.mark.parametrize('engine', available_engines())
+    def test_undo_action_on_opened_cell(self, engine: str) -> None:
+        controller = MinesweeperController(engine=engine)
+        controller.start_new_game(Configuration(3, 3, 1))
+        controller.open_cell(1, 1)
+        field = controller._game_instance.field
+        mine = next(coordinate for coordinate, cell in field.items()
+                    if cell.has_mine)
+        for coordinate, cell in field.items():
+            if not cell.has_mine and not cell.is_open:
+                controller.open_cell(*coordinate)
+        assert controller._game_instance.is_player_win
+        after_win = controller.dumps()
+        assert len(controller.flag_cell(*mine)) == 1
+
+        controller.undo()
+        assert controller.dumps() == after_win
+        assert field[mine].is_open and field[mine].has_flag
+        assert controller._game_instance.is_game_finished
+
+    def test_first_open_is_not_undone(self) -> None:
+        controller = MinesweeperController()
+        controller.start_new_game(Configuration(9, 9, 10))
+        controller.open_cell(4, 4)
+        assert not controller.can_undo
+        assert len(controller.undo()) == 0
+        assert controller._game_instance.is_game_started
+
+    def test_history_is_cleared_by_new_game(self) -> None:
+        controller = MinesweeperController()
+        controller.start_new_game(Configuration(9, 9, 10))
+        controller.open_cell(4, 4)
+        controller.flag_cell(0, 0)
+        controller.flag_cell(8, 8)
+        controller.reset_game()
+        assert not controller.can_undo and not controller.can_redo
@@ -0,0 +1,11 @@
+import pytest
+
+from minesweeper_core.logic.numpy_logic import NumpyGameLogic
+from tests.minesweeper_core.logic import test_game_logic
+
+pytest.importorskip('numpy')
+
+
+class TestNumpyGameLogic(test_game_logic.TestGameLogic):
+    engine = NumpyGameLogic
+    trace_logger_name = 'minesweeper_core.logic.numpy_logic'
@@ -0,0 +1,31 @@
+from minesweeper_core.data.board import FieldView
+from minesweeper_core.data.field_configuration import Configuration
+from minesweeper_core.logic.game_logic import GameLogic
+from minesweeper_core.logic.reference_logic import ReferenceGameLogic
+from tests.minesweeper_core.logic import test_game_logic
+
+
+class TestReferenceGameLogic(test_game_logic.TestGameLogic):
+    engine = ReferenceGameLogic
+    trace_logger_name = 'minesweeper_core.logic.reference_logic'
+
+    def test_field_is_view_of_board(self) -> None:
+        game = ReferenceGameLogic(Configuration(number_of_rows=3,
+                                                number_of_columns=4,
+                                                number_of_mines=2))
+        assert isinstance(game.field, FieldView)
+        assert len(game.field) == 12
+        game.flag_cell(1, 1)
+        assert game._board.flags[5] == 1
+        assert game.number_of_placed_flags == 1
+
+    def test_same_field_as_game_logic(self) -> None:
+        config = Configuration(
+            number_of_rows=9, number_of_columns=9, number_of_mines=10)
+        for seed in range(10):
+            game = GameLogic(config, rng=seed)
+            reference_game = ReferenceGameLogic(config, rng=seed)
+            changes = game.open_cell(4, 4)
+            reference_changes = reference_game.open_cell(4, 4)
+            assert dict(changes) == dict(reference_changes)
+            assert game.field == reference_game.field
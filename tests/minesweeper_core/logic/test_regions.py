@@ -0,0 +1,114 @@
+import random
+
+import pytest
+
+from minesweeper_core.constants.configurations import BEGINNER
+from minesweeper_core.data.field_configuration import Configuration
+from minesweeper_core.logic.adjacency import get_adjacency
+from minesweeper_core.logic.counting import count_neighbour_mines
+from minesweeper_core.logic.game_logic import GameLogic
+from minesweeper_core.logic.regions import label_zero_regions
+
+
+def search_region(mines: bytes, counts: bytes, rows: int, columns: int,
+                  index: int) -> tuple[set[int], set[int]]:
+    adjacency = get_adjacency(rows, columns)
+    zeros = {index}
+    borders = set()
+    queue = [index]
+    while queue:
+        for neighbour in adjacency.neighbours_of(queue.pop()):
+            if counts[neighbour] or mines[neighbour]:
+                borders.add(neighbour)
+            elif neighbour not in zeros:
+                zeros.add(neighbour)
+                queue.append(neighbour)
+    return zeros, borders
+
+
+class TestZeroRegions:
+    @pytest.mark.parametrize('rows, columns, density', [
+        (1, 1, 0.0), (1, 12, 0.1), (12, 1, 0.1), (9, 9, 0.12),
+        (20, 30, 0.05), (30, 20, 0.2), (40, 40, 0.01)])
+    def test_regions_match_search(self, rows: int, columns: int,
+                                  density: float) -> None:
+        generator = random.Random(rows * columns)
+        mines = bytes(generator.random() < density
+                      for _ in range(rows * columns))
+        counts = count_neighbour_mines(mines, rows, columns)
+        regions = label_zero_regions(mines, counts, rows, columns,
+                                     min_average_run_length=0)
+        searched = set()
+        for index in range(rows * columns):
+            region = regions.region_of(index)
+            if mines[index] or counts[index]:
+                assert region == -1
+                continue
+            if index in searched:
+                continue
+            zeros, borders = search_region(mines, counts, rows, columns,
+                                           index)
+            searched.update(zeros)
+            assert {cell for start, stop in regions.runs_of(region)
+                    for cell in range(start, stop)} == zeros
+            assert list(regions.borders_of(region)) == sorted(borders)
+
+    def test_region_of_separated_regions(self) -> None:
+        # . . * . .
+        # . . * . .
+        mines = bytes([0, 0, 1, 0, 0] * 2)
+        counts = count_neighbour_mines(mines, 2, 5)
+        regions = label_zero_regions(mines, counts, 2, 5,
+                                     min_average_run_length=0)
+        assert regions.number_of_regions == 2
+        assert regions.region_of(0) == regions.region_of(5) == 0
+        assert regions.region_of(4) == regions.region_of(9) == 1
+        assert regions.region_of(1) == -1
+        assert list(regions.borders_of(0)) == [1, 6]
+        assert list(regions.runs_of(1)) == [(4, 5), (9, 10)]
+
+    def test_dense_field_is_not_labelled(self) -> None:
+        # zero cells are alone between the mines
+        mines = bytes([1, 0, 0, 0] * 4)
+        counts = count_neighbour_mines(mines, 4, 4)
+        assert label_zero_regions(mines, counts, 4, 4) is None
+        assert label_zero_regions(mines, counts, 4, 4,
+                                  min_average_run_length=0) is not None
+
+
+class TestZeroRegionReveal:
+    def test_first_click_opens_labelled_region(self) -> None:
+        config = Configuration(number_of_rows=30, number_of_columns=30,
+                               number_of_mines=3)
+        game = GameLogic(config, rng=1)
+        changes = game.open_cell(15, 15)
+        assert game._zero_regions is not None
+        assert len(changes) == game.number_of_opened_cells
+
+    def test_dense_game_is_not_labelled(self) -> None:
+        game = GameLogic(BEGINNER, rng=1)
+        game._put_mines = lambda _: None
+        game.field[(0, 8)].has_mine = True
+        game.open_cell(8, 0)
+
+        assert game._is_field_labelled
+        assert game._zero_regions is None
+        assert game.field[(0, 0)].is_open
+
+    def test_flagged_region_is_searched(self) -> None:
+        game = GameLogic(BEGINNER, rng=1)
+        game._put_mines = lambda _: None
+        game.field[(0, 8)].has_mine = True
+        game.flag_cell(8, 0)
+        game.flag_cell(4, 4)
+        game.open_cell(8, 8)
+
+        assert not game.field[(8, 0)].is_open
+        assert not game.field[(4, 4)].is_open
+        assert game.field[(0, 0)].is_open
+        assert game.field[(0, 7)].is_open
+        assert game.number_of_opened_cells == 78
+        game.open_cell(4, 4)
+        assert game.field[(4, 4)].has_flag is False
+        game.open_cell(4, 4)
+        assert game.field[(4, 4)].is_open
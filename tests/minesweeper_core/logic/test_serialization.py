@@ -0,0 +1,100 @@
+import time
+
+import pytest
+
+from minesweeper_core.constants.configurations import ADVANCED
+from minesweeper_core.data.field_configuration import Configuration
+from minesweeper_core.logic.engines import available_engines, get_engine
+from minesweeper_core.logic.exceptions import IncorrectSaveException
+from minesweeper_core.logic.game_logic import GameLogic
+from minesweeper_core.logic.serialization import (FORMAT_VERSION, HEADER,
+                                                  MAGIC, SavedGame,
+                                                  dump_game, load_game)
+
+
+def play(game: GameLogic) -> None:
+    game.open_cell(5, 5)
+    game.flag_cell(0, 0)
+    game.flag_cell(15, 23)
+
+
+def state_of(game: GameLogic) -> tuple:
+    return (dict(game.field), game.number_of_flags,
+            game.number_of_placed_flags, game.number_of_opened_cells,
+            game.is_game_finished, game.is_player_win)
+
+
+class TestSerialization:
+    def test_dump_and_load(self) -> None:
+        saved = SavedGame(
+            config=Configuration(2, 3, 1), states=bytes([0x20, 1, 0x51, 0,
+                                                         0, 0]),
+            flags_left=0, opened_cells=1, is_first_time_open=False,
+            is_game_finished=True, is_player_win=False)
+        data = dump_game(saved)
+        assert data.startswith(MAGIC)
+        assert len(data) == HEADER.size + 6
+        assert load_game(data) == saved
+        assert load_game(memoryview(data)) == saved
+
+    @pytest.mark.parametrize('data', [
+        b'', b'MSWP', b'XXXX' + bytes(HEADER.size),
+        HEADER.pack(MAGIC, FORMAT_VERSION + 1, 1, 1, 0, 0, 0, 0) + b'\0',
+        HEADER.pack(MAGIC, FORMAT_VERSION, 2, 2, 0, 0, 0, 0) + b'\0'])
+    def test_load_incorrect_data(self, data: bytes) -> None:
+        with pytest.raises(IncorrectSaveException):
+            load_game(data)
+
+
+class TestGameSaving:
+    @pytest.mark.parametrize('engine', available_engines())
+    def test_dumps_and_loads(self, engine: str) -> None:
+        game = get_engine(engine)(ADVANCED, rng=1)
+        play(game)
+        loaded = type(game).loads(game.dumps())
+        assert state_of(loaded) == state_of(game)
+        assert loaded.dumps() == game.dumps()
+
+    @pytest.mark.parametrize('engine', available_engines())
+    def test_loaded_game_continues(self, engine: str) -> None:
+        game = GameLogic(ADVANCED, rng=2)
+        play(game)
+        loaded = get_engine(engine).loads(game.dumps())
+        for coordinate, cell in game.field.items():
+            # the first open of the flagged cell removes its flag
+            while not cell.has_mine and not cell.is_open:
+                assert (dict(loaded.open_cell(*coordinate))
+                        == dict(game.open_cell(*coordinate)))
+        assert loaded.is_game_finished and loaded.is_player_win
+        assert state_of(loaded) == state_of(game)
+
+    def test_not_started_game(self) -> None:
+        game = GameLogic(ADVANCED)
+        loaded = GameLogic.loads(game.dumps())
+        assert state_of(loaded) == state_of(game)
+        loaded.open_cell(0, 0)
+        assert not loaded.field[(0, 0)].has_mine
+
+    def test_save_and_load_file(self, tmp_path) -> None:
+        path = tmp_path / 'game.save'
+        game = GameLogic(ADVANCED, rng=3)
+        play(game)
+        game.save(path)
+        assert path.read_bytes() == game.dumps()
+        assert state_of(GameLogic.load(path)) == state_of(game)
+
+    def test_load_incorrect_file(self, tmp_path) -> None:
+        path = tmp_path / 'game.save'
+        path.write_bytes(b'')
+        with pytest.raises(IncorrectSaveException):
+            GameLogic.load(path)
+
+    def test_big_game_is_saved_and_loaded_fast(self, tmp_path) -> None:
+        path = tmp_path / 'game.save'
+        game = GameLogic(Configuration(1000, 1000, 150_000), rng=4)
+        game.open_cell(500, 500)
+        start = time.perf_counter()
+        game.save(path)
+        loaded = GameLogic.load(path)
+        assert time.perf_counter() - start < 1
+        assert loaded.dumps() == game.dumps()
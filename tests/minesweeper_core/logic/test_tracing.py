@@ -0,0 +1,15 @@
+import logging
+
+from minesweeper_core.logic.tracing import get_trace
+
+
+class TestTracing:
+    def test_get_trace_disabled(self) -> None:
+        logger = logging.getLogger('tests.tracing.disabled')
+        logger.setLevel(logging.INFO)
+        assert get_trace(logger) is None
+
+    def test_get_trace_enabled(self) -> None:
+        logger = logging.getLogger('tests.tracing.enabled')
+        logger.setLevel(logging.DEBUG)
+        assert get_trace(logger) == logger.debug
@@ -1,3 +1,5 @@
+import logging
+
 import minesweeper_core.logic.utils as utils
 from minesweeper_core.data.cell import Cell
 
@@ -91,3 +93,18 @@ class TestUtilFunctions:
     def test_get_neighbour_coordinates_1_1_4_4_eq_8(self) -> None:
         neighbours_1_1_4_4 = utils.get_neighbour_coordinates((1, 1), 4, 4)
         assert len(neighbours_1_1_4_4) == 8
+
+    def test_get_neighbour_coordinates_outside_of_field(self) -> None:
+        assert utils.get_neighbour_coordinates((-1, 0), 4, 4) == {
+            (0, 0), (0, 1)}
+        assert utils.get_neighbour_coordinates((0, -1), 4, 4) == {
+            (0, 0), (1, 0)}
+        assert utils.get_neighbour_coordinates((4, 4), 4, 4) == {(3, 3)}
+        assert utils.get_neighbour_coordinates((10, 10), 4, 4) == set()
+
+    def test_get_neighbour_coordinates_is_traced(self, caplog) -> None:
+        with caplog.at_level(logging.DEBUG, logger=utils.log.name):
+            utils.get_neighbour_coordinates((0, 0), 4, 4)
+        assert caplog.messages == [
+            'get_neighbour_coordinates. current: (0, 0)',
+            'get_neighbour_coordinates. filtered: 5, result num: 3']